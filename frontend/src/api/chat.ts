@@ -12,7 +12,7 @@ export const chatApi = {
 
   getHistory: (chatId: string, cursor?: string, limit = 50) =>
     api.get<MessageHistoryResponse>(`/api/v1/chat/${chatId}`, {
-      params: { ...(cursor ? { cursor } : {}), limit },
+      params: { ...(cursor ? { cursor } : {}), limit, around_last_read: false },
     }),
 
   sendMessage: (chatId: string, content: string) =>
@@ -0,0 +1,19 @@
+from functools import wraps
+
+from fastapi import HTTPException, status
+
+from core.chat.exceptions import ChatImportDoesNotExistException
+
+
+def handle_chat_exceptions(func):
+    @wraps(func)
+    async def wrapped(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except ChatImportDoesNotExistException as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            ) from e
+
+    return wrapped
@@ -1,22 +1,37 @@
+import contextlib
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Form, Path, Query, UploadFile, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
 
+from api.chat.decorators import handle_chat_exceptions
 from api.chat.schemas import (
+    ChatClientEventSchema,
     ChatCreationSchema,
+    ChatImportStartedSchema,
+    ChatImportStatusSchema,
     ChatPageSchema,
     ChatSchema,
+    ChatSyncSchema,
+    MessageBatchCreationSchema,
     MessageCreationSchema,
+    MessageForwardSchema,
     MessageHistorySchema,
     MessageSchema,
+    MessageSearchSchema,
     MessageUpdateSchema,
 )
 from core.auth.entities import CurrentUserDTO
+from core.auth.exceptions import InvalidTokenException
+from core.auth.services import AuthService, get_auth_service
 from core.chat.entities import ChatCreationDTO, MessageCreationDTO
-from core.chat.enums import MessageTypeEnum
-from core.chat.services import ChatService, get_chat_service
+from core.chat.enums import ChatClientEventTypeEnum, MessageTypeEnum
+from core.chat.services import ChatImportService, ChatService, get_chat_import_service, get_chat_service
+from core.exceptions import PermissionDeniedException
 from dependencies import get_current_user
+from infrastructure.realtime.manager import connection_manager
+from infrastructure.realtime.publisher import user_channel
 
 
 chat_router = APIRouter(
@@ -47,10 +62,62 @@ async def create_chat(
 async def get_user_chats(
     limit: int = Query(20, ge=1, le=50),
     cursor: datetime | None = Query(None),
+    prefetch_messages: int = Query(0, ge=0, le=50),
+    prefetch_chats: int = Query(5, ge=1, le=20),
     current_user: CurrentUserDTO = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service)
 ):
-    return await service.get_user_chats(current_user.id, current_user.id, limit, cursor)
+    return await service.get_user_chats(
+        current_user.id,
+        current_user.id,
+        limit,
+        cursor,
+        prefetch_messages,
+        prefetch_chats
+    )
+
+
+@chat_router.get(
+    "/sync",
+    status_code=200,
+    response_model=ChatSyncSchema
+)
+async def sync_chats(
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    return await service.sync(current_user.id, since, limit)
+
+
+@chat_router.post(
+    "/import",
+    status_code=202,
+    response_model=ChatImportStartedSchema
+)
+async def import_chat_history(
+    file: UploadFile = File(...),
+    own_sender_id: str = Form(..., min_length=1),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatImportService = Depends(get_chat_import_service)
+):
+    task_id = await service.start_import(current_user.id, file.file, own_sender_id)
+    return ChatImportStartedSchema(task_id=task_id)
+
+
+@chat_router.get(
+    "/import/{task_id}",
+    status_code=200,
+    response_model=ChatImportStatusSchema
+)
+@handle_chat_exceptions
+async def get_import_status(
+    task_id: str,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatImportService = Depends(get_chat_import_service)
+):
+    return await service.get_import_status(task_id, current_user.id)
 
 
 @chat_router.post(
@@ -72,6 +139,41 @@ async def send_message(
     return await service.send_message(dto)
 
 
+@chat_router.post(
+    "/message/batch",
+    status_code=201,
+    response_model=list[MessageSchema]
+)
+async def send_messages(
+    batch: MessageBatchCreationSchema,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    dtos = [
+        MessageCreationDTO(
+            **message_data.model_dump(),
+            sender_id=current_user.id,
+            type=MessageTypeEnum.USER
+        )
+        for message_data in batch.messages
+    ]
+
+    return await service.send_messages(current_user.id, dtos)
+
+
+@chat_router.post(
+    "/message/forward",
+    status_code=201,
+    response_model=list[MessageSchema]
+)
+async def forward_messages(
+    forward_data: MessageForwardSchema,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    return await service.forward_messages(current_user.id, forward_data.message_ids, forward_data.chat_ids)
+
+
 @chat_router.patch(
     "/message/{message_id}",
     status_code=204
@@ -94,7 +196,7 @@ async def delete_message_for_me(
     current_user: CurrentUserDTO = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service)
 ):
-    await service.delete_message_for_me(message_id)
+    await service.delete_message_for_me(message_id, current_user.id)
 
 
 @chat_router.delete(
@@ -109,6 +211,80 @@ async def delete_message_for_all(
     await service.delete_message_for_all(message_id)
 
 
+@chat_router.put(
+    "/message/{message_id}/reactions/{emoji}",
+    status_code=204
+)
+async def add_reaction(
+    message_id: UUID,
+    emoji: str = Path(min_length=1, max_length=32),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    await service.add_reaction(message_id, current_user.id, emoji)
+
+
+@chat_router.delete(
+    "/message/{message_id}/reactions/{emoji}",
+    status_code=204
+)
+async def remove_reaction(
+    message_id: UUID,
+    emoji: str = Path(min_length=1, max_length=32),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    await service.remove_reaction(message_id, current_user.id, emoji)
+
+
+@chat_router.patch(
+    "/read",
+    status_code=204
+)
+async def mark_all_as_read(
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    await service.mark_all_as_read(current_user.id)
+
+
+@chat_router.websocket("/ws")
+async def chat_events(
+    websocket: WebSocket,
+    token: str = Query(),
+    auth_service: AuthService = Depends(get_auth_service),
+    service: ChatService = Depends(get_chat_service)
+):
+    await websocket.accept()
+    try:
+        payload = auth_service.verify_token(token, "access")
+    except InvalidTokenException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid token")
+        return
+    user_id = payload.get("sub")
+
+    connection = await connection_manager.connect(websocket, [user_channel(user_id)])
+    try:
+        while True:
+            message = await websocket.receive_text()
+            if message == "ping":
+                connection.enqueue("pong")
+                continue
+
+            try:
+                event = ChatClientEventSchema.model_validate_json(message)
+            except ValidationError:
+                continue
+
+            if event.type == ChatClientEventTypeEnum.TYPING:
+                with contextlib.suppress(PermissionDeniedException):
+                    await service.set_typing(event.chat_id, UUID(user_id))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await connection_manager.disconnect(connection)
+
+
 @chat_router.get(
     "/{chat_id}",
     status_code=200,
@@ -118,10 +294,37 @@ async def get_chat_history(
     chat_id: UUID,
     limit: int = Query(50, ge=1, le=100),
     cursor: datetime | None = Query(None),
+    after: datetime | None = Query(None),
+    anchor: UUID | None = Query(None),
+    around_last_read: bool = Query(True),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ChatService = Depends(get_chat_service)
+):
+    return await service.get_chat_history(
+        chat_id,
+        current_user.id,
+        limit,
+        cursor,
+        after,
+        anchor,
+        around_last_read
+    )
+
+
+@chat_router.get(
+    "/{chat_id}/search",
+    status_code=200,
+    response_model=MessageSearchSchema
+)
+async def search_messages(
+    chat_id: UUID,
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: datetime | None = Query(None),
     current_user: CurrentUserDTO = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service)
 ):
-    return await service.get_chat_history(chat_id, current_user.id, limit, cursor)
+    return await service.search_messages(chat_id, current_user.id, q, limit, cursor)
 
 
 @chat_router.patch(
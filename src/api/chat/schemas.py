@@ -1,9 +1,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from core.chat.enums import MessageTypeEnum
+from core.chat.enums import ChatClientEventTypeEnum, MessageTypeEnum
 
 
 class MessageSenderSchema(BaseModel):
@@ -19,6 +19,21 @@ class MessageCreationSchema(BaseModel):
     content: str
 
 
+class MessageBatchCreationSchema(BaseModel):
+    messages: list[MessageCreationSchema] = Field(min_length=1, max_length=100)
+
+
+class MessageForwardSchema(BaseModel):
+    message_ids: list[UUID] = Field(min_length=1, max_length=100)
+    chat_ids: list[UUID] = Field(min_length=1, max_length=20)
+
+
+class MessageReactionSchema(BaseModel):
+    emoji: str
+    count: int
+    is_mine: bool
+
+
 class MessageSchema(BaseModel):
     id: UUID
     sender: MessageSenderSchema | None
@@ -28,6 +43,7 @@ class MessageSchema(BaseModel):
     is_deleted: bool
     created_at: datetime
     edited_at: datetime | None
+    reactions: list[MessageReactionSchema] = []
 
 
 class ChatSchema(BaseModel):
@@ -39,6 +55,36 @@ class ChatSchema(BaseModel):
     avatar_url: str | None
     unread_count: int
     created_at: datetime
+    recent_messages: list[MessageSchema] = []
+
+
+class MessageChangeSchema(BaseModel):
+    change_seq: int
+    chat_id: UUID
+    message: MessageSchema
+
+
+class MessageTombstoneSchema(BaseModel):
+    change_seq: int
+    chat_id: UUID
+    message_id: UUID
+
+
+class ChatReadStateSchema(BaseModel):
+    change_seq: int
+    chat_id: UUID
+    last_read_message_id: UUID | None
+    unread_count: int
+    is_mark_unread: bool
+
+
+class ChatSyncSchema(BaseModel):
+    chats: list[ChatSchema]
+    messages: list[MessageChangeSchema]
+    deleted_messages: list[MessageTombstoneSchema]
+    read_states: list[ChatReadStateSchema]
+    watermark: int
+    has_more: bool
 
 
 class ChatInfoSchema(BaseModel):
@@ -55,6 +101,19 @@ class MessageHistorySchema(BaseModel):
     last_read_message_id: UUID | None
     has_next: bool
     next_cursor: datetime | None
+    has_prev: bool
+    prev_cursor: datetime | None
+
+
+class MessageSearchHitSchema(BaseModel):
+    message: MessageSchema
+    snippet: str
+
+
+class MessageSearchSchema(BaseModel):
+    results: list[MessageSearchHitSchema]
+    has_next: bool
+    next_cursor: datetime | None
 
 
 class ChatCreationSchema(BaseModel):
@@ -71,3 +130,27 @@ class ChatPageSchema(BaseModel):
 
 class MessageUpdateSchema(BaseModel):
     content: str
+
+
+class ChatClientEventSchema(BaseModel):
+    type: ChatClientEventTypeEnum
+    chat_id: UUID
+
+
+class ChatImportStartedSchema(BaseModel):
+    task_id: str
+
+
+class ChatImportProgressSchema(BaseModel):
+    bytes_read: int
+    total_bytes: int
+    imported_messages: int
+    skipped_messages: int
+    chat_id: UUID | None
+
+
+class ChatImportStatusSchema(BaseModel):
+    task_id: str
+    state: str
+    progress: ChatImportProgressSchema | None
+    error: str | None
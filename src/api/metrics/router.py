@@ -0,0 +1,51 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+
+from api.metrics.schemas import ActiveUsersMetricsSchema, MembershipCacheMetricsSchema, RedisPoolMetricsSchema
+from core.auth.entities import CurrentUserDTO
+from core.presense.services import PresenseService, get_presense_service
+from dependencies import get_current_user
+from infrastructure.chat.membership import membership_cache
+from infrastructure.redis_pool.pools import redis_pools
+
+
+metrics_router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"]
+)
+
+
+@metrics_router.get(
+    "/chat-membership-cache",
+    status_code=200,
+    response_model=MembershipCacheMetricsSchema
+)
+async def get_chat_membership_cache_metrics(
+    current_user: CurrentUserDTO = Depends(get_current_user)
+):
+    return membership_cache.stats()
+
+
+@metrics_router.get(
+    "/redis-pools",
+    status_code=200,
+    response_model=list[RedisPoolMetricsSchema]
+)
+async def get_redis_pool_metrics(
+    current_user: CurrentUserDTO = Depends(get_current_user)
+):
+    return redis_pools.stats()
+
+
+@metrics_router.get(
+    "/active-users",
+    status_code=200,
+    response_model=ActiveUsersMetricsSchema
+)
+async def get_active_users_metrics(
+    day: date | None = Query(None),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    presense_service: PresenseService = Depends(get_presense_service)
+):
+    return await presense_service.get_active_users(day)
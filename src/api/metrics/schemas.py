@@ -0,0 +1,28 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class MembershipCacheMetricsSchema(BaseModel):
+    local_hits: int
+    redis_hits: int
+    misses: int
+    invalidations: int
+    local_size: int
+
+
+class RedisPoolMetricsSchema(BaseModel):
+    name: str
+    db: int
+    in_use: int
+    idle: int
+    waiting: int
+    created: int
+    max_connections: int
+
+
+class ActiveUsersMetricsSchema(BaseModel):
+    day: date
+    daily: int
+    weekly: int
+    monthly: int
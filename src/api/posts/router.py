@@ -13,6 +13,7 @@ from api.posts.schemas import (
     PostReadSchema,
 )
 from core.auth.entities import CurrentUserDTO
+from core.feed.services import FeedService, get_feed_service
 from core.posts.entities import CommentCreationDTO, PostCreationDTO, UploadImageDTO
 from core.posts.services.comment import CommentService, get_comment_service
 from core.posts.services.post import PostService, get_post_service
@@ -76,6 +77,20 @@ async def get_current_user_posts(
     return result
 
 
+@posts_router.get(
+    "/feed",
+    status_code=200,
+    response_model=PostPageSchema
+)
+async def get_home_feed(
+    limit: int = Query(25, ge=1, le=50),
+    cursor: datetime | None = Query(None),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: FeedService = Depends(get_feed_service)
+):
+    return await service.get_feed(current_user.id, cursor, limit)
+
+
 @posts_router.get(
     "/user/{profile_id}",
     status_code=200,
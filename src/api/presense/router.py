@@ -1,7 +1,18 @@
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from pydantic_core import to_json
 
+from api.presense.schemas import OnlineCountSchema, PresenseClientEventSchema, PresenseSchema
+from core.auth.entities import CurrentUserDTO
 from core.auth.services import AuthService, get_auth_service
+from core.presense.enums import PresenseClientEventTypeEnum
 from core.presense.services import PresenseService, get_presense_service
+from dependencies import get_current_user
+from infrastructure.realtime.manager import connection_manager
+from infrastructure.realtime.publisher import presense_channel
+from settings import settings
 
 
 presense_router = APIRouter(
@@ -10,6 +21,45 @@ presense_router = APIRouter(
 )
 
 
+@presense_router.get(
+    "/",
+    status_code=200,
+    response_model=list[PresenseSchema]
+)
+async def get_presense_many(
+    user_ids: list[UUID] = Query(..., min_length=1, max_length=500),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    presense_service: PresenseService = Depends(get_presense_service)
+):
+    return await presense_service.get_presense_many(user_ids)
+
+
+@presense_router.get(
+    "/online-count",
+    status_code=200,
+    response_model=OnlineCountSchema
+)
+async def count_online(
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    presense_service: PresenseService = Depends(get_presense_service)
+):
+    return OnlineCountSchema(online=await presense_service.count_online())
+
+
+@presense_router.get(
+    "/recently-offline",
+    status_code=200,
+    response_model=list[PresenseSchema]
+)
+async def get_recently_offline(
+    user_ids: list[UUID] = Query(..., min_length=1, max_length=500),
+    within: int = Query(60, ge=1, le=24 * 60 * 60),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    presense_service: PresenseService = Depends(get_presense_service)
+):
+    return await presense_service.get_recently_offline(user_ids, within)
+
+
 @presense_router.websocket("/ws")
 async def get_presense_status(
     websocket: WebSocket,
@@ -24,11 +74,31 @@ async def get_presense_status(
         return
     user_id = payload.get("sub")
 
+    connection = await connection_manager.connect(websocket, [])
     try:
         while True:
             message = await websocket.receive_text()
             if message == "ping":
                 await presense_service.set_online(user_id)
-                await websocket.send_text("pong")
+                connection.enqueue("pong")
+                continue
+
+            try:
+                event = PresenseClientEventSchema.model_validate_json(message)
+            except ValidationError:
+                continue
+
+            channels = [presense_channel(subscribed_user_id) for subscribed_user_id in event.user_ids]
+            if event.type == PresenseClientEventTypeEnum.UNSUBSCRIBE:
+                await connection_manager.remove_channels(connection, channels)
+                continue
+
+            if len(connection.channels | set(channels)) > settings.realtime.max_presense_subscriptions:
+                continue
+            await connection_manager.add_channels(connection, channels)
+            for presense in await presense_service.get_presense_many(event.user_ids):
+                connection.enqueue(to_json(presense).decode("utf-8"))
     except WebSocketDisconnect:
         await presense_service.set_offline(user_id)
+    finally:
+        await connection_manager.disconnect(connection)
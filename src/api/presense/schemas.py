@@ -0,0 +1,21 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from core.presense.enums import PresenseClientEventTypeEnum
+
+
+class PresenseSchema(BaseModel):
+    user_id: UUID
+    is_online: bool
+    last_seen: datetime | None
+
+
+class PresenseClientEventSchema(BaseModel):
+    type: PresenseClientEventTypeEnum
+    user_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class OnlineCountSchema(BaseModel):
+    online: int
@@ -2,7 +2,11 @@ from functools import wraps
 
 from fastapi import HTTPException, status
 
-from core.profile.exceptions import ProfileAlreadyExistsException, ProfileDoesNotExistException
+from core.profile.exceptions import (
+    InvalidFollowException,
+    ProfileAlreadyExistsException,
+    ProfileDoesNotExistException,
+)
 
 
 def handle_profile_exceptions(func):
@@ -10,7 +14,7 @@ def handle_profile_exceptions(func):
     async def wrapped(*args, **kwargs):
         try:
             return await func(*args, **kwargs)
-        except (ProfileAlreadyExistsException, ValueError) as e:
+        except (ProfileAlreadyExistsException, InvalidFollowException, ValueError) as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
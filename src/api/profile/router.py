@@ -1,9 +1,11 @@
 from dataclasses import asdict
+from datetime import datetime
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 
 from api.profile.decorators import handle_profile_exceptions
-from api.profile.schemas import ProfileCreationSchema, ProfileSchema, ProfileUpdateSchema
+from api.profile.schemas import FollowsPageSchema, ProfileCreationSchema, ProfileSchema, ProfileUpdateSchema
 from core.auth.entities import CurrentUserDTO
 from core.profile.entities import ProfileCreationDTO, ProfileUpdateDTO
 from core.profile.services import ProfileService, get_profile_service
@@ -98,6 +100,66 @@ async def upload_avatar(
     )
 
 
+@profile_router.post(
+    "/{profile_id}/follow",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+@handle_profile_exceptions
+async def follow_profile(
+    profile_id: UUID,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ProfileService = Depends(get_profile_service)
+):
+    await service.follow(profile_id, current_user)
+
+
+@profile_router.delete(
+    "/{profile_id}/follow",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+@handle_profile_exceptions
+async def unfollow_profile(
+    profile_id: UUID,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ProfileService = Depends(get_profile_service)
+):
+    await service.unfollow(profile_id, current_user)
+
+
+@profile_router.get(
+    "/{profile_id}/followers",
+    status_code=status.HTTP_200_OK,
+    response_model=FollowsPageSchema
+)
+@handle_profile_exceptions
+async def get_followers(
+    profile_id: UUID,
+    limit: int = Query(25, ge=1, le=50),
+    cursor: datetime | None = Query(None),
+    cursor_id: UUID | None = Query(None),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ProfileService = Depends(get_profile_service)
+):
+    return await service.get_followers(profile_id, cursor, cursor_id, limit)
+
+
+@profile_router.get(
+    "/{profile_id}/following",
+    status_code=status.HTTP_200_OK,
+    response_model=FollowsPageSchema
+)
+@handle_profile_exceptions
+async def get_following(
+    profile_id: UUID,
+    limit: int = Query(25, ge=1, le=50),
+    cursor: datetime | None = Query(None),
+    cursor_id: UUID | None = Query(None),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    service: ProfileService = Depends(get_profile_service)
+):
+    return await service.get_following(profile_id, cursor, cursor_id, limit)
+
+
 @profile_router.get(
     "/{username}",
     status_code=status.HTTP_200_OK,
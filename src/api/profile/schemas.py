@@ -24,6 +24,7 @@ class ProfileSchema(BaseModel):
     avatar_url: str | None
     status: str | None
     last_seen: datetime
+    followers_count: int = 0
 
 
 class ProfileUpdateSchema(BaseModel):
@@ -32,3 +33,10 @@ class ProfileUpdateSchema(BaseModel):
     birth_date: date | None = None
     gender: GenderEnum | None = None
     status: str | None = None
+
+
+class FollowsPageSchema(BaseModel):
+    profiles: list[ProfileSchema]
+    next_cursor: datetime | None
+    next_cursor_id: UUID | None
+    has_next: bool
@@ -0,0 +1,137 @@
+"""Compare per-chat full-text message search against the ILIKE scan clients effectively fall back to.
+
+Seeds a synthetic dataset (10M messages by default, spread over --chats chats), then times both
+queries scoped to one chat. Run from the app root against a local database:
+
+    python -m benchmarks.chat_search --messages 10000000 --chats 1000 --queries 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import select, text
+
+from benchmarks.chat_send import cleanup, seed_chat
+from core.chat.services import get_message_partition_service
+from infrastructure.database.database import Session, engine
+from infrastructure.database.models.chat import MessageModel
+from infrastructure.database.repositories.chat import ChatRepository
+
+
+WORDS = (
+    "привет", "встреча", "проект", "отчёт", "завтра", "сегодня", "договор", "оплата", "релиз", "ошибка",
+    "hello", "meeting", "project", "report", "tomorrow", "today", "contract", "payment", "release", "error",
+    "deploy", "database", "server", "design", "review", "ticket", "coffee", "weekend", "photo", "link"
+)
+
+SEED_MESSAGES = text(
+    """
+    INSERT INTO messages (id, chat_id, sender_id, type, content, is_edited, is_deleted, created_at)
+    SELECT
+        gen_random_uuid(),
+        (CAST(:chat_ids AS uuid[]))[1 + i % :chats],
+        CAST(:sender_id AS uuid),
+        'USER',
+        (
+            SELECT string_agg((CAST(:words AS text[]))[1 + (i * 7919 + k * 104729) % :word_count], ' ')
+            FROM generate_series(1, 12) AS k
+        ),
+        false,
+        false,
+        now() - i * interval '1 second'
+    FROM generate_series(:start, :stop) AS i
+    """
+)
+
+
+async def seed_messages(chat_ids: list[UUID], sender_id: UUID, messages: int, batch_size: int) -> None:
+    for start in range(0, messages, batch_size):
+        async with Session() as session:
+            await session.execute(
+                SEED_MESSAGES,
+                {
+                    "chat_ids": [str(chat_id) for chat_id in chat_ids],
+                    "chats": len(chat_ids),
+                    "sender_id": str(sender_id),
+                    "words": list(WORDS),
+                    "word_count": len(WORDS),
+                    "start": start,
+                    "stop": min(start + batch_size, messages) - 1
+                }
+            )
+            await session.commit()
+        print(f"seeded {min(start + batch_size, messages):>10} / {messages}", end="\r")
+    print()
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE messages"))
+
+
+async def search_full_text(chat_id: UUID, user_id: UUID, query: str) -> None:
+    async with Session() as session:
+        await ChatRepository(session).search_messages(chat_id, user_id, query)
+
+
+async def search_ilike(chat_id: UUID, user_id: UUID, query: str) -> None:
+    async with Session() as session:
+        await session.execute(
+            select(MessageModel.id)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.content.ilike(f"%{query}%")
+            )
+            .order_by(MessageModel.created_at.desc())
+            .limit(20)
+        )
+
+
+async def run_path(
+    search: Callable[[UUID, UUID, str], Awaitable[None]],
+    chat_ids: list[UUID],
+    user_id: UUID,
+    queries: int
+) -> list[float]:
+    latencies = []
+    for index in range(queries):
+        started = time.perf_counter()
+        await search(chat_ids[index * 7 % len(chat_ids)], user_id, WORDS[index % len(WORDS)])
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<12} p50={quantiles[49] * 1000:8.2f} ms  p99={quantiles[98] * 1000:8.2f} ms")
+
+
+async def main(messages: int, chats: int, queries: int, batch_size: int) -> None:
+    seeded = [await seed_chat(2) for _ in range(chats)]
+    chat_ids = [chat_id for chat_id, _ in seeded]
+    user_id = seeded[0][1][0]
+    try:
+        now = datetime.now(UTC)
+        await get_message_partition_service().ensure_partitions_between(now - timedelta(seconds=messages), now)
+        await seed_messages(chat_ids, user_id, messages, batch_size)
+
+        for name, search in (("ilike", search_ilike), ("full-text", search_full_text)):
+            report(name, await run_path(search, chat_ids, user_id, queries))
+    finally:
+        for chat_id, user_ids in seeded:
+            await cleanup(chat_id, user_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=10_000_000)
+    parser.add_argument("--chats", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.messages, args.chats, args.queries, args.batch_size))
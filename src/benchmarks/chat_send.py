@@ -0,0 +1,140 @@
+"""Compare the legacy round-trip-per-step message send path with the single CTE statement.
+
+Run from the app root against a local database:
+
+    python -m benchmarks.chat_send --messages 5000 --concurrency 12
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete
+
+from core.chat.entities import ChatCreationDTO, MessageCreationDTO
+from core.chat.enums import MessageTypeEnum
+from infrastructure.database.database import Session, engine
+from infrastructure.database.models.chat import ChatModel
+from infrastructure.database.models.profile import ProfileModel
+from infrastructure.database.models.users import UserModel
+from infrastructure.database.repositories.chat import ChatRepository
+from infrastructure.database.repositories.profile import ProfileRepository
+
+
+async def seed_chat(participants: int) -> tuple[UUID, list[UUID]]:
+    async with Session() as session:
+        user_ids = []
+        for _ in range(participants):
+            user = UserModel(email=f"{uuid4().hex}@bench.local", password="x", is_email_confirmed=True)
+            session.add(user)
+            await session.flush()
+            session.add(ProfileModel(
+                id=user.id,
+                username=user.id.hex[:32],
+                first_name="Bench",
+                last_name="User",
+                birth_date=date(2000, 1, 1),
+                gender="Male"
+            ))
+            user_ids.append(user.id)
+        await session.flush()
+
+        chat = await ChatRepository(session).create_chat(
+            ChatCreationDTO(is_group=True, name="bench", users_ids=tuple(user_ids), creator_id=user_ids[0])
+        )
+        await session.commit()
+
+    return chat.id, user_ids
+
+
+async def cleanup(chat_id: UUID, user_ids: list[UUID]) -> None:
+    async with Session() as session:
+        await session.execute(delete(ChatModel).where(ChatModel.id == chat_id))
+        await session.execute(delete(UserModel).where(UserModel.id.in_(user_ids)))
+        await session.commit()
+
+
+async def send_legacy(message_data: MessageCreationDTO) -> None:
+    async with Session() as session:
+        chat_repo = ChatRepository(session)
+        profile_repo = ProfileRepository(session)
+
+        await chat_repo.check_user_is_participant(message_data.chat_id, message_data.sender_id)
+        message = await chat_repo.create_message(message_data)
+        await profile_repo.get_by_user_id(message_data.sender_id)
+        await chat_repo.update_chat_last_message(message.chat_id, message.id)
+        await chat_repo.increment_unread_count(message.chat_id, message_data.sender_id)
+        await chat_repo.mark_as_read(message_data.chat_id, message_data.sender_id, message.id)
+        await session.commit()
+
+
+async def send_single_statement(message_data: MessageCreationDTO) -> None:
+    async with Session() as session:
+        await ChatRepository(session).send_message(message_data)
+        await session.commit()
+
+
+async def run_path(
+    send: Callable[[MessageCreationDTO], Awaitable[None]],
+    chat_id: UUID,
+    user_ids: list[UUID],
+    messages: int,
+    concurrency: int
+) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(messages):
+        queue.put_nowait(index)
+
+    async def worker() -> None:
+        while not queue.empty():
+            index = queue.get_nowait()
+            dto = MessageCreationDTO(
+                sender_id=user_ids[index % len(user_ids)],
+                chat_id=chat_id,
+                content=f"benchmark message {index}",
+                type=MessageTypeEnum.USER
+            )
+            started = time.perf_counter()
+            await send(dto)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<18} "
+        f"p50={quantiles[49] * 1000:8.2f} ms  "
+        f"p99={quantiles[98] * 1000:8.2f} ms  "
+        f"throughput={len(latencies) / elapsed:9.1f} msg/s"
+    )
+
+
+async def main(messages: int, concurrency: int, participants: int) -> None:
+    chat_id, user_ids = await seed_chat(participants)
+    try:
+        await run_path(send_single_statement, chat_id, user_ids, min(messages, 200), concurrency)
+
+        for name, send in (("legacy (6 trips)", send_legacy), ("single statement", send_single_statement)):
+            latencies, elapsed = await run_path(send, chat_id, user_ids, messages, concurrency)
+            report(name, latencies, elapsed)
+    finally:
+        await cleanup(chat_id, user_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--participants", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.messages, args.concurrency, args.participants))
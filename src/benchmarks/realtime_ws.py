@@ -0,0 +1,384 @@
+"""Load-test the realtime WebSocket endpoints with tens of thousands of authenticated clients.
+
+For every worker count in --workers the harness starts that many app processes on consecutive ports
+(each one is a single uvicorn worker with an event-loop lag sampler running next to the app), spreads
+--connections clients over them from --client-processes load generator processes (each ramping up
+at --ramp-rate connections per second), holds the load for
+--duration seconds and reports per worker: resident memory per connection, event-loop lag and the
+ping round-trip time seen by clients. Clients ping every --ping-interval seconds like the web client
+does. Every --message-interval seconds a presense client resubscribes to --subscriptions random
+contacts, and a chat client sends a typing event followed by a message to its chat, so fan-out runs
+through Redis as in production. For the chat endpoint the harness seeds real users into chats of
+--chat-size members first and removes them afterwards.
+
+Run from the app root against local Redis and Postgres (raise `ulimit -n` first):
+
+    python -m benchmarks.realtime_ws --connections 20000 --workers 1 2 4 --duration 120
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import signal
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import httpx
+import uvicorn
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import WebSocketException
+
+from benchmarks.chat_send import cleanup, seed_chat
+from core.auth.services import AuthService
+
+
+ENDPOINTS = {
+    "presense": "/api/v1/presense/ws",
+    "chat": "/api/v1/chat/ws"
+}
+
+
+@dataclass
+class ClientStats:
+    connected: int = 0
+    failed: int = 0
+    events: int = 0
+    messages: int = 0
+    round_trips: list[float] = field(default_factory=list)
+    loop_lag: list[float] = field(default_factory=list)
+
+
+def raise_fd_limit() -> None:
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def read_rss(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def quantile(values: list[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+async def sample_loop_lag(samples: list[float], interval: float) -> None:
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - started - interval)
+
+
+async def serve(port: int, lag_interval: float) -> None:
+    raise_fd_limit()
+    lag: list[float] = []
+    sampler = asyncio.create_task(sample_loop_lag(lag, lag_interval))
+    server = uvicorn.Server(uvicorn.Config("main:app", port=port, log_level="warning", backlog=4096))
+    await server.serve()
+    sampler.cancel()
+
+    print(json.dumps({
+        "lag_p50": quantile(lag, 50),
+        "lag_p99": quantile(lag, 99),
+        "lag_max": max(lag, default=0.0),
+        "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    }), flush=True)
+
+
+async def read_frames(websocket: ClientConnection, pongs: asyncio.Queue[float], stats: ClientStats) -> None:
+    async for frame in websocket:
+        if frame == "pong":
+            pongs.put_nowait(time.perf_counter())
+        else:
+            stats.events += 1
+
+
+async def ping_loop(
+    websocket: ClientConnection,
+    pongs: asyncio.Queue[float],
+    deadline: float,
+    stats: ClientStats,
+    args: argparse.Namespace
+) -> None:
+    await asyncio.sleep(random.uniform(0, args.ping_interval))
+    while time.monotonic() < deadline:
+        sent = time.perf_counter()
+        await websocket.send("ping")
+        stats.round_trips.append(await asyncio.wait_for(pongs.get(), 30) - sent)
+        await asyncio.sleep(args.ping_interval * random.uniform(0.9, 1.1))
+
+
+async def message_loop(
+    websocket: ClientConnection,
+    http: httpx.AsyncClient,
+    token: str,
+    chat_id: str | None,
+    user_ids: list[str],
+    deadline: float,
+    stats: ClientStats,
+    args: argparse.Namespace
+) -> None:
+    await asyncio.sleep(random.uniform(0, args.message_interval))
+    while time.monotonic() < deadline:
+        if args.endpoint == "presense":
+            if args.subscriptions:
+                await websocket.send(json.dumps({
+                    "type": "subscribe",
+                    "user_ids": random.sample(user_ids, min(args.subscriptions, len(user_ids)))
+                }))
+        else:
+            await websocket.send(json.dumps({"type": "typing", "chat_id": chat_id}))
+            response = await http.post(
+                "/api/v1/chat/message",
+                json={"chat_id": chat_id, "content": f"bench {time.time()}"},
+                headers={"Authorization": token}
+            )
+            response.raise_for_status()
+            stats.messages += 1
+        await asyncio.sleep(args.message_interval * random.uniform(0.9, 1.1))
+
+
+async def run_client(
+    url: str,
+    http: httpx.AsyncClient,
+    user_id: str,
+    chat_id: str | None,
+    user_ids: list[str],
+    deadline: float,
+    stats: ClientStats,
+    args: argparse.Namespace
+) -> None:
+    token = AuthService.create_token({"sub": user_id, "type": "access"}, timedelta(hours=1))
+    try:
+        websocket = await connect(f"{url}?token={token}", open_timeout=30, ping_interval=None)
+    except (OSError, TimeoutError, WebSocketException):
+        stats.failed += 1
+        return
+
+    stats.connected += 1
+    pongs: asyncio.Queue[float] = asyncio.Queue()
+    reader = asyncio.create_task(read_frames(websocket, pongs, stats))
+    try:
+        await asyncio.gather(
+            ping_loop(websocket, pongs, deadline, stats, args),
+            message_loop(websocket, http, token, chat_id, user_ids, deadline, stats, args)
+        )
+    except (OSError, TimeoutError, WebSocketException, httpx.HTTPError):
+        stats.failed += 1
+    finally:
+        reader.cancel()
+        await websocket.close()
+
+
+async def run_clients(
+    urls: list[str],
+    http_urls: list[str],
+    user_ids: list[str],
+    chat_ids: list[str] | None,
+    offset: int,
+    count: int,
+    args: argparse.Namespace
+) -> ClientStats:
+    raise_fd_limit()
+    stats = ClientStats()
+    sampler = asyncio.create_task(sample_loop_lag(stats.loop_lag, args.lag_interval))
+    ramp = count / args.ramp_rate
+    deadline = time.monotonic() + ramp + args.duration
+    limits = httpx.Limits(max_connections=args.http_connections)
+    https = [httpx.AsyncClient(base_url=http_url, limits=limits, timeout=30) for http_url in http_urls]
+
+    clients = []
+    for index in range(offset, offset + count):
+        clients.append(asyncio.create_task(run_client(
+            urls[index % len(urls)],
+            https[index % len(https)],
+            user_ids[index],
+            chat_ids[index] if chat_ids else None,
+            user_ids,
+            deadline,
+            stats,
+            args
+        )))
+        await asyncio.sleep(1 / args.ramp_rate)
+    await asyncio.gather(*clients)
+    sampler.cancel()
+    for http in https:
+        await http.aclose()
+    return stats
+
+
+def run_client_process(
+    urls: list[str],
+    http_urls: list[str],
+    user_ids: list[str],
+    chat_ids: list[str] | None,
+    offset: int,
+    count: int,
+    args: argparse.Namespace
+) -> ClientStats:
+    return asyncio.run(run_clients(urls, http_urls, user_ids, chat_ids, offset, count, args))
+
+
+async def wait_until_listening(server: asyncio.subprocess.Process, port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        if server.returncode is not None:
+            raise RuntimeError(f"worker on port {port} exited with code {server.returncode} before listening")
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError as error:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"worker on port {port} did not start listening within {timeout}s") from error
+            await asyncio.sleep(0.2)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+async def sample_rss(pids: list[int], peaks: dict[int, int]) -> None:
+    while True:
+        for pid in pids:
+            peaks[pid] = max(peaks.get(pid, 0), read_rss(pid))
+        await asyncio.sleep(1)
+
+
+async def run_round(
+    workers: int,
+    user_ids: list[str],
+    chat_ids: list[str] | None,
+    args: argparse.Namespace
+) -> dict:
+    ports = [args.port + index for index in range(workers)]
+    servers = [
+        await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "benchmarks.realtime_ws", "serve",
+            "--port", str(port), "--lag-interval", str(args.lag_interval),
+            stdout=asyncio.subprocess.PIPE
+        )
+        for port in ports
+    ]
+    try:
+        for server, port in zip(servers, ports, strict=True):
+            await wait_until_listening(server, port)
+        idle_rss = sum(read_rss(server.pid) for server in servers)
+
+        peaks: dict[int, int] = {}
+        sampler = asyncio.create_task(sample_rss([server.pid for server in servers], peaks))
+        urls = [f"ws://127.0.0.1:{port}{ENDPOINTS[args.endpoint]}" for port in ports]
+        http_urls = [f"http://127.0.0.1:{port}" for port in ports]
+        share = -(-len(user_ids) // args.client_processes)
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(args.client_processes) as executor:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor,
+                    run_client_process,
+                    urls,
+                    http_urls,
+                    user_ids,
+                    chat_ids,
+                    offset,
+                    min(share, len(user_ids) - offset),
+                    args
+                )
+                for offset in range(0, len(user_ids), share)
+            ))
+        sampler.cancel()
+    finally:
+        for server in servers:
+            if server.returncode is None:
+                server.send_signal(signal.SIGINT)
+        outputs = [await server.communicate() for server in servers]
+
+    server_stats = [json.loads(stdout.decode().strip().splitlines()[-1]) for stdout, _ in outputs]
+    connected = sum(result.connected for result in results)
+    round_trips = [rtt for result in results for rtt in result.round_trips]
+    client_lag = [lag for result in results for lag in result.loop_lag]
+    peak_rss = sum(peaks.values())
+
+    return {
+        "workers": workers,
+        "connected": connected,
+        "failed": sum(result.failed for result in results),
+        "events": sum(result.events for result in results),
+        "messages": sum(result.messages for result in results),
+        "rss_per_worker": peak_rss / workers,
+        "bytes_per_connection": (peak_rss - idle_rss) / connected if connected else 0.0,
+        "server_lag_p99": max(stats["lag_p99"] for stats in server_stats),
+        "server_lag_max": max(stats["lag_max"] for stats in server_stats),
+        "rtt_p50": quantile(round_trips, 50),
+        "rtt_p99": quantile(round_trips, 99),
+        "client_lag_p99": quantile(client_lag, 99)
+    }
+
+
+async def seed_chats(connections: int, chat_size: int) -> list[tuple[UUID, list[UUID]]]:
+    return [await seed_chat(chat_size) for _ in range(-(-connections // chat_size))]
+
+
+def report(row: dict) -> None:
+    print(
+        f"workers={row['workers']:<3} connected={row['connected']:>7} failed={row['failed']:>6} "
+        f"events={row['events']:>8} messages={row['messages']:>7}  "
+        f"rss/worker={row['rss_per_worker'] / 2 ** 20:8.1f} MiB  conn={row['bytes_per_connection'] / 1024:6.1f} KiB  "
+        f"lag p99={row['server_lag_p99'] * 1000:7.2f} ms max={row['server_lag_max'] * 1000:8.2f} ms  "
+        f"rtt p50={row['rtt_p50'] * 1000:7.2f} ms p99={row['rtt_p99'] * 1000:8.2f} ms  "
+        f"client lag p99={row['client_lag_p99'] * 1000:7.2f} ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    raise_fd_limit()
+    if args.endpoint == "presense":
+        seeded = []
+        user_ids = [str(uuid4()) for _ in range(args.connections)]
+        chat_ids = None
+    else:
+        seeded = await seed_chats(args.connections, args.chat_size)
+        members = [(str(user_id), str(chat_id)) for chat_id, chat_user_ids in seeded for user_id in chat_user_ids]
+        user_ids = [user_id for user_id, _ in members[:args.connections]]
+        chat_ids = [chat_id for _, chat_id in members[:args.connections]]
+
+    try:
+        for workers in args.workers:
+            report(await run_round(workers, user_ids, chat_ids, args))
+    finally:
+        for chat_id, chat_user_ids in seeded:
+            await cleanup(chat_id, chat_user_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", nargs="?", choices=("run", "serve"), default="run")
+    parser.add_argument("--endpoint", choices=tuple(ENDPOINTS), default="presense")
+    parser.add_argument("--connections", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--client-processes", type=int, default=max((os.cpu_count() or 2) // 2, 1))
+    parser.add_argument("--ramp-rate", type=float, default=500.0)
+    parser.add_argument("--duration", type=float, default=120.0)
+    parser.add_argument("--ping-interval", type=float, default=25.0)
+    parser.add_argument("--message-interval", type=float, default=60.0)
+    parser.add_argument("--subscriptions", type=int, default=50)
+    parser.add_argument("--chat-size", type=int, default=20)
+    parser.add_argument("--http-connections", type=int, default=100)
+    parser.add_argument("--lag-interval", type=float, default=0.05)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(serve(args.port, args.lag_interval))
+    else:
+        asyncio.run(main(args))
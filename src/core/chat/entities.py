@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
-from core.chat.enums import MessageTypeEnum
+from core.chat.enums import ChatEventTypeEnum, MessageTypeEnum
 
 
 @dataclass
@@ -30,6 +30,13 @@ class MessageCreationDTO:
     type: MessageTypeEnum
 
 
+@dataclass
+class MessageReactionDTO:
+    emoji: str
+    count: int
+    is_mine: bool
+
+
 @dataclass
 class MessageDTO:
     id: UUID
@@ -40,6 +47,21 @@ class MessageDTO:
     is_deleted: bool
     created_at: datetime
     edited_at: datetime | None
+    reactions: list[MessageReactionDTO] = field(default_factory=list)
+
+
+@dataclass
+class ArchivedMessageDTO:
+    id: UUID
+    chat_id: UUID
+    sender_id: UUID | None
+    type: MessageTypeEnum
+    content: str
+    is_edited: bool
+    is_deleted: bool
+    created_at: datetime
+    edited_at: datetime | None
+    reactions: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -52,6 +74,7 @@ class ChatDTO:
     avatar_url: str | None
     unread_count: int
     created_at: datetime
+    recent_messages: list[MessageDTO] = field(default_factory=list)
 
 
 @dataclass
@@ -70,6 +93,8 @@ class MessageHistoryDTO:
     last_read_message_id: UUID | None
     has_next: bool
     next_cursor: datetime | None
+    has_prev: bool = False
+    prev_cursor: datetime | None = None
 
 
 @dataclass
@@ -79,6 +104,79 @@ class ChatPageDTO:
     next_cursor: datetime | None
 
 
+@dataclass
+class MessageChangeDTO:
+    change_seq: int
+    chat_id: UUID
+    message: MessageDTO
+
+
+@dataclass
+class MessageTombstoneDTO:
+    change_seq: int
+    chat_id: UUID
+    message_id: UUID
+
+
+@dataclass
+class ChatReadStateDTO:
+    change_seq: int
+    chat_id: UUID
+    last_read_message_id: UUID | None
+    unread_count: int
+    is_mark_unread: bool
+
+
+@dataclass
+class ChatSyncDTO:
+    chats: list[ChatDTO]
+    messages: list[MessageChangeDTO]
+    deleted_messages: list[MessageTombstoneDTO]
+    read_states: list[ChatReadStateDTO]
+    watermark: int
+    has_more: bool
+
+
+@dataclass
+class MessageSearchHitDTO:
+    message: MessageDTO
+    snippet: str
+
+
+@dataclass
+class MessageSearchDTO:
+    results: list[MessageSearchHitDTO]
+    has_next: bool
+    next_cursor: datetime | None
+
+
 @dataclass
 class MessageUpdateDTO:
     content: str
+
+
+@dataclass
+class ChatEventDTO:
+    type: ChatEventTypeEnum
+    chat_id: UUID
+    message: MessageDTO | None = None
+    message_id: UUID | None = None
+    reactions: dict[str, int] | None = None
+    typing_user_ids: list[UUID] | None = None
+
+
+@dataclass
+class ChatImportProgressDTO:
+    bytes_read: int
+    total_bytes: int
+    imported_messages: int
+    skipped_messages: int
+    chat_id: UUID | None = None
+
+
+@dataclass
+class ChatImportStatusDTO:
+    task_id: str
+    state: str
+    progress: ChatImportProgressDTO | None = None
+    error: str | None = None
@@ -4,3 +4,15 @@ from enum import StrEnum
 class MessageTypeEnum(StrEnum):
     SYSTEM = "System"
     USER = "User"
+
+
+class ChatEventTypeEnum(StrEnum):
+    MESSAGE_CREATED = "message_created"
+    MESSAGE_EDITED = "message_edited"
+    MESSAGE_DELETED = "message_deleted"
+    REACTIONS_UPDATED = "reactions_updated"
+    TYPING = "typing"
+
+
+class ChatClientEventTypeEnum(StrEnum):
+    TYPING = "typing"
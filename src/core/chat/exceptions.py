@@ -1,2 +1,10 @@
 class InvalidParticipantsCountException(Exception):
     pass
+
+
+class InvalidChatExportException(Exception):
+    pass
+
+
+class ChatImportDoesNotExistException(Exception):
+    pass
@@ -1,31 +1,71 @@
-from datetime import datetime
-from uuid import UUID
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, BinaryIO
+from uuid import UUID, uuid4
+
+from celery.result import AsyncResult
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.chat.entities import (
+    ArchivedMessageDTO,
     ChatCreationDTO,
     ChatDTO,
+    ChatEventDTO,
+    ChatImportProgressDTO,
+    ChatImportStatusDTO,
     ChatInfoDTO,
     ChatPageDTO,
+    ChatSyncDTO,
     MessageCreationDTO,
     MessageDTO,
     MessageHistoryDTO,
+    MessageReactionDTO,
+    MessageSearchDTO,
     MessageSenderDTO,
     MessageUpdateDTO,
 )
-from core.chat.enums import MessageTypeEnum
-from core.chat.exceptions import InvalidParticipantsCountException
+from core.chat.enums import ChatEventTypeEnum, MessageTypeEnum
+from core.chat.exceptions import ChatImportDoesNotExistException, InvalidParticipantsCountException
 from core.exceptions import PermissionDeniedException
+from infrastructure.celery_app.worker import celery
+from infrastructure.chat.archive import MessageArchive
+from infrastructure.chat.imports import ImportOwnerRepository
+from infrastructure.chat.inbox import InboxRepository
+from infrastructure.chat.membership import MembershipCache, membership_cache
+from infrastructure.chat.read_receipts import ReadReceiptBuffer
+from infrastructure.chat.telegram_export import TelegramExportReader, get_message_date, get_message_text
+from infrastructure.chat.typing import TypingIndicators
+from infrastructure.database.database import AutocommitSession
 from infrastructure.database.models.chat import ChatModel, MessageModel
 from infrastructure.database.models.profile import ProfileModel
 from infrastructure.database.repositories.chat import ChatRepository
+from infrastructure.database.repositories.message_partitions import MessagePartitionRepository
 from infrastructure.database.repositories.profile import ProfileRepository
 from infrastructure.database.uow import UnitOfWork
+from infrastructure.realtime.publisher import RealtimePublisher
+from infrastructure.s3.storage import S3Storage
 from settings import settings
 
 
 class ChatService:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        publisher: RealtimePublisher,
+        inbox: InboxRepository,
+        membership: MembershipCache,
+        read_receipts: ReadReceiptBuffer,
+        archive: MessageArchive,
+        typing: TypingIndicators
+    ) -> None:
         self.uow = uow
+        self.publisher = publisher
+        self.inbox = inbox
+        self.membership = membership
+        self.read_receipts = read_receipts
+        self.archive = archive
+        self.typing = typing
 
     async def create_chat(self, data: ChatCreationDTO, creator_id: UUID) -> ChatDTO:
         async with self.uow() as session:
@@ -37,51 +77,66 @@ class ChatService:
             if not data.is_group:
                 if len(all_users) != 2:
                     raise InvalidParticipantsCountException("Only 2 participants can be in a private chat")
-                existing = await repo.get_personal_chat(all_users)
-                if existing:
-                    return self._build_chat_dto(existing, None, None, None, 0, False)
-
-            if data.is_group:
-                data.creator_id = creator_id
+                chat = await repo.get_personal_chat(all_users)
+                if chat is None:
+                    chat = await repo.create_personal_chat(all_users)
+                if chat is None:
+                    chat = await repo.get_personal_chat(all_users)
+                return self._build_chat_dto(chat, None, None, None, 0, False)
 
+            data.creator_id = creator_id
             chat = await repo.create_chat(data)
 
-            if data.is_group:
-                message_dto = MessageCreationDTO(
-                    None,
-                    chat.id,
-                    f"Пользователь {creator_id} создал беседу с названием {data.name}",
-                    MessageTypeEnum.SYSTEM
-                )
-                message = await repo.create_message(message_dto)
-                await repo.update_chat_last_message(chat.id, message.id)
+            message_dto = MessageCreationDTO(
+                None,
+                chat.id,
+                f"Пользователь {creator_id} создал беседу с названием {data.name}",
+                MessageTypeEnum.SYSTEM
+            )
+            message = await repo.create_message(message_dto)
+            await repo.update_chat_last_message(chat.id, message.id)
+            await repo.increment_unread_count(chat.id, None)
 
-            return self._build_chat_dto(chat, None, None, None, 0, False)
+        await self.membership.invalidate(chat.id)
+        await self.inbox.touch(data.users_ids, chat.id, message.created_at)
+
+        return self._build_chat_dto(chat, None, None, None, 0, False)
 
     async def get_user_chats(
         self,
         user_id: UUID,
         current_user_id: UUID,
         limit: int = 20,
-        cursor: datetime | None = None
+        cursor: datetime | None = None,
+        prefetch_messages: int = 0,
+        prefetch_chats: int = 5
     ) -> ChatPageDTO:
         async with self.uow() as session:
             repo = ChatRepository(session)
 
-            chats = await repo.get_user_chats(user_id, limit + 1, cursor)
+            chat_ids = await self.inbox.get_page(user_id, limit + 1, cursor)
+            if chat_ids is None:
+                chats = await repo.get_user_chats(user_id, limit + 1, cursor)
+                await self.inbox.fill(user_id, await repo.get_user_chat_scores(user_id))
+                await self.inbox.set_summaries(chats)
+            else:
+                chats = await self._hydrate_chats(repo, chat_ids, user_id)
+
             has_next = len(chats) > limit
             chats = chats[:limit]
             next_cursor = chats[-1].last_message.created_at if chats else None
 
-            personal_chats = {
-                chat.id: chat
-                for chat in chats
-                if not chat.is_group
-            }
-            interlocutors = await repo.get_personal_chat_interlocutors(personal_chats.keys(), current_user_id)
-            for chat_id in personal_chats:
-                personal_chats[chat_id].name = interlocutors[chat_id].full_name
-                personal_chats[chat_id].avatar_url = self._build_avatar_url(interlocutors[chat_id].avatar_key)
+            await self._apply_interlocutors(repo, chats, current_user_id)
+
+            if prefetch_messages and chats:
+                prefetched_chats = chats[:prefetch_chats]
+                recent_messages = await repo.get_recent_messages(
+                    [chat.id for chat in prefetched_chats],
+                    current_user_id,
+                    prefetch_messages
+                )
+                for chat in prefetched_chats:
+                    chat.recent_messages = recent_messages.get(chat.id, [])
 
             return ChatPageDTO(
                 chats,
@@ -89,28 +144,181 @@ class ChatService:
                 next_cursor
             )
 
+    async def sync(self, user_id: UUID, since: int, limit: int = 500) -> ChatSyncDTO:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            until = max(since, await repo.get_change_seq_bound())
+            chat_changes = await repo.get_changed_chat_ids(user_id, since, until, limit + 1)
+            messages = await repo.get_changed_messages(user_id, since, until, limit + 1)
+            deleted_messages = await repo.get_message_tombstones(user_id, since, until, limit + 1)
+            read_states = await repo.get_changed_read_states(user_id, since, until, limit + 1)
+
+            truncated_at = [
+                change_seqs[limit - 1]
+                for change_seqs in (
+                    [change_seq for _, change_seq in chat_changes],
+                    [change.change_seq for change in messages],
+                    [tombstone.change_seq for tombstone in deleted_messages],
+                    [read_state.change_seq for read_state in read_states]
+                )
+                if len(change_seqs) > limit
+            ]
+            has_more = bool(truncated_at)
+            watermark = until
+            if has_more:
+                watermark = min(truncated_at)
+                chat_changes = [
+                    (chat_id, change_seq) for chat_id, change_seq in chat_changes if change_seq <= watermark
+                ]
+                messages = [change for change in messages if change.change_seq <= watermark]
+                deleted_messages = [tombstone for tombstone in deleted_messages if tombstone.change_seq <= watermark]
+                read_states = [read_state for read_state in read_states if read_state.change_seq <= watermark]
+
+            chats = []
+            changed_chat_ids = [chat_id for chat_id, _ in chat_changes]
+            if changed_chat_ids:
+                chats = await repo.get_chat_summaries(changed_chat_ids)
+                counters = await repo.get_unread_counters(changed_chat_ids, user_id)
+                for chat in chats:
+                    chat.unread_count, chat.is_mark_unread = counters.get(chat.id, (0, False))
+                await self._apply_interlocutors(repo, chats, user_id)
+
+            return ChatSyncDTO(
+                chats=chats,
+                messages=messages,
+                deleted_messages=deleted_messages,
+                read_states=read_states,
+                watermark=watermark,
+                has_more=has_more
+            )
+
     async def send_message(self, message_data: MessageCreationDTO) -> MessageDTO:
         async with self.uow() as session:
             chat_repo = ChatRepository(session)
-            profile_repo = ProfileRepository(session)
 
-            await self._check_user_is_participant_or_raise(chat_repo, message_data.chat_id, message_data.sender_id)
+            sent = await chat_repo.send_message(message_data)
+            if sent is None:
+                raise PermissionDeniedException("You are not a participant of this chat")
+
+            message, sender, participant_ids = sent
+            message_dto = self._build_message_dto(message, sender, self._build_avatar_url(sender.avatar_key))
+
+        await self.inbox.touch(participant_ids, message_data.chat_id, message_dto.created_at)
+        await self.publisher.publish_to_users(
+            participant_ids,
+            ChatEventDTO(
+                type=ChatEventTypeEnum.MESSAGE_CREATED,
+                chat_id=message_data.chat_id,
+                message=message_dto
+            )
+        )
+
+        return message_dto
+
+    async def send_messages(self, sender_id: UUID, messages: list[MessageCreationDTO]) -> list[MessageDTO]:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            participants = await repo.get_participant_ids_by_chat(list({message.chat_id for message in messages}))
+            if any(sender_id not in participants.get(message.chat_id, ()) for message in messages):
+                raise PermissionDeniedException("You are not a participant of this chat")
+
+            message_dtos = await self._create_messages(session, sender_id, messages)
+
+        await self._publish_created_messages(participants, message_dtos)
+        return [message_dto for _, message_dto in message_dtos]
+
+    async def forward_messages(
+        self,
+        sender_id: UUID,
+        message_ids: list[UUID],
+        chat_ids: list[UUID]
+    ) -> list[MessageDTO]:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            source_messages = await repo.get_forwardable_messages(list(set(message_ids)), sender_id)
+            if len(source_messages) != len(set(message_ids)):
+                raise PermissionDeniedException("You can't forward these messages")
+
+            chat_ids = list(dict.fromkeys(chat_ids))
+            participants = await repo.get_participant_ids_by_chat(chat_ids)
+            if any(sender_id not in participants.get(chat_id, ()) for chat_id in chat_ids):
+                raise PermissionDeniedException("You are not a participant of this chat")
+
+            message_dtos = await self._create_messages(
+                session,
+                sender_id,
+                [
+                    MessageCreationDTO(
+                        sender_id=sender_id,
+                        chat_id=chat_id,
+                        content=message.content,
+                        type=MessageTypeEnum.USER
+                    )
+                    for chat_id in chat_ids
+                    for message in source_messages
+                ]
+            )
+
+        await self._publish_created_messages(participants, message_dtos)
+        return [message_dto for _, message_dto in message_dtos]
+
+    async def _create_messages(
+        self,
+        session: AsyncSession,
+        sender_id: UUID,
+        messages: list[MessageCreationDTO]
+    ) -> list[tuple[UUID, MessageDTO]]:
+        repo = ChatRepository(session)
+
+        created_messages = await repo.create_messages(messages)
+
+        batches: dict[UUID, tuple[UUID, int]] = {}
+        for message in created_messages:
+            _, message_count = batches.get(message.chat_id, (None, 0))
+            batches[message.chat_id] = (message.id, message_count + 1)
+        await repo.advance_chats_after_batch(
+            sender_id,
+            [(chat_id, last_message_id, message_count) for chat_id, (last_message_id, message_count) in batches.items()]
+        )
 
-            message = await chat_repo.create_message(message_data)
-            sender = await profile_repo.get_by_user_id(message_data.sender_id)
-            avatar_url = self._build_avatar_url(sender.avatar_key)
+        sender = await ProfileRepository(session).get_by_user_id(sender_id)
+        avatar_url = self._build_avatar_url(sender.avatar_key)
+        return [
+            (message.chat_id, self._build_message_dto(message, sender, avatar_url))
+            for message in created_messages
+        ]
 
-            await chat_repo.update_chat_last_message(message.chat_id, message.id)
-            await chat_repo.mark_as_read(message_data.chat_id, message_data.sender_id, message.id)
+    async def _publish_created_messages(
+        self,
+        participants: dict[UUID, list[UUID]],
+        message_dtos: list[tuple[UUID, MessageDTO]]
+    ) -> None:
+        last_message_at = {chat_id: message_dto.created_at for chat_id, message_dto in message_dtos}
+        for chat_id, created_at in last_message_at.items():
+            await self.inbox.touch(participants[chat_id], chat_id, created_at)
 
-            return self._build_message_dto(message, sender, avatar_url)
+        for chat_id, message_dto in message_dtos:
+            await self.publisher.publish_to_users(
+                participants[chat_id],
+                ChatEventDTO(
+                    type=ChatEventTypeEnum.MESSAGE_CREATED,
+                    chat_id=chat_id,
+                    message=message_dto
+                )
+            )
 
     async def get_chat_history(
         self,
         chat_id: UUID,
         current_user_id: UUID,
         limit: int = 50,
-        cursor: datetime | None = None
+        cursor: datetime | None = None,
+        after: datetime | None = None,
+        anchor_id: UUID | None = None,
+        around_last_read: bool = True
     ) -> MessageHistoryDTO:
         async with self.uow() as session:
             repo = ChatRepository(session)
@@ -133,29 +341,190 @@ class ChatService:
                 chat_dto.username = interlocutor.username
 
             last_read_message_id = await repo.get_last_read_message_id(chat_id, current_user_id)
+            if around_last_read and anchor_id is None and cursor is None and after is None:
+                anchor_id = last_read_message_id
+
+            newer: list[MessageDTO] = []
+            older: list[MessageDTO] | None = None
+            newer_limit = 0
+            older_limit = limit
+            newer_after = after
+            older_before = cursor
+
+            if after is not None:
+                newer_limit = limit
+                newer = await repo.get_chat_history_after(chat_id, current_user_id, limit + 1, after)
+                older = []
+                older_limit = 0
+            elif anchor_id is not None:
+                window = await repo.get_chat_history_around(
+                    chat_id,
+                    current_user_id,
+                    anchor_id,
+                    limit - limit // 2 + 1,
+                    limit // 2 + 1
+                )
+                anchor_index = next(
+                    (index for index, message in enumerate(window) if message.id == anchor_id),
+                    None
+                )
+                if anchor_index is not None:
+                    newer_limit = limit // 2
+                    older_limit = limit - newer_limit
+                    newer = window[:anchor_index]
+                    older = window[anchor_index:]
+                    newer_after = older_before = older[0].created_at
 
-            messages = await repo.get_chat_history(chat_id, limit + 1, cursor)
-            has_next = len(messages) > limit
-            messages = messages[:limit]
+            if older is None:
+                older = await repo.get_chat_history(chat_id, current_user_id, limit + 1, cursor)
+
+            if newer_limit:
+                newer = await self._merge_archived_history(
+                    session,
+                    chat_id,
+                    newer,
+                    newer_limit + 1,
+                    after=newer_after
+                )
+            if older_limit:
+                older = await self._merge_archived_history(
+                    session,
+                    chat_id,
+                    older,
+                    older_limit + 1,
+                    before=older_before
+                )
+
+            has_prev = len(newer) > newer_limit
+            newer = newer[-newer_limit:] if newer_limit else []
+            has_next = len(older) > older_limit or bool(after is not None and newer)
+            messages = newer + older[:older_limit]
             next_cursor = messages[-1].created_at if messages else None
+            prev_cursor = messages[0].created_at if messages else None
 
             return MessageHistoryDTO(
                 chat=chat_dto,
                 messages=messages,
                 last_read_message_id=last_read_message_id,
                 has_next=has_next,
-                next_cursor=next_cursor
+                next_cursor=next_cursor,
+                has_prev=has_prev,
+                prev_cursor=prev_cursor
             )
 
     async def edit_message(self, message_id: UUID, current_user_id: UUID, data: MessageUpdateDTO) -> MessageDTO:
         async with self.uow() as session:
             repo = ChatRepository(session)
+            profile_repo = ProfileRepository(session)
 
             updated_message = await repo.update_message(message_id, current_user_id, data)
             if updated_message is None:
                 raise PermissionDeniedException("You can't edit this message")
 
-            return updated_message
+            sender = await profile_repo.get_by_user_id(current_user_id)
+            participant_ids = await repo.get_participant_ids(updated_message.chat_id)
+
+            message_dto = self._build_message_dto(updated_message, sender, self._build_avatar_url(sender.avatar_key))
+
+        await self.inbox.invalidate_summary(updated_message.chat_id)
+        await self.publisher.publish_to_users(
+            participant_ids,
+            ChatEventDTO(
+                type=ChatEventTypeEnum.MESSAGE_EDITED,
+                chat_id=updated_message.chat_id,
+                message=message_dto
+            )
+        )
+
+        return message_dto
+
+    async def add_reaction(self, message_id: UUID, current_user_id: UUID, emoji: str) -> None:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            reacted = await repo.add_reaction(message_id, current_user_id, emoji)
+            if reacted is None:
+                raise PermissionDeniedException("You can't react to this message")
+            if not reacted.is_changed:
+                return
+
+            participant_ids = await repo.get_participant_ids(reacted.chat_id)
+
+        await self._publish_reactions(participant_ids, reacted.chat_id, message_id, reacted.reactions)
+
+    async def remove_reaction(self, message_id: UUID, current_user_id: UUID, emoji: str) -> None:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            removed = await repo.remove_reaction(message_id, current_user_id, emoji)
+            if removed is None:
+                return
+
+            participant_ids = await repo.get_participant_ids(removed.chat_id)
+
+        await self._publish_reactions(participant_ids, removed.chat_id, message_id, removed.reactions)
+
+    async def _publish_reactions(
+        self,
+        participant_ids: list[UUID],
+        chat_id: UUID,
+        message_id: UUID,
+        reactions: dict[str, int]
+    ) -> None:
+        await self.publisher.publish_to_users(
+            participant_ids,
+            ChatEventDTO(
+                type=ChatEventTypeEnum.REACTIONS_UPDATED,
+                chat_id=chat_id,
+                message_id=message_id,
+                reactions=reactions
+            )
+        )
+
+    async def set_typing(self, chat_id: UUID, current_user_id: UUID) -> None:
+        async with self.uow() as session:
+            participant_ids = await self._get_participant_ids(ChatRepository(session), chat_id)
+
+        if current_user_id not in participant_ids:
+            raise PermissionDeniedException("You are not a participant of this chat")
+
+        typing_user_ids = await self.typing.touch(chat_id, current_user_id)
+        if typing_user_ids is None:
+            return
+
+        await self.publisher.publish_to_users(
+            participant_ids,
+            ChatEventDTO(
+                type=ChatEventTypeEnum.TYPING,
+                chat_id=chat_id,
+                typing_user_ids=typing_user_ids
+            )
+        )
+
+    async def search_messages(
+        self,
+        chat_id: UUID,
+        current_user_id: UUID,
+        query: str,
+        limit: int = 20,
+        cursor: datetime | None = None
+    ) -> MessageSearchDTO:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            await self._check_user_is_participant_or_raise(repo, chat_id, current_user_id)
+
+            results = await repo.search_messages(chat_id, current_user_id, query, limit + 1, cursor)
+
+            has_next = len(results) > limit
+            results = results[:limit]
+            next_cursor = results[-1].message.created_at if has_next else None
+
+            return MessageSearchDTO(
+                results=results,
+                has_next=has_next,
+                next_cursor=next_cursor
+            )
 
     async def mark_as_read(
         self,
@@ -166,19 +535,234 @@ class ChatService:
         async with self.uow() as session:
             repo = ChatRepository(session)
 
+            created_at = await repo.get_message_created_at(chat_id, message_id)
+            if created_at is None:
+                return
+            if await self.read_receipts.add(chat_id, user_id, message_id, created_at):
+                return
+
             await repo.mark_as_read(chat_id, user_id, message_id)
 
-    async def delete_message_for_me(self, message_id: UUID) -> None:
+    async def mark_all_as_read(self, user_id: UUID) -> None:
         async with self.uow() as session:
             repo = ChatRepository(session)
 
-            await repo.delete_message_for_me(message_id)
+            await repo.mark_all_as_read(user_id)
+
+    async def flush_read_receipts(self, batch_size: int = 1000) -> int:
+        flushed = 0
+
+        while True:
+            receipts = await self.read_receipts.pop_batch(batch_size)
+            if not receipts:
+                return flushed
+
+            try:
+                async with self.uow() as session:
+                    repo = ChatRepository(session)
+
+                    flushed += await repo.apply_read_receipts([receipt[:3] for receipt in receipts])
+            except Exception:
+                await self.read_receipts.add_many(receipts)
+                raise
+
+            if len(receipts) < batch_size:
+                return flushed
+
+    async def delete_message_for_me(self, message_id: UUID, current_user_id: UUID) -> None:
+        async with self.uow() as session:
+            repo = ChatRepository(session)
+
+            chat_id = await repo.delete_message_for_me(message_id)
+
+        if chat_id is not None:
+            await self.publisher.publish_to_users(
+                [current_user_id],
+                ChatEventDTO(
+                    type=ChatEventTypeEnum.MESSAGE_DELETED,
+                    chat_id=chat_id,
+                    message_id=message_id
+                )
+            )
 
     async def delete_message_for_all(self, message_id: UUID) -> None:
         async with self.uow() as session:
             repo = ChatRepository(session)
 
-            await repo.delete_message_for_all(message_id)
+            deleted = await repo.delete_message_for_all(message_id)
+            if deleted is None:
+                return
+            await repo.decrement_unread_count(deleted.chat_id, deleted.sender_id, deleted.created_at)
+            await repo.add_message_tombstone(message_id, deleted.chat_id)
+            participant_ids = await repo.get_participant_ids(deleted.chat_id)
+
+        await self.inbox.invalidate_summary(deleted.chat_id)
+        await self.publisher.publish_to_users(
+            participant_ids,
+            ChatEventDTO(
+                type=ChatEventTypeEnum.MESSAGE_DELETED,
+                chat_id=deleted.chat_id,
+                message_id=message_id
+            )
+        )
+
+    async def archive_history(self, before: datetime, segment_size: int = 1000, batch_size: int = 100) -> int:
+        archived = 0
+        last_chat_id = None
+
+        while True:
+            async with self.uow() as session:
+                repo = ChatRepository(session)
+
+                chat_ids = await repo.get_chat_ids_with_messages_before(before, batch_size, last_chat_id)
+                if not chat_ids:
+                    return archived
+
+            for chat_id in chat_ids:
+                archived += await self._archive_chat_history(chat_id, before, segment_size)
+
+            last_chat_id = chat_ids[-1]
+
+    async def _archive_chat_history(self, chat_id: UUID, before: datetime, segment_size: int) -> int:
+        archived = 0
+
+        while True:
+            object_key = None
+            try:
+                async with self.uow() as session:
+                    repo = ChatRepository(session)
+
+                    messages = await repo.get_archivable_messages(chat_id, before, segment_size)
+                    if not messages:
+                        return archived
+
+                    object_key = await self.archive.write_segment(chat_id, messages)
+                    await repo.add_archive_segment(chat_id, object_key, messages)
+                    await repo.delete_archived_messages(chat_id, messages)
+            except Exception:
+                if object_key is not None:
+                    await self.archive.delete_segment(object_key)
+                raise
+
+            archived += len(messages)
+            if len(messages) < segment_size:
+                return archived
+
+    async def _merge_archived_history(
+        self,
+        session: AsyncSession,
+        chat_id: UUID,
+        messages: list[MessageDTO],
+        limit: int,
+        before: datetime | None = None,
+        after: datetime | None = None
+    ) -> list[MessageDTO]:
+        if after is None:
+            floor = messages[limit - 1].created_at if len(messages) >= limit else None
+            archived = await self._get_archived_history(session, chat_id, limit, before, floor)
+        else:
+            ceiling = messages[-limit].created_at if len(messages) >= limit else None
+            archived = await self._get_archived_history(session, chat_id, limit, ceiling, after, newest_first=False)
+
+        if not archived:
+            return messages
+
+        merged = sorted(messages + archived, key=lambda message: message.created_at, reverse=True)
+        return merged[:limit] if after is None else merged[-limit:]
+
+    async def _get_archived_history(
+        self,
+        session: AsyncSession,
+        chat_id: UUID,
+        limit: int,
+        before: datetime | None,
+        after: datetime | None,
+        newest_first: bool = True
+    ) -> list[MessageDTO]:
+        repo = ChatRepository(session)
+        profile_repo = ProfileRepository(session)
+
+        segments = await repo.get_archive_segments(chat_id, before, after, limit, newest_first)
+
+        archived: list[ArchivedMessageDTO] = []
+        for segment in segments:
+            if len(archived) >= limit and (
+                segment.last_created_at < archived[limit - 1].created_at
+                if newest_first
+                else segment.first_created_at > archived[limit - 1].created_at
+            ):
+                break
+            archived += [
+                message
+                for message in await self.archive.read_segment(segment.object_key)
+                if (before is None or message.created_at < before) and (after is None or message.created_at > after)
+            ]
+            archived.sort(key=lambda message: message.created_at, reverse=newest_first)
+
+        archived = archived[:limit]
+        if not archived:
+            return []
+
+        senders = {
+            profile.id: profile
+            for profile in await profile_repo.get_by_user_ids(
+                list({message.sender_id for message in archived if message.sender_id is not None})
+            )
+        }
+
+        return [
+            self._build_message_dto(message, sender, self._build_avatar_url(sender.avatar_key))
+            for message in archived
+            if (sender := senders.get(message.sender_id)) is not None
+        ]
+
+    async def recount_unread_counters(self, batch_size: int = 500) -> int:
+        repaired = 0
+        last_chat_id = None
+
+        while True:
+            async with self.uow() as session:
+                repo = ChatRepository(session)
+
+                chat_ids = await repo.get_chat_ids_batch(batch_size, last_chat_id)
+                if not chat_ids:
+                    return repaired
+
+                repaired += await repo.recount_unread_counts(chat_ids)
+
+            last_chat_id = chat_ids[-1]
+
+    async def _apply_interlocutors(self, repo: ChatRepository, chats: list[ChatDTO], current_user_id: UUID) -> None:
+        personal_chats = {
+            chat.id: chat
+            for chat in chats
+            if not chat.is_group
+        }
+        interlocutors = await repo.get_personal_chat_interlocutors(personal_chats.keys(), current_user_id)
+        for chat_id in personal_chats:
+            personal_chats[chat_id].name = interlocutors[chat_id].full_name
+            personal_chats[chat_id].avatar_url = self._build_avatar_url(interlocutors[chat_id].avatar_key)
+
+    async def _hydrate_chats(self, repo: ChatRepository, chat_ids: list[UUID], user_id: UUID) -> list[ChatDTO]:
+        summaries = await self.inbox.get_summaries(chat_ids)
+
+        missing_ids = [chat_id for chat_id in chat_ids if chat_id not in summaries]
+        if missing_ids:
+            loaded = await repo.get_chat_summaries(missing_ids)
+            await self.inbox.set_summaries(loaded)
+            summaries.update({chat.id: chat for chat in loaded})
+
+        counters = await repo.get_unread_counters(chat_ids, user_id)
+
+        chats = []
+        for chat_id in chat_ids:
+            chat = summaries.get(chat_id)
+            if chat is None or chat_id not in counters:
+                continue
+            chat.unread_count, chat.is_mark_unread = counters[chat_id]
+            chats.append(chat)
+
+        return chats
 
     def _build_chat_dto(
         self,
@@ -214,7 +798,7 @@ class ChatService:
 
     @staticmethod
     def _build_message_dto(
-        message: MessageModel,
+        message: MessageModel | Row | ArchivedMessageDTO,
         sender: ProfileModel,
         avatar_url: str | None
     ):
@@ -232,7 +816,11 @@ class ChatService:
             is_edited=message.is_edited,
             is_deleted=message.is_deleted,
             created_at=message.created_at,
-            edited_at=message.edited_at
+            edited_at=message.edited_at,
+            reactions=[
+                MessageReactionDTO(emoji=emoji, count=count, is_mine=False)
+                for emoji, count in message.reactions.items()
+            ]
         )
 
     @staticmethod
@@ -241,12 +829,276 @@ class ChatService:
             return None
         return f"{settings.s3.public_endpoint}/media/avatars/{avatar_key}"
 
-    @staticmethod
-    async def _check_user_is_participant_or_raise(repo: ChatRepository, chat_id: UUID, current_user_id: UUID):
-        is_participant = await repo.check_user_is_participant(chat_id, current_user_id)
-        if not is_participant:
+    async def _check_user_is_participant_or_raise(self, repo: ChatRepository, chat_id: UUID, current_user_id: UUID):
+        if current_user_id not in await self._get_participant_ids(repo, chat_id):
             raise PermissionDeniedException("You are not a participant of this chat")
 
+    async def _get_participant_ids(self, repo: ChatRepository, chat_id: UUID) -> frozenset[UUID]:
+        participant_ids = await self.membership.get_members(chat_id)
+        if participant_ids is None:
+            participant_ids = frozenset(await repo.get_participant_ids(chat_id))
+            await self.membership.fill(chat_id, participant_ids)
+        return participant_ids
+
 
 def get_chat_service() -> ChatService:
-    return ChatService(UnitOfWork())
+    return ChatService(
+        uow=UnitOfWork(),
+        publisher=RealtimePublisher(),
+        inbox=InboxRepository(),
+        membership=membership_cache,
+        read_receipts=ReadReceiptBuffer(),
+        archive=MessageArchive(
+            S3Storage(
+                access_key=settings.s3.access_key,
+                secret_key=settings.s3.secret_key.get_secret_value(),
+                bucket_name="chat-archive",
+                internal_endpoint_url=settings.s3.internal_endpoint,
+                public_endpoint_url=settings.s3.public_endpoint
+            )
+        ),
+        typing=TypingIndicators(settings.typing.ttl, settings.typing.broadcast_interval)
+    )
+
+
+class MessagePartitionService:
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
+    async def ensure_partitions(self, months_ahead: int = 3) -> list[str]:
+        now = datetime.now(UTC)
+        month_index = now.month - 1 + months_ahead
+        last_month = now.replace(year=now.year + month_index // 12, month=month_index % 12 + 1, day=1)
+
+        return await self.ensure_partitions_between(now, last_month)
+
+    async def ensure_partitions_between(self, start: datetime, end: datetime) -> list[str]:
+        month = start.astimezone(UTC).date().replace(day=1)
+        last_month = end.astimezone(UTC).date().replace(day=1)
+
+        async with self.uow() as session:
+            repo = MessagePartitionRepository(session)
+
+            existing = await repo.get_partitions()
+            created = []
+            while month <= last_month:
+                if repo.partition_name(month) not in existing:
+                    created.append(await repo.create_monthly_partition(month))
+                month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+        return created
+
+    async def detach_partitions_before(self, month: date) -> list[str]:
+        async with self.uow() as session:
+            repo = MessagePartitionRepository(session)
+
+            detached = []
+            for name in sorted(await repo.get_partitions(detach_pending=True)):
+                await repo.finalize_detach(name)
+                detached.append(name)
+
+            partitions = await repo.get_partitions()
+            for name, partition_month in sorted(partitions.items()):
+                if partition_month >= month:
+                    break
+                await repo.delete_reactions_in(partition_month)
+                await repo.detach_partition(name)
+                detached.append(name)
+
+        return detached
+
+
+def get_message_partition_service() -> MessagePartitionService:
+    return MessagePartitionService(uow=UnitOfWork(AutocommitSession))
+
+
+class ChatImportService:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        storage: S3Storage,
+        inbox: InboxRepository,
+        membership: MembershipCache,
+        partitions: MessagePartitionService,
+        owners: ImportOwnerRepository,
+        batch_size: int,
+        chunk_size: int
+    ) -> None:
+        self.uow = uow
+        self.storage = storage
+        self.inbox = inbox
+        self.membership = membership
+        self.partitions = partitions
+        self.owners = owners
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    async def start_import(self, user_id: UUID, file: BinaryIO, own_sender_id: str) -> str:
+        object_key = f"{user_id}/{uuid4()}.json"
+        await self.storage.upload(object_key, file, "application/json")
+
+        task_id = str(uuid4())
+        await self.owners.set_owner(task_id, user_id)
+        celery.send_task(
+            "core.chat.tasks.import_chat_history",
+            args=[str(user_id), object_key, own_sender_id],
+            task_id=task_id
+        )
+        return task_id
+
+    async def get_import_status(self, task_id: str, user_id: UUID) -> ChatImportStatusDTO:
+        if await self.owners.get_owner(task_id) != user_id:
+            raise ChatImportDoesNotExistException("Chat import does not exist")
+
+        result = AsyncResult(task_id, app=celery)
+        status = ChatImportStatusDTO(task_id=task_id, state=result.state)
+
+        if result.state in {"PROGRESS", "SUCCESS"}:
+            status.progress = ChatImportProgressDTO(**result.info)
+        elif result.state == "FAILURE":
+            status.error = str(result.info)
+        return status
+
+    async def import_chat_history(
+        self,
+        user_id: UUID,
+        object_key: str,
+        own_sender_id: str,
+        on_progress: Callable[[ChatImportProgressDTO], None]
+    ) -> ChatImportProgressDTO:
+        progress = ChatImportProgressDTO(
+            bytes_read=0,
+            total_bytes=await self.storage.get_size(object_key),
+            imported_messages=0,
+            skipped_messages=0
+        )
+
+        try:
+            first_message_at, last_message_at = await self._get_date_range(object_key)
+            if first_message_at is not None:
+                await self.partitions.ensure_partitions_between(first_message_at, last_message_at)
+
+            reader = TelegramExportReader(self.storage.iter_chunks(object_key, self.chunk_size))
+            records = []
+            async for importable in self._iter_importable(reader):
+                if importable is None:
+                    progress.skipped_messages += 1
+                    continue
+                message, content, created_at = importable
+
+                if progress.chat_id is None:
+                    progress.chat_id = await self._create_chat(reader.header, user_id)
+
+                last_message_id = uuid4()
+                if message.get("from_id") == own_sender_id:
+                    message_type = MessageTypeEnum.USER
+                else:
+                    message_type = MessageTypeEnum.SYSTEM
+                    content = f"{message.get('from') or message.get('from_id')}: {content}"
+
+                records.append((
+                    last_message_id,
+                    progress.chat_id,
+                    user_id,
+                    message_type.name,
+                    content,
+                    "edited" in message,
+                    False,
+                    created_at
+                ))
+                if len(records) >= self.batch_size:
+                    await self._copy_batch(records, progress, reader.bytes_read)
+                    records = []
+                    on_progress(progress)
+
+            if records:
+                await self._copy_batch(records, progress, reader.bytes_read)
+            progress.bytes_read = reader.bytes_read
+
+            if progress.chat_id is not None:
+                async with self.uow() as session:
+                    await ChatRepository(session).complete_import(progress.chat_id, last_message_id, last_message_at)
+        except Exception:
+            if progress.chat_id is not None:
+                async with self.uow() as session:
+                    await ChatRepository(session).delete_chat(progress.chat_id)
+            raise
+        finally:
+            await self.storage.delete(object_key)
+
+        if progress.chat_id is not None:
+            await self.membership.invalidate(progress.chat_id)
+            await self.inbox.touch([user_id], progress.chat_id, last_message_at)
+
+        return progress
+
+    async def _copy_batch(self, records: list[tuple], progress: ChatImportProgressDTO, bytes_read: int) -> None:
+        async with self.uow() as session:
+            await ChatRepository(session).copy_messages(records)
+
+        progress.imported_messages += len(records)
+        progress.bytes_read = bytes_read
+
+    async def _get_date_range(self, object_key: str) -> tuple[datetime | None, datetime | None]:
+        first_message_at = last_message_at = None
+
+        reader = TelegramExportReader(self.storage.iter_chunks(object_key, self.chunk_size))
+        async for importable in self._iter_importable(reader):
+            if importable is None:
+                continue
+            created_at = importable[2]
+            if first_message_at is None:
+                first_message_at = created_at
+            last_message_at = created_at
+
+        return first_message_at, last_message_at
+
+    @staticmethod
+    async def _iter_importable(
+        reader: TelegramExportReader
+    ) -> AsyncIterator[tuple[dict[str, Any], str, datetime] | None]:
+        last_message_at = None
+        async for message in reader.messages():
+            content = get_message_text(message)
+            created_at = get_message_date(message)
+            if message.get("type") != "message" or not content or created_at is None:
+                yield None
+                continue
+
+            if last_message_at is not None and created_at <= last_message_at:
+                created_at = last_message_at + timedelta(microseconds=1)
+            last_message_at = created_at
+            yield message, content, created_at
+
+    async def _create_chat(self, header: dict[str, Any], user_id: UUID) -> UUID:
+        async with self.uow() as session:
+            chat = await ChatRepository(session).create_chat(
+                ChatCreationDTO(
+                    is_group=True,
+                    name=header.get("name") or "Imported chat",
+                    users_ids=(user_id,),
+                    creator_id=user_id
+                )
+            )
+            await session.flush()
+
+        return chat.id
+
+
+def get_chat_import_service() -> ChatImportService:
+    return ChatImportService(
+        uow=UnitOfWork(),
+        storage=S3Storage(
+            access_key=settings.s3.access_key,
+            secret_key=settings.s3.secret_key.get_secret_value(),
+            bucket_name="chat-imports",
+            internal_endpoint_url=settings.s3.internal_endpoint,
+            public_endpoint_url=settings.s3.public_endpoint
+        ),
+        inbox=InboxRepository(),
+        membership=membership_cache,
+        partitions=get_message_partition_service(),
+        owners=ImportOwnerRepository(settings.chat_import.owner_ttl),
+        batch_size=settings.chat_import.batch_size,
+        chunk_size=settings.chat_import.chunk_size
+    )
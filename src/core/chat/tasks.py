@@ -0,0 +1,46 @@
+from dataclasses import asdict
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID
+
+from core.chat.entities import ChatImportProgressDTO
+from core.chat.services import get_chat_import_service, get_chat_service, get_message_partition_service
+from infrastructure.celery_app.runner import run_async
+from infrastructure.celery_app.worker import celery
+from settings import settings
+
+
+@celery.task
+def recount_unread_counters() -> int:
+    return run_async(get_chat_service().recount_unread_counters())
+
+
+@celery.task
+def flush_read_receipts() -> int:
+    return run_async(get_chat_service().flush_read_receipts(settings.read_receipts.flush_batch_size))
+
+
+@celery.task
+def ensure_message_partitions() -> list[str]:
+    return run_async(get_message_partition_service().ensure_partitions())
+
+
+@celery.task
+def detach_message_partitions(before: str) -> list[str]:
+    return run_async(get_message_partition_service().detach_partitions_before(date.fromisoformat(before)))
+
+
+@celery.task
+def archive_chat_history() -> int:
+    before = datetime.now(UTC) - timedelta(days=settings.chat_archive.hot_days)
+    return run_async(get_chat_service().archive_history(before, settings.chat_archive.segment_size))
+
+
+@celery.task(bind=True)
+def import_chat_history(self, user_id: str, object_key: str, own_sender_id: str) -> dict:
+    def report_progress(progress: ChatImportProgressDTO) -> None:
+        self.update_state(state="PROGRESS", meta=asdict(progress))
+
+    progress = run_async(
+        get_chat_import_service().import_chat_history(UUID(user_id), object_key, own_sender_id, report_progress)
+    )
+    return asdict(progress)
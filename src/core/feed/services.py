@@ -0,0 +1,144 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from operator import itemgetter
+from uuid import UUID
+
+from core.posts.entities import PostImageDTO, PostsPageDTO
+from infrastructure.database.repositories.follow import FollowRepository
+from infrastructure.database.repositories.posts import PostRepository
+from infrastructure.database.uow import UnitOfWork
+from infrastructure.feed.timelines import HomeTimelines
+from infrastructure.s3.storage import S3Storage
+from settings import settings
+
+
+class FeedService:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        timelines: HomeTimelines,
+        s3_storage: S3Storage,
+        celebrity_threshold: int,
+        timeline_length: int,
+        fan_out_batch_size: int
+    ) -> None:
+        self.uow = uow
+        self.timelines = timelines
+        self.s3 = s3_storage
+        self._celebrity_threshold = celebrity_threshold
+        self._timeline_length = timeline_length
+        self._fan_out_batch_size = fan_out_batch_size
+
+    async def get_feed(self, user_id: UUID, cursor: datetime | None = None, limit: int = 25) -> PostsPageDTO:
+        async with self.uow() as session:
+            follow_repository = FollowRepository(session)
+            post_repository = PostRepository(session)
+
+            entries = await self.timelines.read(user_id, cursor, limit + 1)
+            if entries is None:
+                entries = await self._rebuild_timeline(post_repository, user_id)
+                entries = [entry for entry in entries if cursor is None or entry[1] < cursor][:limit + 1]
+
+            celebrity_ids = await follow_repository.get_followees_above(user_id, self._celebrity_threshold)
+            if await follow_repository.get_followers_count(user_id) >= self._celebrity_threshold:
+                celebrity_ids.append(user_id)
+            pulled = await post_repository.get_posts_by_authors(celebrity_ids, cursor, limit + 1)
+
+            merged = sorted(dict([*entries, *pulled]).items(), key=itemgetter(1), reverse=True)
+            page = merged[:limit]
+            posts = await post_repository.get_posts_by_ids([post_id for post_id, _ in page], user_id)
+
+        for post in posts:
+            post.images = self._resolve_image_urls(post.images)
+
+        return PostsPageDTO(
+            posts=posts,
+            has_next=len(merged) > limit,
+            next_cursor=page[-1][1] if page else None
+        )
+
+    async def fan_out_post(self, post_id: UUID) -> int:
+        async with self.uow() as session:
+            post = await PostRepository(session).get_post_or_none(post_id)
+            if post is None:
+                return 0
+            if await FollowRepository(session).get_followers_count(post.author_id) >= self._celebrity_threshold:
+                return 0
+
+        await self.timelines.push(post.id, post.created_at, [post.author_id])
+        delivered = 1
+        async for follower_ids in self._iter_follower_ids(post.author_id):
+            await self.timelines.push(post.id, post.created_at, follower_ids)
+            delivered += len(follower_ids)
+
+        return delivered
+
+    async def remove_post(self, post_id: UUID, author_id: UUID) -> int:
+        async with self.uow() as session:
+            if await FollowRepository(session).get_followers_count(author_id) >= self._celebrity_threshold:
+                return 0
+
+        await self.timelines.remove([post_id], [author_id])
+        removed = 1
+        async for follower_ids in self._iter_follower_ids(author_id):
+            await self.timelines.remove([post_id], follower_ids)
+            removed += len(follower_ids)
+
+        return removed
+
+    async def rebuild_timeline(self, user_id: UUID) -> int:
+        async with self.uow() as session:
+            entries = await self._rebuild_timeline(PostRepository(session), user_id)
+
+        return len(entries)
+
+    async def rebuild_timelines(self) -> int:
+        rebuilt = 0
+        async for user_id in self.timelines.iter_user_ids():
+            await self.rebuild_timeline(user_id)
+            rebuilt += 1
+
+        return rebuilt
+
+    async def _rebuild_timeline(self, repository: PostRepository, user_id: UUID) -> list[tuple[UUID, datetime]]:
+        previous = await self.timelines.reserve(user_id)
+        entries = await repository.get_feed_entries(user_id, self._celebrity_threshold, self._timeline_length)
+        await self.timelines.merge(user_id, entries, previous)
+        return entries
+
+    async def _iter_follower_ids(self, author_id: UUID) -> AsyncIterator[list[UUID]]:
+        after = None
+        while True:
+            async with self.uow() as session:
+                follower_ids = await FollowRepository(session).get_follower_ids(
+                    author_id,
+                    after,
+                    self._fan_out_batch_size
+                )
+            if follower_ids:
+                yield follower_ids
+            if len(follower_ids) < self._fan_out_batch_size:
+                return
+            after = follower_ids[-1]
+
+    def _resolve_image_urls(self, images: list[PostImageDTO] | None) -> list[PostImageDTO]:
+        if not images:
+            return []
+        return [PostImageDTO(object_key=self.s3.get_file_url(img.object_key), order=img.order) for img in images]
+
+
+def get_feed_service() -> FeedService:
+    return FeedService(
+        uow=UnitOfWork(),
+        timelines=HomeTimelines(settings.feed.timeline_length, settings.feed.timeline_ttl),
+        s3_storage=S3Storage(
+            access_key=settings.s3.access_key,
+            secret_key=settings.s3.secret_key.get_secret_value(),
+            bucket_name="posts",
+            internal_endpoint_url=settings.s3.internal_endpoint,
+            public_endpoint_url=settings.s3.public_endpoint,
+        ),
+        celebrity_threshold=settings.feed.celebrity_threshold,
+        timeline_length=settings.feed.timeline_length,
+        fan_out_batch_size=settings.feed.fan_out_batch_size
+    )
@@ -0,0 +1,25 @@
+from uuid import UUID
+
+from core.feed.services import get_feed_service
+from infrastructure.celery_app.runner import run_async
+from infrastructure.celery_app.worker import celery
+
+
+@celery.task
+def fan_out_post(post_id: str) -> int:
+    return run_async(get_feed_service().fan_out_post(UUID(post_id)))
+
+
+@celery.task
+def remove_post_from_feeds(post_id: str, author_id: str) -> int:
+    return run_async(get_feed_service().remove_post(UUID(post_id), UUID(author_id)))
+
+
+@celery.task
+def rebuild_feed_timeline(user_id: str) -> int:
+    return run_async(get_feed_service().rebuild_timeline(UUID(user_id)))
+
+
+@celery.task
+def rebuild_feed_timelines() -> int:
+    return run_async(get_feed_service().rebuild_timelines())
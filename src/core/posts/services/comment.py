@@ -33,9 +33,10 @@ class CommentService:
             comment = await comment_repo.create(data, root_comment_id)
             if root_comment_id is not None:
                 await comment_repo.update_thread_replies_count(root_comment_id, 1)
+            await post_repo.change_comments_count(data.post_id, 1)
 
             author = await profile_repository.get_by_user_id(data.author_id)
-            avatar_url = self._build_avatar_url(comment.author.avatar_key)
+            avatar_url = self._build_avatar_url(author.avatar_key)
             return self._build_comment_dto(comment, author, avatar_url)
 
     async def get_root_comments(
@@ -74,12 +75,17 @@ class CommentService:
         async with self.uow() as session:
             repo = CommentRepository(session)
             comment = await self._ensure_comment_exists(repo, comment_id)
-            if comment.author.author_id != current_user_id:
+            if comment.author_id != current_user_id:
                 raise PermissionDeniedException("You are not allowed to delete this comment")
+
+            removed = await repo.count_subtree(comment_id)
             await repo.delete(comment_id)
+            if comment.root_comment_id is not None:
+                await repo.update_thread_replies_count(comment.root_comment_id, -removed)
+            await PostRepository(session).change_comments_count(comment.post_id, -removed)
 
     @staticmethod
-    async def _ensure_comment_exists(repository: CommentRepository, comment_id: UUID) -> CommentDTO:
+    async def _ensure_comment_exists(repository: CommentRepository, comment_id: UUID) -> PostCommentModel:
         comment = await repository.get_comment_or_none(comment_id)
         if comment is None:
             raise CommentDoesNotExistException("Comment does not exist")
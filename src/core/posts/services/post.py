@@ -3,6 +3,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 from core.exceptions import PermissionDeniedException
+from core.feed.tasks import fan_out_post, remove_post_from_feeds
 from core.posts.entities import (
     ImageDTO,
     PostCreationDTO,
@@ -46,6 +47,7 @@ class PostService:
             repository = PostRepository(session)
             result = await repository.create_post(author_id, post_data, image_dtos)
 
+        fan_out_post.delay(str(result.id))
         result.images = self._resolve_image_urls(result.images)
         return result
 
@@ -99,17 +101,13 @@ class PostService:
         async with self.uow() as session:
             repository = PostRepository(session)
             await self._ensure_post_exists(repository, post_id)
-
-            if not await repository.is_post_liked(post_id, current_user_id):
-                await repository.add_post_like(post_id, current_user_id)
+            await repository.add_post_like(post_id, current_user_id)
 
     async def remove_like(self, post_id: UUID, current_user_id: UUID) -> None:
         async with self.uow() as session:
             repository = PostRepository(session)
             await self._ensure_post_exists(repository, post_id)
-
-            if await repository.is_post_liked(post_id, current_user_id):
-                await repository.delete_post_like(post_id, current_user_id)
+            await repository.delete_post_like(post_id, current_user_id)
 
     async def delete_post(self, post_id: UUID, current_user_id: UUID) -> None:
         async with self.uow() as session:
@@ -121,6 +119,21 @@ class PostService:
             await self._delete_post_images(post.images)
             await repository.delete_post(post_id)
 
+        remove_post_from_feeds.delay(str(post_id), str(current_user_id))
+
+    async def reconcile_counters(self, batch_size: int = 1000) -> int:
+        reconciled = 0
+        after = None
+
+        while True:
+            async with self.uow() as session:
+                repository = PostRepository(session)
+                after, updated = await repository.reconcile_counters(after, batch_size)
+
+            reconciled += updated
+            if after is None:
+                return reconciled
+
     @staticmethod
     def _validate_post(post_data: PostCreationDTO, images: list[UploadImageDTO] | None) -> None:
         if not post_data.content and not images:
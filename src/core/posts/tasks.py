@@ -0,0 +1,9 @@
+from core.posts.services.post import get_post_service
+from infrastructure.celery_app.runner import run_async
+from infrastructure.celery_app.worker import celery
+from settings import settings
+
+
+@celery.task
+def reconcile_post_counters() -> int:
+    return run_async(get_post_service().reconcile_counters(settings.post_counters.reconcile_batch_size))
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 
@@ -8,3 +8,11 @@ class PresenseReadDTO:
     user_id: UUID
     is_online: bool
     last_seen: datetime | None
+
+
+@dataclass
+class ActiveUsersDTO:
+    day: date
+    daily: int
+    weekly: int
+    monthly: int
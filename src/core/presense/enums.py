@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class PresenseClientEventTypeEnum(StrEnum):
+    SUBSCRIBE = "subscribe"
+    UNSUBSCRIBE = "unsubscribe"
@@ -1,28 +1,37 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
-from core.presense.entities import PresenseReadDTO
+from core.presense.entities import ActiveUsersDTO, PresenseReadDTO
 from infrastructure.database.repositories.profile import ProfileRepository
 from infrastructure.database.uow import UnitOfWork
 from infrastructure.presense.repository import PresenseRepository
+from infrastructure.realtime.publisher import RealtimePublisher, presense_channel
+from settings import settings
 
 
 class PresenseService:
-    def __init__(self, uow: UnitOfWork) -> None:
-        self.presense_repository = PresenseRepository()
+    def __init__(self, uow: UnitOfWork, publisher: RealtimePublisher) -> None:
+        self.presense_repository = PresenseRepository(
+            settings.presense.online_ttl,
+            settings.presense.heartbeat_window,
+            settings.presense.last_seen_retention,
+            settings.presense.active_users_retention
+        )
         self.uow = uow
+        self.publisher = publisher
 
     async def set_online(self, user_id: UUID) -> None:
-        await self.presense_repository.set_online(user_id)
-        await self._update_last_seen(user_id)
+        now = datetime.now(UTC)
+        if await self.presense_repository.set_online(user_id, now):
+            await self._publish(PresenseReadDTO(user_id=user_id, is_online=True, last_seen=now))
 
     async def set_offline(self, user_id: UUID) -> None:
-        await self.presense_repository.set_offline(user_id)
-        await self._update_last_seen(user_id)
+        now = datetime.now(UTC)
+        if await self.presense_repository.set_offline(user_id, now):
+            await self._publish(PresenseReadDTO(user_id=user_id, is_online=False, last_seen=now))
 
     async def get_presense(self, user_id: UUID) -> PresenseReadDTO:
-        is_online = await self.presense_repository.is_online(user_id)
-        last_seen = await self.presense_repository.get_last_seen(user_id)
+        is_online, last_seen = await self.presense_repository.get_presense(user_id)
 
         dto = PresenseReadDTO(
             user_id=user_id,
@@ -32,13 +41,93 @@ class PresenseService:
 
         return dto
 
-    async def _update_last_seen(self, user_id: UUID) -> None:
-        current_time = datetime.now(UTC)
+    async def get_presense_many(self, user_ids: list[UUID]) -> list[PresenseReadDTO]:
+        presense = await self.presense_repository.get_presense_many(list(dict.fromkeys(user_ids)))
+
+        return [
+            PresenseReadDTO(
+                user_id=user_id,
+                is_online=is_online,
+                last_seen=last_seen
+            )
+            for user_id, (is_online, last_seen) in presense.items()
+        ]
+
+    async def count_online(self) -> int:
+        return await self.presense_repository.count_online()
+
+    async def get_recently_offline(self, user_ids: list[UUID], within: int) -> list[PresenseReadDTO]:
+        since = datetime.now(UTC) - timedelta(seconds=within)
+        recently_offline = await self.presense_repository.get_recently_offline(list(dict.fromkeys(user_ids)), since)
+
+        return [
+            PresenseReadDTO(
+                user_id=user_id,
+                is_online=False,
+                last_seen=last_seen
+            )
+            for user_id, last_seen in recently_offline.items()
+        ]
+
+    async def get_active_users(self, day: date | None = None) -> ActiveUsersDTO:
+        day = day or datetime.now(UTC).date()
+
+        dto = ActiveUsersDTO(
+            day=day,
+            daily=await self.presense_repository.count_active(day, 1),
+            weekly=await self.presense_repository.count_active(day, 7),
+            monthly=await self.presense_repository.count_active(day, 30)
+        )
+
+        return dto
+
+    async def rollup_active_users(self, day: date | None = None) -> ActiveUsersDTO:
+        day = day or datetime.now(UTC).date() - timedelta(days=1)
+
+        dto = ActiveUsersDTO(
+            day=day,
+            daily=await self.presense_repository.count_active(day, 1),
+            weekly=await self.presense_repository.rollup_active(day, 7),
+            monthly=await self.presense_repository.rollup_active(day, 30)
+        )
+
+        return dto
+
+    async def trim_expired(self, batch_size: int = 1000) -> int:
+        trimmed = 0
+
+        while True:
+            expired = await self.presense_repository.pop_expired(batch_size)
+            for user_id, last_seen in expired.items():
+                await self._publish(PresenseReadDTO(user_id=user_id, is_online=False, last_seen=last_seen))
+            trimmed += len(expired)
+
+            if len(expired) < batch_size:
+                return trimmed
+
+    async def flush_last_seen(self, batch_size: int = 1000) -> int:
+        flushed = 0
+
+        while True:
+            pending = await self.presense_repository.pop_pending_last_seen(batch_size)
+            if not pending:
+                return flushed
+
+            try:
+                async with self.uow() as session:
+                    repository = ProfileRepository(session)
+
+                    flushed += await repository.update_last_seen_many(pending)
+            except Exception:
+                await self.presense_repository.restore_pending_last_seen(pending)
+                raise
+
+            if len(pending) < batch_size:
+                return flushed
 
-        async with self.uow() as session:
-            repository = ProfileRepository(session)
-            await repository.update_last_seen(user_id, current_time)
+    async def _publish(self, presense: PresenseReadDTO) -> None:
+        await self.publisher.publish([presense_channel(presense.user_id)], presense)
 
 
 def get_presense_service() -> PresenseService:
-    return PresenseService(UnitOfWork())
+    return PresenseService(UnitOfWork(), RealtimePublisher())
@@ -0,0 +1,21 @@
+from dataclasses import asdict
+
+from core.presense.services import get_presense_service
+from infrastructure.celery_app.runner import run_async
+from infrastructure.celery_app.worker import celery
+from settings import settings
+
+
+@celery.task
+def flush_last_seen() -> int:
+    return run_async(get_presense_service().flush_last_seen(settings.last_seen.flush_batch_size))
+
+
+@celery.task
+def trim_presense() -> int:
+    return run_async(get_presense_service().trim_expired(settings.presense.trim_batch_size))
+
+
+@celery.task
+def rollup_active_users() -> dict:
+    return asdict(run_async(get_presense_service().rollup_active_users()))
@@ -26,6 +26,7 @@ class ProfileReadDTO:
     avatar_url: str | None
     status: str | None
     last_seen: datetime
+    followers_count: int = 0
 
     @classmethod
     def from_model(cls, profile: ProfileModel, avatar_url: str | None) -> "ProfileReadDTO":
@@ -39,6 +40,7 @@ class ProfileReadDTO:
             avatar_url=avatar_url,
             status=profile.status,
             last_seen=profile.last_seen,
+            followers_count=profile.followers_count,
         )
 
 
@@ -52,3 +54,11 @@ class ProfileUpdateDTO:
 
     def to_update_dict(self) -> dict:
         return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+@dataclass
+class FollowsPageDTO:
+    profiles: list[ProfileReadDTO]
+    next_cursor: datetime | None
+    next_cursor_id: UUID | None
+    has_next: bool
@@ -4,3 +4,7 @@ class ProfileAlreadyExistsException(Exception):
 
 class ProfileDoesNotExistException(Exception):
     pass
+
+
+class InvalidFollowException(Exception):
+    pass
@@ -1,11 +1,18 @@
 import asyncio
+from datetime import datetime
 from typing import BinaryIO
 from uuid import UUID
 
 from core.auth.entities import CurrentUserDTO
-from core.profile.entities import ProfileCreationDTO, ProfileReadDTO, ProfileUpdateDTO
-from core.profile.exceptions import ProfileAlreadyExistsException, ProfileDoesNotExistException
+from core.feed.tasks import rebuild_feed_timeline
+from core.profile.entities import FollowsPageDTO, ProfileCreationDTO, ProfileReadDTO, ProfileUpdateDTO
+from core.profile.exceptions import (
+    InvalidFollowException,
+    ProfileAlreadyExistsException,
+    ProfileDoesNotExistException,
+)
 from infrastructure.database.models.profile import ProfileModel
+from infrastructure.database.repositories.follow import FollowRepository
 from infrastructure.database.repositories.profile import ProfileRepository
 from infrastructure.database.uow import UnitOfWork
 from infrastructure.media.images.processor import ImageProcessor
@@ -91,6 +98,69 @@ class ProfileService:
                 for profile in profiles
             ]
 
+    async def follow(self, profile_id: UUID, user: CurrentUserDTO) -> None:
+        if profile_id == user.id:
+            raise InvalidFollowException("You cannot follow yourself")
+
+        async with self.uow() as session:
+            repository = ProfileRepository(session)
+            await self._get_profile_by_id_or_raise(repository, user.id)
+            await self._get_profile_by_id_or_raise(repository, profile_id)
+            is_followed = await FollowRepository(session).add(user.id, profile_id)
+
+        if is_followed:
+            rebuild_feed_timeline.delay(str(user.id))
+
+    async def unfollow(self, profile_id: UUID, user: CurrentUserDTO) -> None:
+        async with self.uow() as session:
+            repository = ProfileRepository(session)
+            await self._get_profile_by_id_or_raise(repository, profile_id)
+            is_unfollowed = await FollowRepository(session).delete(user.id, profile_id)
+
+        if is_unfollowed:
+            rebuild_feed_timeline.delay(str(user.id))
+
+    async def get_followers(
+        self,
+        profile_id: UUID,
+        cursor: datetime | None = None,
+        cursor_id: UUID | None = None,
+        limit: int = 25
+    ) -> FollowsPageDTO:
+        keyset = (cursor, cursor_id) if cursor is not None and cursor_id is not None else None
+        async with self.uow() as session:
+            await self._get_profile_by_id_or_raise(ProfileRepository(session), profile_id)
+            follows = await FollowRepository(session).get_followers(profile_id, keyset, limit + 1)
+
+        return self._build_follows_page(follows, limit)
+
+    async def get_following(
+        self,
+        profile_id: UUID,
+        cursor: datetime | None = None,
+        cursor_id: UUID | None = None,
+        limit: int = 25
+    ) -> FollowsPageDTO:
+        keyset = (cursor, cursor_id) if cursor is not None and cursor_id is not None else None
+        async with self.uow() as session:
+            await self._get_profile_by_id_or_raise(ProfileRepository(session), profile_id)
+            follows = await FollowRepository(session).get_following(profile_id, keyset, limit + 1)
+
+        return self._build_follows_page(follows, limit)
+
+    def _build_follows_page(self, follows: list[tuple[ProfileModel, datetime]], limit: int) -> FollowsPageDTO:
+        page = follows[:limit]
+
+        return FollowsPageDTO(
+            profiles=[
+                ProfileReadDTO.from_model(profile, self._build_avatar_url(profile.avatar_key))
+                for profile, _ in page
+            ],
+            next_cursor=page[-1][1] if page else None,
+            next_cursor_id=page[-1][0].id if page else None,
+            has_next=len(follows) > limit
+        )
+
     def _build_avatar_url(self, avatar_key: str | None) -> str | None:
         if not avatar_key:
             return None
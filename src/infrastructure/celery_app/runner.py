@@ -0,0 +1,17 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from infrastructure.database.database import engine
+from infrastructure.redis_pool.pools import redis_pools
+
+
+def run_async[T](coroutine: Coroutine[Any, Any, T]) -> T:
+    async def _run() -> T:
+        try:
+            return await coroutine
+        finally:
+            await engine.dispose()
+            await redis_pools.close()
+
+    return asyncio.run(_run())
@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 
 from settings import settings
 
@@ -8,6 +9,52 @@ celery = Celery(
     broker=settings.redis.celery_url,
     backend=settings.redis.celery_url,
     include=[
-        "core.auth.tasks"
+        "core.auth.tasks",
+        "core.chat.tasks",
+        "core.feed.tasks",
+        "core.posts.tasks",
+        "core.presense.tasks"
     ]
 )
+
+celery.conf.beat_schedule = {
+    "recount-unread-counters": {
+        "task": "core.chat.tasks.recount_unread_counters",
+        "schedule": crontab(hour=4, minute=0)
+    },
+    "ensure-message-partitions": {
+        "task": "core.chat.tasks.ensure_message_partitions",
+        "schedule": crontab(hour=3, minute=0)
+    },
+    "archive-chat-history": {
+        "task": "core.chat.tasks.archive_chat_history",
+        "schedule": crontab(hour=5, minute=0)
+    },
+    "reconcile-post-counters": {
+        "task": "core.posts.tasks.reconcile_post_counters",
+        "schedule": crontab(hour=4, minute=15)
+    },
+    "rebuild-feed-timelines": {
+        "task": "core.feed.tasks.rebuild_feed_timelines",
+        "schedule": crontab(hour=4, minute=30)
+    },
+    "flush-read-receipts": {
+        "task": "core.chat.tasks.flush_read_receipts",
+        "schedule": settings.read_receipts.flush_interval,
+        "options": {"expires": settings.read_receipts.flush_interval}
+    },
+    "flush-last-seen": {
+        "task": "core.presense.tasks.flush_last_seen",
+        "schedule": settings.last_seen.flush_interval,
+        "options": {"expires": settings.last_seen.flush_interval}
+    },
+    "rollup-active-users": {
+        "task": "core.presense.tasks.rollup_active_users",
+        "schedule": crontab(hour=0, minute=5)
+    },
+    "trim-presense": {
+        "task": "core.presense.tasks.trim_presense",
+        "schedule": settings.presense.trim_interval,
+        "options": {"expires": settings.presense.trim_interval}
+    }
+}
@@ -0,0 +1,35 @@
+import gzip
+import io
+from collections.abc import Sequence
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from core.chat.entities import ArchivedMessageDTO
+from infrastructure.s3.storage import S3Storage
+
+
+class MessageArchive:
+    _message_adapter = TypeAdapter(ArchivedMessageDTO)
+
+    def __init__(self, storage: S3Storage) -> None:
+        self.storage = storage
+
+    async def write_segment(self, chat_id: UUID, messages: Sequence[ArchivedMessageDTO]) -> str:
+        body = gzip.compress(b"\n".join(to_json(message) for message in messages))
+        object_key = f"{chat_id}/{messages[0].created_at:%Y%m%dT%H%M%S%f}-{messages[-1].id}.jsonl.gz"
+
+        await self.storage.upload(object_key, io.BytesIO(body), "application/gzip")
+        return object_key
+
+    async def read_segment(self, object_key: str) -> list[ArchivedMessageDTO]:
+        body = await self.storage.download(object_key)
+        return [
+            self._message_adapter.validate_json(line)
+            for line in gzip.decompress(body).splitlines()
+            if line
+        ]
+
+    async def delete_segment(self, object_key: str) -> None:
+        await self.storage.delete(object_key)
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from infrastructure.redis_pool.pools import redis_pools
+
+
+IMPORT_OWNER_KEY = "chat:import:{task_id}:owner"
+
+
+class ImportOwnerRepository:
+    def __init__(self, ttl: int) -> None:
+        self.redis_client = redis_pools.client("cache")
+        self._ttl = ttl
+
+    async def set_owner(self, task_id: str, user_id: UUID) -> None:
+        await self.redis_client.set(self._owner_key(task_id), str(user_id), ex=self._ttl)
+
+    async def get_owner(self, task_id: str) -> UUID | None:
+        owner = await self.redis_client.get(self._owner_key(task_id))
+        return UUID(owner.decode("utf-8")) if owner is not None else None
+
+    @staticmethod
+    def _owner_key(task_id: str) -> str:
+        return IMPORT_OWNER_KEY.format(task_id=task_id)
@@ -0,0 +1,116 @@
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from redis.exceptions import RedisError
+
+from core.chat.entities import ChatDTO
+from infrastructure.redis_pool.pools import redis_pools, run_pipelined
+
+
+logger = logging.getLogger(__name__)
+
+INBOX_TTL = 60 * 60 * 24 * 7
+SUMMARY_TTL = 60 * 60 * 24
+
+TOUCH_EXISTING_INBOXES_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call("EXISTS", key) == 1 then
+        redis.call("ZADD", key, "GT", ARGV[1], ARGV[2])
+    end
+end
+return 0
+"""
+
+
+class InboxRepository:
+    _summary_adapter = TypeAdapter(ChatDTO)
+
+    def __init__(self) -> None:
+        self.redis_client = redis_pools.client("cache")
+        self._touch_script = self.redis_client.register_script(TOUCH_EXISTING_INBOXES_SCRIPT)
+
+    async def get_page(self, user_id: UUID, limit: int, cursor: datetime | None = None) -> list[UUID] | None:
+        key = self._inbox_key(user_id)
+        max_score = f"({cursor.timestamp()}" if cursor is not None else "+inf"
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.exists(key)
+                pipe.zrevrangebyscore(key, max_score, "-inf", start=0, num=limit)
+                pipe.expire(key, INBOX_TTL)
+                exists, chat_ids, _ = await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to read inbox page")
+            return None
+
+        if not exists:
+            return None
+        return [UUID(chat_id.decode("utf-8")) for chat_id in chat_ids]
+
+    async def fill(self, user_id: UUID, scores: dict[UUID, datetime]) -> None:
+        if not scores:
+            return
+
+        key = self._inbox_key(user_id)
+        mapping = {str(chat_id): created_at.timestamp() for chat_id, created_at in scores.items()}
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.zadd(key, mapping, gt=True)
+                pipe.expire(key, INBOX_TTL)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to fill inbox")
+
+    async def touch(self, user_ids: Iterable[UUID], chat_id: UUID, last_message_at: datetime) -> None:
+        keys = [self._inbox_key(user_id) for user_id in user_ids]
+
+        try:
+            if keys:
+                await self._touch_script(keys=keys, args=[last_message_at.timestamp(), str(chat_id)])
+            await self.redis_client.delete(self._summary_key(chat_id))
+        except RedisError:
+            logger.exception("Failed to touch inboxes")
+
+    async def invalidate_summary(self, chat_id: UUID) -> None:
+        try:
+            await self.redis_client.delete(self._summary_key(chat_id))
+        except RedisError:
+            logger.exception("Failed to invalidate chat summary")
+
+    async def get_summaries(self, chat_ids: list[UUID]) -> dict[UUID, ChatDTO]:
+        if not chat_ids:
+            return {}
+
+        try:
+            raw_summaries = await self.redis_client.mget([self._summary_key(chat_id) for chat_id in chat_ids])
+        except RedisError:
+            logger.exception("Failed to read chat summaries")
+            return {}
+
+        return {
+            chat_id: self._summary_adapter.validate_json(raw)
+            for chat_id, raw in zip(chat_ids, raw_summaries, strict=True)
+            if raw is not None
+        }
+
+    async def set_summaries(self, summaries: Iterable[ChatDTO]) -> None:
+        try:
+            await run_pipelined(
+                self.redis_client,
+                summaries,
+                lambda pipe, summary: pipe.set(self._summary_key(summary.id), to_json(summary), ex=SUMMARY_TTL)
+            )
+        except RedisError:
+            logger.exception("Failed to cache chat summaries")
+
+    @staticmethod
+    def _inbox_key(user_id: UUID) -> str:
+        return f"inbox:{user_id}"
+
+    @staticmethod
+    def _summary_key(chat_id: UUID) -> str:
+        return f"chat:summary:{chat_id}"
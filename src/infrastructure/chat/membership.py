@@ -0,0 +1,101 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from infrastructure.redis_pool.pools import redis_pools
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class MembershipCache:
+    def __init__(self, local_size: int, local_ttl: float, redis_ttl: int) -> None:
+        self.redis_client = redis_pools.client("cache")
+        self._local: OrderedDict[UUID, tuple[float, frozenset[UUID]]] = OrderedDict()
+        self._local_size = local_size
+        self._local_ttl = local_ttl
+        self._redis_ttl = redis_ttl
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0}
+
+    async def get_members(self, chat_id: UUID) -> frozenset[UUID] | None:
+        members = self._get_local(chat_id)
+        if members is not None:
+            self._stats["local_hits"] += 1
+            return members
+
+        try:
+            raw_members = await self.redis_client.smembers(self._members_key(chat_id))
+        except RedisError:
+            logger.exception("Failed to read chat members")
+            raw_members = None
+
+        if not raw_members:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["redis_hits"] += 1
+        members = frozenset(UUID(member.decode("utf-8")) for member in raw_members)
+        self._set_local(chat_id, members)
+        return members
+
+    async def fill(self, chat_id: UUID, member_ids: Iterable[UUID]) -> None:
+        members = frozenset(member_ids)
+        if not members:
+            return
+
+        self._set_local(chat_id, members)
+        key = self._members_key(chat_id)
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.sadd(key, *(str(member_id) for member_id in members))
+                pipe.expire(key, self._redis_ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to cache chat members")
+
+    async def invalidate(self, chat_id: UUID) -> None:
+        self._stats["invalidations"] += 1
+        self._local.pop(chat_id, None)
+        try:
+            await self.redis_client.delete(self._members_key(chat_id))
+        except RedisError:
+            logger.exception("Failed to invalidate chat members")
+
+    def stats(self) -> dict[str, int]:
+        return {**self._stats, "local_size": len(self._local)}
+
+    def _get_local(self, chat_id: UUID) -> frozenset[UUID] | None:
+        entry = self._local.get(chat_id)
+        if entry is None:
+            return None
+
+        expires_at, members = entry
+        if expires_at < time.monotonic():
+            del self._local[chat_id]
+            return None
+
+        self._local.move_to_end(chat_id)
+        return members
+
+    def _set_local(self, chat_id: UUID, members: frozenset[UUID]) -> None:
+        self._local[chat_id] = (time.monotonic() + self._local_ttl, members)
+        self._local.move_to_end(chat_id)
+        while len(self._local) > self._local_size:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _members_key(chat_id: UUID) -> str:
+        return f"chat:members:{chat_id}"
+
+
+membership_cache = MembershipCache(
+    local_size=settings.membership_cache.local_size,
+    local_ttl=settings.membership_cache.local_ttl,
+    redis_ttl=settings.membership_cache.redis_ttl
+)
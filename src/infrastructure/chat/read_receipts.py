@@ -0,0 +1,77 @@
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from infrastructure.redis_pool.pools import redis_pools
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "chat:read_receipts"
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+ADD_RECEIPT_SCRIPT = """
+local current = redis.call("HGET", KEYS[1], ARGV[1])
+if current and tonumber(string.match(current, "^(%d+):")) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call("HSET", KEYS[1], ARGV[1], ARGV[2] .. ":" .. ARGV[3])
+return 1
+"""
+
+POP_RECEIPTS_SCRIPT = """
+local receipts = redis.call("HRANDFIELD", KEYS[1], ARGV[1], "WITHVALUES")
+for index = 1, #receipts, 2 do
+    redis.call("HDEL", KEYS[1], receipts[index])
+end
+return receipts
+"""
+
+
+class ReadReceiptBuffer:
+    def __init__(self) -> None:
+        self.redis_client = redis_pools.client("cache")
+        self._add_script = self.redis_client.register_script(ADD_RECEIPT_SCRIPT)
+        self._pop_script = self.redis_client.register_script(POP_RECEIPTS_SCRIPT)
+
+    async def add(self, chat_id: UUID, user_id: UUID, message_id: UUID, created_at: datetime) -> bool:
+        try:
+            await self._add_script(
+                keys=[PENDING_KEY],
+                args=[f"{chat_id}:{user_id}", self._to_score(created_at), str(message_id)]
+            )
+        except RedisError:
+            logger.exception("Failed to buffer read receipt")
+            return False
+        return True
+
+    async def add_many(self, receipts: Iterable[tuple[UUID, UUID, UUID, datetime]]) -> None:
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for chat_id, user_id, message_id, created_at in receipts:
+                await self._add_script(
+                    keys=[PENDING_KEY],
+                    args=[f"{chat_id}:{user_id}", self._to_score(created_at), str(message_id)],
+                    client=pipe
+                )
+            await pipe.execute()
+
+    async def pop_batch(self, count: int) -> list[tuple[UUID, UUID, UUID, datetime]]:
+        flat = await self._pop_script(keys=[PENDING_KEY], args=[count])
+        receipts = []
+        for field, value in zip(flat[::2], flat[1::2], strict=True):
+            chat_id, user_id = field.decode("utf-8").split(":")
+            score, message_id = value.decode("utf-8").split(":")
+            receipts.append((
+                UUID(chat_id),
+                UUID(user_id),
+                UUID(message_id),
+                EPOCH + timedelta(microseconds=int(score))
+            ))
+        return receipts
+
+    @staticmethod
+    def _to_score(created_at: datetime) -> int:
+        return (created_at - EPOCH) // timedelta(microseconds=1)
@@ -0,0 +1,116 @@
+import codecs
+import json
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+
+from core.chat.exceptions import InvalidChatExportException
+
+
+MAX_VALUE_SIZE = 16 * 1024 * 1024
+
+
+class TelegramExportReader:
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self.header: dict[str, Any] = {}
+        self.bytes_read = 0
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    async def messages(self) -> AsyncIterator[dict[str, Any]]:
+        await self._expect("{")
+        while True:
+            char = await self._peek()
+            if char == "}":
+                return
+            if char == ",":
+                self._position += 1
+                continue
+
+            key = await self._decode_value()
+            await self._expect(":")
+            if key == "messages":
+                async for message in self._iter_array():
+                    yield message
+            elif key == "chats":
+                raise InvalidChatExportException("Only single chat exports can be imported")
+            else:
+                self.header[key] = await self._decode_value()
+
+    async def _iter_array(self) -> AsyncIterator[Any]:
+        await self._expect("[")
+        while True:
+            char = await self._peek()
+            if char == "]":
+                self._position += 1
+                return
+            if char == ",":
+                self._position += 1
+                continue
+            yield await self._decode_value()
+
+    async def _expect(self, char: str) -> None:
+        if await self._peek() != char:
+            raise InvalidChatExportException(f"Expected '{char}' in chat export")
+        self._position += 1
+
+    async def _peek(self) -> str:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position].isspace():
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not await self._fill():
+                raise InvalidChatExportException("Unexpected end of chat export")
+
+    async def _decode_value(self) -> Any:
+        await self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                value, end = None, None
+
+            if end is not None and (end < len(self._buffer) or self._exhausted):
+                self._position = end
+                return value
+            if len(self._buffer) - self._position > MAX_VALUE_SIZE or not await self._fill():
+                raise InvalidChatExportException("Malformed chat export")
+
+    async def _fill(self) -> bool:
+        if self._exhausted:
+            return False
+
+        chunk = await anext(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            self.bytes_read += len(chunk)
+            text = self._decoder.decode(chunk)
+
+        self._buffer = self._buffer[self._position:] + text
+        self._position = 0
+        return True
+
+
+def get_message_text(message: dict[str, Any]) -> str:
+    text = message.get("text", "")
+    if isinstance(text, str):
+        return text
+    return "".join(part if isinstance(part, str) else part.get("text", "") for part in text)
+
+
+def get_message_date(message: dict[str, Any], key: str = "date") -> datetime | None:
+    unixtime = message.get(f"{key}_unixtime")
+    if unixtime is not None:
+        return datetime.fromtimestamp(int(unixtime), UTC)
+
+    value = message.get(key)
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).replace(tzinfo=UTC)
@@ -0,0 +1,51 @@
+import logging
+import time
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from infrastructure.redis_pool.pools import redis_pools
+
+
+logger = logging.getLogger(__name__)
+
+TOUCH_TYPING_SCRIPT = """
+local now = tonumber(ARGV[1])
+redis.call("ZADD", KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+redis.call("PEXPIRE", KEYS[1], ARGV[3])
+if redis.call("SET", KEYS[2], 1, "NX", "PX", ARGV[4]) then
+    return redis.call("ZRANGE", KEYS[1], 0, -1)
+end
+return false
+"""
+
+
+class TypingIndicators:
+    def __init__(self, ttl: float, broadcast_interval: float) -> None:
+        self.redis_client = redis_pools.client("presense")
+        self._touch_script = self.redis_client.register_script(TOUCH_TYPING_SCRIPT)
+        self._ttl_ms = int(ttl * 1000)
+        self._broadcast_interval_ms = int(broadcast_interval * 1000)
+
+    async def touch(self, chat_id: UUID, user_id: UUID) -> list[UUID] | None:
+        try:
+            typing_user_ids = await self._touch_script(
+                keys=[self._typing_key(chat_id), self._broadcast_key(chat_id, user_id)],
+                args=[int(time.time() * 1000), str(user_id), self._ttl_ms, self._broadcast_interval_ms]
+            )
+        except RedisError:
+            logger.exception("Failed to record typing indicator")
+            return None
+
+        if not typing_user_ids:
+            return None
+        return [UUID(typing_user_id.decode("utf-8")) for typing_user_id in typing_user_ids]
+
+    @staticmethod
+    def _typing_key(chat_id: UUID) -> str:
+        return f"chat:typing:{chat_id}"
+
+    @staticmethod
+    def _broadcast_key(chat_id: UUID, user_id: UUID) -> str:
+        return f"chat:typing:broadcast:{chat_id}:{user_id}"
@@ -8,6 +8,12 @@ engine = create_async_engine(settings.db.database_url)
 
 Session = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
+AutocommitSession = async_sessionmaker(
+    bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+    expire_on_commit=False,
+    class_=AsyncSession
+)
+
 
 class Base(DeclarativeBase):
     pass
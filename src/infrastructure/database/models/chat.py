@@ -1,14 +1,38 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime as PGDateTime, Enum as PGEnum, ForeignKey, PrimaryKeyConstraint, String, func
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime as PGDateTime,
+    Enum as PGEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    Sequence,
+    String,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.chat.enums import MessageTypeEnum
 from infrastructure.database.database import Base
 
 
+MESSAGE_SEARCH_VECTOR = (
+    "to_tsvector('russian', coalesce(content, '')) || to_tsvector('english', coalesce(content, ''))"
+)
+
+chat_change_seq = Sequence("chat_change_seq", metadata=Base.metadata)
+CHANGE_SEQ_LOCK_NAMESPACE = 1667785076
+
+
 class ChatModel(Base):
     __tablename__ = "chats"
 
@@ -45,11 +69,32 @@ class ChatModel(Base):
         default=None
     )
 
+    pair_min_user_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        nullable=True,
+        default=None
+    )
+
+    pair_max_user_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        nullable=True,
+        default=None
+    )
+
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=func.next_chat_change_seq()
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         PGDateTime(timezone=True),
         server_default=func.now()
     )
 
+    __table_args__ = (
+        Index("uq_chats_private_pair", "pair_min_user_id", "pair_max_user_id", unique=True),
+    )
+
 
 class ChatParticipantModel(Base):
     __tablename__ = "chat_participants"
@@ -70,6 +115,17 @@ class ChatParticipantModel(Base):
         default=None
     )
 
+    unread_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0"
+    )
+
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=func.next_chat_change_seq()
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         PGDateTime(timezone=True),
         server_default=func.now()
@@ -77,6 +133,7 @@ class ChatParticipantModel(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint("chat_id", "user_id", name="pk_chat_user"),
+        Index("ix_chat_participants_chat_id_change_seq", "chat_id", "change_seq"),
     )
 
 
@@ -119,6 +176,7 @@ class MessageModel(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         PGDateTime(timezone=True),
+        primary_key=True,
         server_default=func.now()
     )
 
@@ -127,3 +185,219 @@ class MessageModel(Base):
         nullable=True,
         default=None
     )
+
+    reactions: Mapped[dict[str, int]] = mapped_column(
+        JSONB,
+        default=dict,
+        server_default=text("'{}'::jsonb")
+    )
+
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=func.next_chat_change_seq()
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(MESSAGE_SEARCH_VECTOR, persisted=True),
+        deferred=True
+    )
+
+    __table_args__ = (
+        Index("ix_messages_chat_id_created_at", "chat_id", "created_at"),
+        Index("ix_messages_chat_id_change_seq", "chat_id", "change_seq"),
+        Index("ix_messages_chat_id_search_vector", "chat_id", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class MessageReactionModel(Base):
+    __tablename__ = "message_reactions"
+
+    message_id: Mapped[UUID] = mapped_column(
+        PGUUID
+    )
+
+    message_created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True)
+    )
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("profiles.id", ondelete="CASCADE")
+    )
+
+    emoji: Mapped[str] = mapped_column(
+        String
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("message_id", "user_id", "emoji", name="pk_message_user_emoji"),
+        Index("ix_message_reactions_message_created_at", "message_created_at"),
+    )
+
+
+class MessageTombstoneModel(Base):
+    __tablename__ = "message_tombstones"
+
+    message_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        primary_key=True
+    )
+
+    chat_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("chats.id", ondelete="CASCADE")
+    )
+
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=func.next_chat_change_seq()
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_message_tombstones_chat_id_change_seq", "chat_id", "change_seq"),
+    )
+
+
+class MessageArchiveSegmentModel(Base):
+    __tablename__ = "message_archive_segments"
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        primary_key=True,
+        default=uuid4
+    )
+
+    chat_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("chats.id", ondelete="CASCADE")
+    )
+
+    object_key: Mapped[str] = mapped_column(
+        String
+    )
+
+    first_created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True)
+    )
+
+    last_created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True)
+    )
+
+    message_count: Mapped[int] = mapped_column(
+        Integer
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_message_archive_segments_chat_id_last_created_at", "chat_id", "last_created_at"),
+    )
+
+
+event.listen(
+    MessageModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gin")
+)
+
+event.listen(
+    MessageModel.__table__,
+    "after_create",
+    DDL(
+        """
+        DO $$
+        DECLARE
+            month_start timestamptz := date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC';
+        BEGIN
+            FOR month_offset IN 0..3 LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF messages FOR VALUES FROM (%L) TO (%L)',
+                    'messages_' || to_char(month_start AT TIME ZONE 'UTC', '"y"YYYY"m"MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END
+        $$
+        """
+    )
+)
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(
+        f"""
+        CREATE OR REPLACE FUNCTION next_chat_change_seq() RETURNS bigint AS $$
+        BEGIN
+            IF current_setting('chat.change_seq_locked', true) IS DISTINCT FROM 'on' THEN
+                PERFORM pg_advisory_xact_lock_shared({CHANGE_SEQ_LOCK_NAMESPACE}, last_value::bit(32)::integer)
+                FROM chat_change_seq;
+                PERFORM set_config('chat.change_seq_locked', 'on', true);
+            END IF;
+            RETURN nextval('chat_change_seq');
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+)
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_seq := next_chat_change_seq();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+)
+
+event.listen(
+    ChatModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER chats_bump_change_seq BEFORE UPDATE ON chats "
+        "FOR EACH ROW EXECUTE FUNCTION bump_change_seq()"
+    )
+)
+
+event.listen(
+    MessageModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER messages_bump_change_seq BEFORE UPDATE ON messages "
+        "FOR EACH ROW EXECUTE FUNCTION bump_change_seq()"
+    )
+)
+
+event.listen(
+    ChatParticipantModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER chat_participants_bump_change_seq BEFORE UPDATE ON chat_participants "
+        "FOR EACH ROW EXECUTE FUNCTION bump_change_seq()"
+    )
+)
@@ -1,7 +1,16 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime as PGDateTime, ForeignKey, Integer, PrimaryKeyConstraint, SmallInteger, String, func
+from sqlalchemy import (
+    DateTime as PGDateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    SmallInteger,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -43,6 +52,18 @@ class PostModel(Base):
         back_populates="post"
     )
 
+    likes_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0"
+    )
+
+    comments_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0"
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         PGDateTime(timezone=True),
         nullable=False,
@@ -55,6 +76,10 @@ class PostModel(Base):
         onupdate=func.now(),
     )
 
+    __table_args__ = (
+        Index("ix_posts_author_id_created_at", "author_id", "created_at"),
+    )
+
 
 class PostImageModel(Base):
     __tablename__ = "post_images"
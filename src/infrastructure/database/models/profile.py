@@ -1,7 +1,17 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import Date as PGDate, DateTime as PGDateTime, Enum as PGEnum, ForeignKey, Index, String, func
+from sqlalchemy import (
+    Date as PGDate,
+    DateTime as PGDateTime,
+    Enum as PGEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -60,6 +70,12 @@ class ProfileModel(Base):
         nullable=True,
     )
 
+    followers_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0"
+    )
+
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="profile",
@@ -90,3 +106,29 @@ class ProfileModel(Base):
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
+
+
+class FollowModel(Base):
+    __tablename__ = "follows"
+
+    follower_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("profiles.id", ondelete="CASCADE")
+    )
+
+    followee_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("profiles.id", ondelete="CASCADE")
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        PGDateTime(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("follower_id", "followee_id", name="pk_follower_followee"),
+        Index("ix_follows_followee_id_follower_id", "followee_id", "follower_id"),
+        Index("ix_follows_followee_id_created_at_follower_id", "followee_id", "created_at", "follower_id"),
+        Index("ix_follows_follower_id_created_at_followee_id", "follower_id", "created_at", "followee_id"),
+    )
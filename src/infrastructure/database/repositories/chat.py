@@ -1,23 +1,66 @@
-from datetime import datetime
-from uuid import UUID
+from collections import defaultdict
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
 
-from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy import (
+    Integer,
+    Row,
+    String,
+    Text,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+    union,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, REGCONFIG, UUID as PGUUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from core.chat.entities import (
+    ArchivedMessageDTO,
     ChatCreationDTO,
     ChatDTO,
+    ChatReadStateDTO,
+    MessageChangeDTO,
     MessageCreationDTO,
     MessageDTO,
+    MessageReactionDTO,
+    MessageSearchHitDTO,
     MessageSenderDTO,
+    MessageTombstoneDTO,
     MessageUpdateDTO,
 )
-from infrastructure.database.models.chat import ChatModel, ChatParticipantModel, MessageModel
+from infrastructure.database.models.chat import (
+    CHANGE_SEQ_LOCK_NAMESPACE,
+    ChatModel,
+    ChatParticipantModel,
+    MessageArchiveSegmentModel,
+    MessageModel,
+    MessageReactionModel,
+    MessageTombstoneModel,
+)
 from infrastructure.database.models.profile import ProfileModel
 from settings import settings
 
 
+IMPORTED_MESSAGE_COLUMNS = ("id", "chat_id", "sender_id", "type", "content", "is_edited", "is_deleted", "created_at")
+
+
 class ChatRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -41,21 +84,46 @@ class ChatRepository:
 
         return chat
 
+    async def delete_chat(self, chat_id: UUID) -> None:
+        await self.session.execute(delete(ChatModel).where(ChatModel.id == chat_id))
+
     async def get_personal_chat(self, user_ids: set[UUID]) -> ChatModel | None:
-        user_ids_list = list(user_ids)
+        pair_min_user_id, pair_max_user_id = sorted(user_ids)
         stmt = (
             select(ChatModel)
-            .join(ChatParticipantModel)
             .where(
-                ChatModel.is_group == False,
-                ChatParticipantModel.user_id.in_(user_ids_list)
+                ChatModel.pair_min_user_id == pair_min_user_id,
+                ChatModel.pair_max_user_id == pair_max_user_id
             )
-            .group_by(ChatModel.id)
-            .having(func.count(ChatParticipantModel.user_id) == 2)
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def create_personal_chat(self, user_ids: set[UUID]) -> ChatModel | None:
+        pair_min_user_id, pair_max_user_id = sorted(user_ids)
+        stmt = (
+            pg_insert(ChatModel)
+            .values(
+                id=uuid4(),
+                is_group=False,
+                pair_min_user_id=pair_min_user_id,
+                pair_max_user_id=pair_max_user_id
+            )
+            .on_conflict_do_nothing(index_elements=[ChatModel.pair_min_user_id, ChatModel.pair_max_user_id])
+            .returning(ChatModel)
+        )
+        result = await self.session.execute(stmt)
+        chat = result.scalar_one_or_none()
+        if chat is None:
+            return None
+
+        await self.session.execute(
+            insert(ChatParticipantModel),
+            [{"chat_id": chat.id, "user_id": user_id} for user_id in (pair_min_user_id, pair_max_user_id)]
+        )
+
+        return chat
+
     async def get_chat_by_id(self, chat_id: UUID) -> ChatModel | None:
         stmt = select(ChatModel).where(ChatModel.id == chat_id)
         result = await self.session.execute(stmt)
@@ -70,34 +138,12 @@ class ChatRepository:
 
         current_participant = aliased(ChatParticipantModel)
 
-        last_read_created_at = (
-            select(MessageModel.created_at)
-            .where(
-                MessageModel.id == current_participant.last_read_message_id
-            )
-            .correlate(current_participant)
-            .scalar_subquery()
-        )
-
-        unread_count = (
-            select(func.count(MessageModel.id))
-            .where(
-                MessageModel.chat_id == ChatModel.id,
-                or_(
-                    current_participant.last_read_message_id.is_(None),
-                    MessageModel.created_at > last_read_created_at
-                )
-            )
-            .correlate(ChatModel, current_participant)
-            .scalar_subquery()
-        )
-
         has_unread = exists(
             select(ChatParticipantModel)
             .where(
                 ChatParticipantModel.chat_id == ChatModel.id,
                 ChatParticipantModel.user_id != user_id,
-                ChatParticipantModel.last_read_message_id != ChatModel.last_message_id
+                ChatParticipantModel.unread_count > 0
             )
         )
 
@@ -106,7 +152,7 @@ class ChatRepository:
                 ChatModel,
                 MessageModel,
                 ProfileModel,
-                unread_count.label("unread_count"),
+                current_participant.unread_count.label("unread_count"),
                 has_unread.label("has_unread")
             )
             .join(
@@ -149,6 +195,53 @@ class ChatRepository:
             for chat, message, sender, unread_count, has_unread in rows
         ]
 
+    async def get_user_chat_scores(self, user_id: UUID) -> dict[UUID, datetime]:
+        stmt = (
+            select(ChatModel.id, MessageModel.created_at)
+            .join(ChatParticipantModel, ChatModel.id == ChatParticipantModel.chat_id)
+            .join(MessageModel, ChatModel.last_message_id == MessageModel.id)
+            .where(ChatParticipantModel.user_id == user_id)
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def get_chat_summaries(self, chat_ids: list[UUID]) -> list[ChatDTO]:
+        stmt = (
+            select(ChatModel, MessageModel, ProfileModel)
+            .outerjoin(MessageModel, ChatModel.last_message_id == MessageModel.id)
+            .outerjoin(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(ChatModel.id.in_(chat_ids))
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return [
+            self._build_chat_dto(chat, message, sender, 0, False)
+            for chat, message, sender in rows
+        ]
+
+    async def get_unread_counters(self, chat_ids: list[UUID], user_id: UUID) -> dict[UUID, tuple[int, bool]]:
+        other_participant = aliased(ChatParticipantModel)
+
+        has_unread = exists(
+            select(other_participant)
+            .where(
+                other_participant.chat_id == ChatParticipantModel.chat_id,
+                other_participant.user_id != user_id,
+                other_participant.unread_count > 0
+            )
+        )
+
+        stmt = (
+            select(ChatParticipantModel.chat_id, ChatParticipantModel.unread_count, has_unread.label("has_unread"))
+            .where(
+                ChatParticipantModel.chat_id.in_(chat_ids),
+                ChatParticipantModel.user_id == user_id
+            )
+        )
+        result = await self.session.execute(stmt)
+        return {chat_id: (unread_count, has_unread) for chat_id, unread_count, has_unread in result.all()}
+
     async def create_message(self, message_data: MessageCreationDTO) -> MessageModel:
         message = MessageModel(
             sender_id=message_data.sender_id,
@@ -161,6 +254,177 @@ class ChatRepository:
 
         return message
 
+    async def send_message(self, message_data: MessageCreationDTO) -> tuple[Row, ProfileModel, list[UUID]] | None:
+        membership = (
+            select(ChatParticipantModel.chat_id)
+            .where(
+                ChatParticipantModel.chat_id == message_data.chat_id,
+                ChatParticipantModel.user_id == message_data.sender_id
+            )
+            .cte("membership")
+        )
+
+        inserted_message = (
+            insert(MessageModel)
+            .from_select(
+                ["id", "chat_id", "sender_id", "type", "content", "is_edited", "is_deleted"],
+                select(
+                    literal(uuid4(), MessageModel.id.type),
+                    membership.c.chat_id,
+                    literal(message_data.sender_id, MessageModel.sender_id.type),
+                    cast(literal(message_data.type, MessageModel.type.type), MessageModel.type.type),
+                    literal(message_data.content, MessageModel.content.type),
+                    false(),
+                    false()
+                )
+            )
+            .returning(
+                MessageModel.id,
+                MessageModel.chat_id,
+                MessageModel.sender_id,
+                MessageModel.type,
+                MessageModel.content,
+                MessageModel.is_edited,
+                MessageModel.is_deleted,
+                MessageModel.created_at,
+                MessageModel.edited_at,
+                MessageModel.reactions
+            )
+            .cte("inserted_message")
+        )
+
+        chat_update = (
+            update(ChatModel)
+            .where(ChatModel.id == inserted_message.c.chat_id)
+            .values(last_message_id=inserted_message.c.id)
+            .returning(ChatModel.id)
+            .cte("chat_update")
+        )
+
+        sender_read = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == inserted_message.c.chat_id,
+                ChatParticipantModel.user_id == message_data.sender_id
+            )
+            .values(last_read_message_id=inserted_message.c.id, unread_count=0)
+            .returning(ChatParticipantModel.user_id)
+            .cte("sender_read")
+        )
+
+        recipients = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == inserted_message.c.chat_id,
+                ChatParticipantModel.user_id != message_data.sender_id
+            )
+            .values(unread_count=ChatParticipantModel.unread_count + 1)
+            .returning(ChatParticipantModel.user_id)
+            .cte("recipients")
+        )
+
+        recipient_ids = select(func.array_agg(recipients.c.user_id)).scalar_subquery()
+
+        stmt = (
+            select(inserted_message, ProfileModel, recipient_ids.label("recipient_ids"))
+            .join(ProfileModel, ProfileModel.id == inserted_message.c.sender_id)
+            .add_cte(chat_update, sender_read)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        sender = row.ProfileModel
+        participant_ids = [message_data.sender_id, *(row.recipient_ids or [])]
+
+        return row, sender, participant_ids
+
+    async def create_messages(self, messages: list[MessageCreationDTO]) -> list[MessageModel]:
+        stmt = (
+            insert(MessageModel)
+            .values([
+                {
+                    "id": uuid4(),
+                    "chat_id": message_data.chat_id,
+                    "sender_id": message_data.sender_id,
+                    "type": message_data.type,
+                    "content": message_data.content,
+                    "is_edited": False,
+                    "is_deleted": False,
+                    "created_at": func.now() + timedelta(microseconds=index)
+                }
+                for index, message_data in enumerate(messages)
+            ])
+            .returning(MessageModel)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda message: message.created_at)
+
+    async def advance_chats_after_batch(self, sender_id: UUID, batches: list[tuple[UUID, UUID, int]]) -> None:
+        sent = (
+            values(
+                column("chat_id", PGUUID),
+                column("last_message_id", PGUUID),
+                column("message_count", Integer),
+                name="sent"
+            )
+            .data(batches)
+        )
+
+        await self.session.execute(
+            update(ChatModel)
+            .where(ChatModel.id == sent.c.chat_id)
+            .values(last_message_id=sent.c.last_message_id)
+        )
+
+        is_sender = ChatParticipantModel.user_id == sender_id
+        await self.session.execute(
+            update(ChatParticipantModel)
+            .where(ChatParticipantModel.chat_id == sent.c.chat_id)
+            .values(
+                unread_count=case(
+                    (is_sender, 0),
+                    else_=ChatParticipantModel.unread_count + sent.c.message_count
+                ),
+                last_read_message_id=case(
+                    (is_sender, sent.c.last_message_id),
+                    else_=ChatParticipantModel.last_read_message_id
+                )
+            )
+        )
+
+    async def copy_messages(self, records: list[tuple]) -> None:
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            MessageModel.__tablename__,
+            records=records,
+            columns=IMPORTED_MESSAGE_COLUMNS
+        )
+
+    async def complete_import(self, chat_id: UUID, last_message_id: UUID, last_message_at: datetime) -> None:
+        current_last_message = aliased(MessageModel)
+        await self.session.execute(
+            update(ChatModel)
+            .where(
+                ChatModel.id == chat_id,
+                ~exists().where(
+                    current_last_message.id == ChatModel.last_message_id,
+                    current_last_message.created_at > last_message_at
+                )
+            )
+            .values(last_message_id=last_message_id)
+        )
+        await self.session.execute(
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.last_read_message_id.is_(None)
+            )
+            .values(last_read_message_id=last_message_id)
+        )
+
     async def update_chat_last_message(self, chat_id: UUID, message_id: UUID) -> None:
         stmt = (
             update(ChatModel)
@@ -172,11 +436,12 @@ class ChatRepository:
     async def get_chat_history(
         self,
         chat_id: UUID,
+        user_id: UUID,
         limit: int = 50,
         cursor: datetime | None = None
     ) -> list[MessageDTO]:
         stmt = (
-            select(MessageModel, ProfileModel)
+            select(MessageModel, ProfileModel, self._my_reactions(user_id))
             .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
             .where(MessageModel.chat_id == chat_id)
             .order_by(MessageModel.created_at.desc())
@@ -190,10 +455,136 @@ class ChatRepository:
         rows = result.all()
 
         return [
-            self._build_message_dto(message, sender)
-            for message, sender in rows
+            self._build_message_dto(message, sender, my_reactions)
+            for message, sender, my_reactions in rows
+        ]
+
+    async def get_chat_history_after(
+        self,
+        chat_id: UUID,
+        user_id: UUID,
+        limit: int,
+        after: datetime
+    ) -> list[MessageDTO]:
+        stmt = (
+            select(MessageModel, ProfileModel, self._my_reactions(user_id))
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.created_at > after
+            )
+            .order_by(MessageModel.created_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return [
+            self._build_message_dto(message, sender, my_reactions)
+            for message, sender, my_reactions in reversed(rows)
+        ]
+
+    async def get_chat_history_around(
+        self,
+        chat_id: UUID,
+        user_id: UUID,
+        anchor_id: UUID,
+        older_limit: int,
+        newer_limit: int
+    ) -> list[MessageDTO]:
+        anchor_created_at = (
+            select(MessageModel.created_at)
+            .where(
+                MessageModel.id == anchor_id,
+                MessageModel.chat_id == chat_id
+            )
+            .scalar_subquery()
+        )
+
+        older = (
+            select(MessageModel.id, MessageModel.created_at)
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.created_at <= anchor_created_at
+            )
+            .order_by(MessageModel.created_at.desc())
+            .limit(older_limit)
+        )
+        newer = (
+            select(MessageModel.id, MessageModel.created_at)
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.created_at > anchor_created_at
+            )
+            .order_by(MessageModel.created_at)
+            .limit(newer_limit)
+        )
+        window = union_all(older, newer).subquery("history_window")
+
+        stmt = (
+            select(MessageModel, ProfileModel, self._my_reactions(user_id))
+            .join(
+                window,
+                and_(
+                    MessageModel.id == window.c.id,
+                    MessageModel.created_at == window.c.created_at
+                )
+            )
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(MessageModel.chat_id == chat_id)
+            .order_by(MessageModel.created_at.desc())
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return [
+            self._build_message_dto(message, sender, my_reactions)
+            for message, sender, my_reactions in rows
         ]
 
+    async def get_recent_messages(
+        self,
+        chat_ids: list[UUID],
+        user_id: UUID,
+        limit: int
+    ) -> dict[UUID, list[MessageDTO]]:
+        prefetched_chats = (
+            values(column("chat_id", PGUUID), name="prefetched_chats")
+            .data([(chat_id,) for chat_id in chat_ids])
+        )
+
+        recent = (
+            select(MessageModel.id, MessageModel.created_at)
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(MessageModel.chat_id == prefetched_chats.c.chat_id)
+            .order_by(MessageModel.created_at.desc())
+            .limit(limit)
+            .lateral("recent")
+        )
+
+        stmt = (
+            select(MessageModel, ProfileModel, self._my_reactions(user_id))
+            .select_from(prefetched_chats)
+            .join(recent, true())
+            .join(
+                MessageModel,
+                and_(
+                    MessageModel.id == recent.c.id,
+                    MessageModel.created_at == recent.c.created_at
+                )
+            )
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .order_by(MessageModel.chat_id, MessageModel.created_at.desc())
+        )
+        result = await self.session.execute(stmt)
+
+        recent_messages = defaultdict(list)
+        for message, sender, my_reactions in result.all():
+            recent_messages[message.chat_id].append(self._build_message_dto(message, sender, my_reactions))
+        return recent_messages
+
     async def check_user_is_participant(
         self,
         chat_id: UUID,
@@ -209,6 +600,45 @@ class ChatRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
+    async def get_participant_ids(self, chat_id: UUID) -> list[UUID]:
+        stmt = (
+            select(ChatParticipantModel.user_id)
+            .where(ChatParticipantModel.chat_id == chat_id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_participant_ids_by_chat(self, chat_ids: list[UUID]) -> dict[UUID, list[UUID]]:
+        stmt = (
+            select(ChatParticipantModel.chat_id, ChatParticipantModel.user_id)
+            .where(ChatParticipantModel.chat_id.in_(chat_ids))
+        )
+        result = await self.session.execute(stmt)
+
+        participants = defaultdict(list)
+        for chat_id, user_id in result.all():
+            participants[chat_id].append(user_id)
+        return dict(participants)
+
+    async def get_forwardable_messages(self, message_ids: list[UUID], user_id: UUID) -> list[MessageModel]:
+        stmt = (
+            select(MessageModel)
+            .join(
+                ChatParticipantModel,
+                and_(
+                    ChatParticipantModel.chat_id == MessageModel.chat_id,
+                    ChatParticipantModel.user_id == user_id
+                )
+            )
+            .where(
+                MessageModel.id.in_(message_ids),
+                MessageModel.is_deleted.is_(False)
+            )
+            .order_by(MessageModel.created_at)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_personal_chat_interlocutors(self, chat_ids: list[UUID], user_id: UUID) -> dict[UUID, ProfileModel]:
         stmt = (
             select(ChatParticipantModel, ProfileModel)
@@ -243,54 +673,722 @@ class ChatRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def mark_as_read(
-        self,
-        chat_id: UUID,
-        user_id: UUID,
-        message_id: UUID
-    ) -> None:
-        stmt = (
-            update(ChatParticipantModel)
-            .where(
-                ChatParticipantModel.chat_id == chat_id,
-                ChatParticipantModel.user_id == user_id
+    async def add_reaction(self, message_id: UUID, user_id: UUID, emoji: str) -> Row | None:
+        target = (
+            select(MessageModel.id, MessageModel.created_at, MessageModel.chat_id, MessageModel.reactions)
+            .join(
+                ChatParticipantModel,
+                and_(
+                    ChatParticipantModel.chat_id == MessageModel.chat_id,
+                    ChatParticipantModel.user_id == user_id
+                )
             )
-            .values(last_read_message_id=message_id)
+            .where(MessageModel.id == message_id)
+            .cte("target")
         )
-        await self.session.execute(stmt)
 
-    async def delete_message_for_me(self, message_id: UUID) -> None:
-        stmt = (
+        inserted = (
+            pg_insert(MessageReactionModel)
+            .from_select(
+                ["message_id", "message_created_at", "user_id", "emoji"],
+                select(
+                    target.c.id,
+                    target.c.created_at,
+                    literal(user_id, MessageReactionModel.user_id.type),
+                    literal(emoji, MessageReactionModel.emoji.type)
+                )
+            )
+            .on_conflict_do_nothing()
+            .returning(MessageReactionModel.message_id, MessageReactionModel.message_created_at)
+            .cte("inserted")
+        )
+
+        updated = (
             update(MessageModel)
-            .where(MessageModel.id == message_id)
-            .values(is_deleted=True)
+            .where(
+                MessageModel.id == inserted.c.message_id,
+                MessageModel.created_at == inserted.c.message_created_at
+            )
+            .values(reactions=self._shift_reaction_count(emoji, 1))
+            .returning(MessageModel.reactions)
+            .cte("updated")
         )
-        await self.session.execute(stmt)
 
-    async def delete_message_for_all(self, message_id: UUID) -> None:
-        stmt = (
-            delete(MessageModel)
-            .where(MessageModel.id == message_id)
+        stmt = select(
+            target.c.chat_id,
+            func.coalesce(select(updated.c.reactions).scalar_subquery(), target.c.reactions).label("reactions"),
+            exists(select(inserted.c.message_id)).label("is_changed")
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def remove_reaction(self, message_id: UUID, user_id: UUID, emoji: str) -> Row | None:
+        removed = (
+            delete(MessageReactionModel)
+            .where(
+                MessageReactionModel.message_id == message_id,
+                MessageReactionModel.user_id == user_id,
+                MessageReactionModel.emoji == emoji
+            )
+            .returning(MessageReactionModel.message_id, MessageReactionModel.message_created_at)
+            .cte("removed")
         )
-        await self.session.execute(stmt)
 
-    async def get_last_read_message_id(self, chat_id: UUID, user_id: UUID) -> UUID | None:
         stmt = (
-            select(ChatParticipantModel.last_read_message_id)
+            update(MessageModel)
             .where(
-                ChatParticipantModel.chat_id == chat_id,
-                ChatParticipantModel.user_id == user_id
+                MessageModel.id == removed.c.message_id,
+                MessageModel.created_at == removed.c.message_created_at
             )
+            .values(
+                reactions=case(
+                    (
+                        func.coalesce(MessageModel.reactions[emoji].astext.cast(Integer), 0) <= 1,
+                        MessageModel.reactions.op("-", return_type=JSONB)(literal(emoji, String))
+                    ),
+                    else_=self._shift_reaction_count(emoji, -1)
+                )
+            )
+            .returning(MessageModel.chat_id, MessageModel.reactions)
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def get_message_created_at(self, chat_id: UUID, message_id: UUID) -> datetime | None:
+        stmt = select(MessageModel.created_at).where(
+            MessageModel.id == message_id,
+            MessageModel.chat_id == chat_id
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    @staticmethod
-    def _build_chat_dto(
-        chat: ChatModel,
-        message: MessageModel | None,
-        sender: ProfileModel | None,
-        unread_count: int,
+    async def mark_as_read(
+        self,
+        chat_id: UUID,
+        user_id: UUID,
+        message_id: UUID
+    ) -> None:
+        read_message_created_at = (
+            select(MessageModel.created_at)
+            .where(MessageModel.id == message_id)
+            .scalar_subquery()
+        )
+        unread_count = (
+            select(func.count(MessageModel.id))
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.created_at > read_message_created_at
+            )
+            .scalar_subquery()
+        )
+
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.user_id == user_id
+            )
+            .values(
+                last_read_message_id=message_id,
+                unread_count=unread_count
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def apply_read_receipts(self, receipts: list[tuple[UUID, UUID, UUID]]) -> int:
+        pending = (
+            values(
+                column("chat_id", PGUUID),
+                column("user_id", PGUUID),
+                column("message_id", PGUUID),
+                name="pending"
+            )
+            .data(receipts)
+        )
+
+        latest = (
+            select(pending.c.chat_id, pending.c.user_id, MessageModel.id, MessageModel.created_at)
+            .join(
+                MessageModel,
+                and_(
+                    MessageModel.id == pending.c.message_id,
+                    MessageModel.chat_id == pending.c.chat_id
+                )
+            )
+            .distinct(pending.c.chat_id, pending.c.user_id)
+            .order_by(pending.c.chat_id, pending.c.user_id, MessageModel.created_at.desc())
+            .subquery("latest")
+        )
+
+        current_read = aliased(MessageModel)
+        unread = aliased(MessageModel)
+
+        unread_count = (
+            select(func.count(unread.id))
+            .where(
+                unread.chat_id == latest.c.chat_id,
+                unread.created_at > latest.c.created_at
+            )
+            .scalar_subquery()
+        )
+
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == latest.c.chat_id,
+                ChatParticipantModel.user_id == latest.c.user_id,
+                ~exists().where(
+                    current_read.id == ChatParticipantModel.last_read_message_id,
+                    current_read.created_at >= latest.c.created_at
+                )
+            )
+            .values(
+                last_read_message_id=latest.c.id,
+                unread_count=unread_count
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def mark_all_as_read(self, user_id: UUID) -> None:
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == ChatModel.id,
+                ChatParticipantModel.user_id == user_id,
+                ChatModel.last_message_id.is_not(None),
+                or_(
+                    ChatParticipantModel.last_read_message_id.is_distinct_from(ChatModel.last_message_id),
+                    ChatParticipantModel.unread_count != 0
+                )
+            )
+            .values(
+                last_read_message_id=ChatModel.last_message_id,
+                unread_count=0
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def increment_unread_count(self, chat_id: UUID, sender_id: UUID | None, value: int = 1) -> None:
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.user_id.is_distinct_from(sender_id)
+            )
+            .values(unread_count=ChatParticipantModel.unread_count + value)
+        )
+        await self.session.execute(stmt)
+
+    async def decrement_unread_count(self, chat_id: UUID, sender_id: UUID | None, created_at: datetime) -> None:
+        last_read_created_at = (
+            select(MessageModel.created_at)
+            .where(MessageModel.id == ChatParticipantModel.last_read_message_id)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.user_id.is_distinct_from(sender_id),
+                ChatParticipantModel.unread_count > 0,
+                or_(
+                    ChatParticipantModel.last_read_message_id.is_(None),
+                    last_read_created_at < created_at
+                )
+            )
+            .values(unread_count=ChatParticipantModel.unread_count - 1)
+        )
+        await self.session.execute(stmt)
+
+    async def get_chat_ids_batch(self, limit: int, after: UUID | None = None) -> list[UUID]:
+        stmt = (
+            select(ChatModel.id)
+            .order_by(ChatModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(ChatModel.id > after)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def recount_unread_counts(self, chat_ids: list[UUID]) -> int:
+        last_read = aliased(MessageModel)
+        unread = aliased(MessageModel)
+
+        actual_counts = (
+            select(
+                ChatParticipantModel.chat_id,
+                ChatParticipantModel.user_id,
+                func.count(unread.id).label("unread_count")
+            )
+            .outerjoin(last_read, last_read.id == ChatParticipantModel.last_read_message_id)
+            .outerjoin(
+                unread,
+                and_(
+                    unread.chat_id == ChatParticipantModel.chat_id,
+                    or_(
+                        ChatParticipantModel.last_read_message_id.is_(None),
+                        unread.created_at > last_read.created_at
+                    )
+                )
+            )
+            .where(ChatParticipantModel.chat_id.in_(chat_ids))
+            .group_by(ChatParticipantModel.chat_id, ChatParticipantModel.user_id)
+            .subquery()
+        )
+
+        stmt = (
+            update(ChatParticipantModel)
+            .where(
+                ChatParticipantModel.chat_id == actual_counts.c.chat_id,
+                ChatParticipantModel.user_id == actual_counts.c.user_id,
+                ChatParticipantModel.unread_count != actual_counts.c.unread_count
+            )
+            .values(unread_count=actual_counts.c.unread_count)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def get_chat_ids_with_messages_before(
+        self,
+        before: datetime,
+        limit: int,
+        after: UUID | None = None
+    ) -> list[UUID]:
+        stmt = (
+            select(ChatModel.id)
+            .where(
+                exists().where(
+                    MessageModel.chat_id == ChatModel.id,
+                    MessageModel.created_at < before
+                )
+            )
+            .order_by(ChatModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(ChatModel.id > after)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_archivable_messages(
+        self,
+        chat_id: UUID,
+        before: datetime,
+        limit: int
+    ) -> list[ArchivedMessageDTO]:
+        pinned_message_ids = union(
+            select(ChatModel.last_message_id)
+            .where(
+                ChatModel.id == chat_id,
+                ChatModel.last_message_id.is_not(None)
+            ),
+            select(ChatParticipantModel.last_read_message_id)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.last_read_message_id.is_not(None)
+            )
+        )
+
+        stmt = (
+            select(MessageModel)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.created_at < before,
+                MessageModel.id.not_in(pinned_message_ids)
+            )
+            .order_by(MessageModel.created_at, MessageModel.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+
+        return [
+            ArchivedMessageDTO(
+                id=message.id,
+                chat_id=message.chat_id,
+                sender_id=message.sender_id,
+                type=message.type,
+                content=message.content,
+                is_edited=message.is_edited,
+                is_deleted=message.is_deleted,
+                created_at=message.created_at,
+                edited_at=message.edited_at,
+                reactions=message.reactions
+            )
+            for message in result.scalars().all()
+        ]
+
+    async def add_archive_segment(
+        self,
+        chat_id: UUID,
+        object_key: str,
+        messages: list[ArchivedMessageDTO]
+    ) -> None:
+        self.session.add(
+            MessageArchiveSegmentModel(
+                chat_id=chat_id,
+                object_key=object_key,
+                first_created_at=messages[0].created_at,
+                last_created_at=messages[-1].created_at,
+                message_count=len(messages)
+            )
+        )
+        await self.session.flush()
+
+    async def delete_archived_messages(self, chat_id: UUID, messages: list[ArchivedMessageDTO]) -> None:
+        keys = [(message.id, message.created_at) for message in messages]
+        await self.session.execute(
+            delete(MessageReactionModel)
+            .where(tuple_(MessageReactionModel.message_id, MessageReactionModel.message_created_at).in_(keys))
+        )
+        stmt = (
+            delete(MessageModel)
+            .where(
+                MessageModel.chat_id == chat_id,
+                tuple_(MessageModel.id, MessageModel.created_at).in_(keys)
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def get_archive_segments(
+        self,
+        chat_id: UUID,
+        before: datetime | None,
+        after: datetime | None,
+        limit: int,
+        newest_first: bool = True
+    ) -> list[MessageArchiveSegmentModel]:
+        stmt = (
+            select(MessageArchiveSegmentModel)
+            .where(MessageArchiveSegmentModel.chat_id == chat_id)
+            .order_by(
+                MessageArchiveSegmentModel.last_created_at.desc()
+                if newest_first
+                else MessageArchiveSegmentModel.first_created_at
+            )
+            .limit(limit)
+        )
+        if before is not None:
+            stmt = stmt.where(MessageArchiveSegmentModel.first_created_at < before)
+        if after is not None:
+            stmt = stmt.where(MessageArchiveSegmentModel.last_created_at > after)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete_message_for_me(self, message_id: UUID) -> UUID | None:
+        stmt = (
+            update(MessageModel)
+            .where(MessageModel.id == message_id)
+            .values(is_deleted=True)
+            .returning(MessageModel.chat_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def delete_message_for_all(self, message_id: UUID) -> Row | None:
+        stmt = (
+            delete(MessageModel)
+            .where(MessageModel.id == message_id)
+            .returning(MessageModel.chat_id, MessageModel.sender_id, MessageModel.created_at)
+        )
+        result = await self.session.execute(stmt)
+        deleted = result.one_or_none()
+        if deleted is not None:
+            await self.session.execute(
+                delete(MessageReactionModel)
+                .where(
+                    MessageReactionModel.message_id == message_id,
+                    MessageReactionModel.message_created_at == deleted.created_at
+                )
+            )
+        return deleted
+
+    async def add_message_tombstone(self, message_id: UUID, chat_id: UUID) -> None:
+        stmt = (
+            pg_insert(MessageTombstoneModel)
+            .values(message_id=message_id, chat_id=chat_id)
+            .on_conflict_do_nothing()
+        )
+        await self.session.execute(stmt)
+
+    async def get_change_seq_bound(self) -> int:
+        result = await self.session.execute(
+            text(
+                """
+                WITH seq AS (
+                    SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END AS last_value
+                    FROM chat_change_seq
+                )
+                SELECT
+                    seq.last_value,
+                    min(seq.last_value - ((seq.last_value - locks.objid::bigint) & 4294967295))
+                FROM seq
+                LEFT JOIN pg_locks AS locks
+                    ON locks.locktype = 'advisory'
+                    AND locks.classid = :namespace
+                    AND locks.objsubid = 2
+                    AND locks.database = (SELECT oid FROM pg_database WHERE datname = current_database())
+                GROUP BY seq.last_value
+                """
+            ),
+            {"namespace": CHANGE_SEQ_LOCK_NAMESPACE}
+        )
+        last_value, in_flight = result.one()
+        return last_value if in_flight is None else min(last_value, in_flight - 1)
+
+    async def get_changed_chat_ids(
+        self,
+        user_id: UUID,
+        since: int,
+        until: int,
+        limit: int
+    ) -> list[tuple[UUID, int]]:
+        stmt = (
+            select(ChatModel.id, ChatModel.change_seq)
+            .join(ChatParticipantModel, ChatModel.id == ChatParticipantModel.chat_id)
+            .where(
+                ChatParticipantModel.user_id == user_id,
+                ChatModel.change_seq > since,
+                ChatModel.change_seq <= until
+            )
+            .order_by(ChatModel.change_seq)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_changed_read_states(
+        self,
+        user_id: UUID,
+        since: int,
+        until: int,
+        limit: int
+    ) -> list[ChatReadStateDTO]:
+        me = aliased(ChatParticipantModel)
+        other_participant = aliased(ChatParticipantModel)
+
+        changed = (
+            select(
+                ChatParticipantModel.chat_id,
+                func.max(ChatParticipantModel.change_seq).label("change_seq")
+            )
+            .join(
+                me,
+                and_(
+                    me.chat_id == ChatParticipantModel.chat_id,
+                    me.user_id == user_id
+                )
+            )
+            .where(
+                ChatParticipantModel.change_seq > since,
+                ChatParticipantModel.change_seq <= until
+            )
+            .group_by(ChatParticipantModel.chat_id)
+            .order_by(func.max(ChatParticipantModel.change_seq))
+            .limit(limit)
+            .subquery("changed")
+        )
+
+        has_unread = exists(
+            select(other_participant)
+            .where(
+                other_participant.chat_id == changed.c.chat_id,
+                other_participant.user_id != user_id,
+                other_participant.unread_count > 0
+            )
+        )
+
+        stmt = (
+            select(
+                changed.c.change_seq,
+                ChatParticipantModel.chat_id,
+                ChatParticipantModel.last_read_message_id,
+                ChatParticipantModel.unread_count,
+                has_unread.label("has_unread")
+            )
+            .join(
+                ChatParticipantModel,
+                and_(
+                    ChatParticipantModel.chat_id == changed.c.chat_id,
+                    ChatParticipantModel.user_id == user_id
+                )
+            )
+            .order_by(changed.c.change_seq)
+        )
+        result = await self.session.execute(stmt)
+
+        return [
+            ChatReadStateDTO(
+                change_seq=change_seq,
+                chat_id=chat_id,
+                last_read_message_id=last_read_message_id,
+                unread_count=unread_count,
+                is_mark_unread=has_unread
+            )
+            for change_seq, chat_id, last_read_message_id, unread_count, has_unread in result.all()
+        ]
+
+    async def get_changed_messages(
+        self,
+        user_id: UUID,
+        since: int,
+        until: int,
+        limit: int
+    ) -> list[MessageChangeDTO]:
+        stmt = (
+            select(MessageModel, ProfileModel, self._my_reactions(user_id))
+            .join(
+                ChatParticipantModel,
+                and_(
+                    ChatParticipantModel.chat_id == MessageModel.chat_id,
+                    ChatParticipantModel.user_id == user_id
+                )
+            )
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(
+                MessageModel.change_seq > since,
+                MessageModel.change_seq <= until
+            )
+            .order_by(MessageModel.change_seq)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+
+        return [
+            MessageChangeDTO(
+                change_seq=message.change_seq,
+                chat_id=message.chat_id,
+                message=self._build_message_dto(message, sender, my_reactions)
+            )
+            for message, sender, my_reactions in result.all()
+        ]
+
+    async def get_message_tombstones(
+        self,
+        user_id: UUID,
+        since: int,
+        until: int,
+        limit: int
+    ) -> list[MessageTombstoneDTO]:
+        stmt = (
+            select(MessageTombstoneModel)
+            .join(
+                ChatParticipantModel,
+                and_(
+                    ChatParticipantModel.chat_id == MessageTombstoneModel.chat_id,
+                    ChatParticipantModel.user_id == user_id
+                )
+            )
+            .where(
+                MessageTombstoneModel.change_seq > since,
+                MessageTombstoneModel.change_seq <= until
+            )
+            .order_by(MessageTombstoneModel.change_seq)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+
+        return [
+            MessageTombstoneDTO(
+                change_seq=tombstone.change_seq,
+                chat_id=tombstone.chat_id,
+                message_id=tombstone.message_id
+            )
+            for tombstone in result.scalars().all()
+        ]
+
+    async def search_messages(
+        self,
+        chat_id: UUID,
+        user_id: UUID,
+        query: str,
+        limit: int = 20,
+        cursor: datetime | None = None
+    ) -> list[MessageSearchHitDTO]:
+        ts_query = (
+            func.websearch_to_tsquery(cast("russian", REGCONFIG), query)
+            .op("||")(func.websearch_to_tsquery(cast("english", REGCONFIG), query))
+        )
+        snippet = func.ts_headline(
+            cast("russian", REGCONFIG),
+            self._escape_html(MessageModel.content),
+            ts_query,
+            "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5, MaxFragments=2"
+        )
+
+        stmt = (
+            select(MessageModel, ProfileModel, self._my_reactions(user_id), snippet)
+            .join(ProfileModel, MessageModel.sender_id == ProfileModel.id)
+            .where(
+                MessageModel.chat_id == chat_id,
+                MessageModel.is_deleted.is_(False),
+                MessageModel.search_vector.bool_op("@@")(ts_query)
+            )
+            .order_by(MessageModel.created_at.desc())
+            .limit(limit)
+        )
+
+        if cursor is not None:
+            stmt = stmt.where(MessageModel.created_at < cursor)
+
+        result = await self.session.execute(stmt)
+
+        return [
+            MessageSearchHitDTO(
+                message=self._build_message_dto(message, sender, my_reactions),
+                snippet=snippet
+            )
+            for message, sender, my_reactions, snippet in result.all()
+        ]
+
+    async def get_last_read_message_id(self, chat_id: UUID, user_id: UUID) -> UUID | None:
+        stmt = (
+            select(ChatParticipantModel.last_read_message_id)
+            .where(
+                ChatParticipantModel.chat_id == chat_id,
+                ChatParticipantModel.user_id == user_id
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _escape_html(content):
+        for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#39;")):
+            content = func.replace(content, char, entity)
+        return content
+
+    @staticmethod
+    def _my_reactions(user_id: UUID):
+        return (
+            select(func.array_agg(MessageReactionModel.emoji))
+            .where(
+                MessageReactionModel.message_id == MessageModel.id,
+                MessageReactionModel.user_id == user_id
+            )
+            .scalar_subquery()
+            .label("my_reactions")
+        )
+
+    @staticmethod
+    def _shift_reaction_count(emoji: str, delta: int):
+        return func.jsonb_set(
+            MessageModel.reactions,
+            literal([emoji], ARRAY(Text)),
+            func.to_jsonb(func.coalesce(MessageModel.reactions[emoji].astext.cast(Integer), 0) + delta)
+        )
+
+    @staticmethod
+    def _build_chat_dto(
+        chat: ChatModel,
+        message: MessageModel | None,
+        sender: ProfileModel | None,
+        unread_count: int,
         has_unread: bool
     ) -> ChatDTO:
         return ChatDTO(
@@ -322,8 +1420,10 @@ class ChatRepository:
     @staticmethod
     def _build_message_dto(
         message: MessageModel,
-        sender: ProfileModel | None
+        sender: ProfileModel | None,
+        my_reactions: list[str] | None = None
     ):
+        my_reactions = my_reactions or []
         return MessageDTO(
             id=message.id,
             sender=MessageSenderDTO(
@@ -338,5 +1438,9 @@ class ChatRepository:
             is_edited=message.is_edited,
             is_deleted=message.is_deleted,
             created_at=message.created_at,
-            edited_at=message.edited_at
+            edited_at=message.edited_at,
+            reactions=[
+                MessageReactionDTO(emoji=emoji, count=count, is_mine=emoji in my_reactions)
+                for emoji, count in message.reactions.items()
+            ]
         )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Select, delete, select, update
+from sqlalchemy import Select, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.posts.entities import (
@@ -93,6 +93,19 @@ class CommentRepository:
             .values(text=new_text)
         )
 
+    async def count_subtree(self, comment_id: UUID) -> int:
+        subtree = (
+            select(PostCommentModel.id)
+            .where(PostCommentModel.id == comment_id)
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(PostCommentModel.id)
+            .join(subtree, PostCommentModel.parent_id == subtree.c.id)
+        )
+        result = await self.session.execute(select(func.count()).select_from(subtree))
+        return result.scalar_one()
+
     async def delete(self, comment_id: UUID) -> None:
         await self.session.execute(
             delete(PostCommentModel)
@@ -0,0 +1,118 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.models.profile import FollowModel, ProfileModel
+
+
+class FollowRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, follower_id: UUID, followee_id: UUID) -> bool:
+        stmt = (
+            insert(FollowModel)
+            .values(follower_id=follower_id, followee_id=followee_id)
+            .on_conflict_do_nothing()
+            .returning(FollowModel.followee_id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self._change_followers_count(followee_id, 1)
+        return True
+
+    async def delete(self, follower_id: UUID, followee_id: UUID) -> bool:
+        stmt = (
+            delete(FollowModel)
+            .where(
+                FollowModel.follower_id == follower_id,
+                FollowModel.followee_id == followee_id
+            )
+            .returning(FollowModel.followee_id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self._change_followers_count(followee_id, -1)
+        return True
+
+    async def get_followers(
+        self,
+        profile_id: UUID,
+        cursor: tuple[datetime, UUID] | None = None,
+        limit: int = 25
+    ) -> list[tuple[ProfileModel, datetime]]:
+        stmt = (
+            select(ProfileModel, FollowModel.created_at)
+            .join(FollowModel, FollowModel.follower_id == ProfileModel.id)
+            .where(FollowModel.followee_id == profile_id)
+            .order_by(FollowModel.created_at.desc(), FollowModel.follower_id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(FollowModel.created_at, FollowModel.follower_id) < cursor)
+
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_following(
+        self,
+        profile_id: UUID,
+        cursor: tuple[datetime, UUID] | None = None,
+        limit: int = 25
+    ) -> list[tuple[ProfileModel, datetime]]:
+        stmt = (
+            select(ProfileModel, FollowModel.created_at)
+            .join(FollowModel, FollowModel.followee_id == ProfileModel.id)
+            .where(FollowModel.follower_id == profile_id)
+            .order_by(FollowModel.created_at.desc(), FollowModel.followee_id.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(FollowModel.created_at, FollowModel.followee_id) < cursor)
+
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_follower_ids(self, profile_id: UUID, after: UUID | None = None, limit: int = 1000) -> list[UUID]:
+        stmt = (
+            select(FollowModel.follower_id)
+            .where(FollowModel.followee_id == profile_id)
+            .order_by(FollowModel.follower_id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(FollowModel.follower_id > after)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_followees_above(self, follower_id: UUID, followers_count: int) -> list[UUID]:
+        stmt = (
+            select(ProfileModel.id)
+            .join(FollowModel, FollowModel.followee_id == ProfileModel.id)
+            .where(
+                FollowModel.follower_id == follower_id,
+                ProfileModel.followers_count >= followers_count
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_followers_count(self, profile_id: UUID) -> int:
+        stmt = select(ProfileModel.followers_count).where(ProfileModel.id == profile_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() or 0
+
+    async def _change_followers_count(self, profile_id: UUID, delta: int) -> None:
+        await self.session.execute(
+            update(ProfileModel)
+            .where(ProfileModel.id == profile_id)
+            .values(followers_count=ProfileModel.followers_count + delta)
+        )
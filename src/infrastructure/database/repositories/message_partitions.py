@@ -0,0 +1,80 @@
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.models.chat import MessageReactionModel
+
+
+PARTITION_NAME_PATTERN = re.compile(r"^messages_y(\d{4})m(\d{2})$")
+
+
+class MessagePartitionRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_partitions(self, detach_pending: bool = False) -> dict[str, date]:
+        stmt = text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = 'messages' AND pg_inherits.inhdetachpending = :detach_pending
+            """
+        )
+        result = await self.session.execute(stmt, {"detach_pending": detach_pending})
+
+        partitions = {}
+        for name in result.scalars().all():
+            match = PARTITION_NAME_PATTERN.match(name)
+            if match is not None:
+                partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+        return partitions
+
+    async def create_monthly_partition(self, month: date) -> str:
+        month_start, month_end = self.month_bounds(month)
+        name = self.partition_name(month)
+
+        await self.session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {self._quote(name)} PARTITION OF messages "
+                f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+            )
+        )
+        return name
+
+    async def delete_reactions_in(self, month: date) -> int:
+        month_start, month_end = self.month_bounds(month)
+        result = await self.session.execute(
+            delete(MessageReactionModel)
+            .where(
+                MessageReactionModel.message_created_at >= month_start,
+                MessageReactionModel.message_created_at < month_end
+            )
+        )
+        return result.rowcount
+
+    async def detach_partition(self, name: str) -> None:
+        await self.session.execute(text(f"ALTER TABLE messages DETACH PARTITION {self._quote(name)} CONCURRENTLY"))
+
+    async def finalize_detach(self, name: str) -> None:
+        await self.session.execute(text(f"ALTER TABLE messages DETACH PARTITION {self._quote(name)} FINALIZE"))
+
+    def _quote(self, name: str) -> str:
+        if PARTITION_NAME_PATTERN.match(name) is None:
+            raise ValueError(f"Not a message partition: {name}")
+
+        return self.session.get_bind().dialect.identifier_preparer.quote_identifier(name)
+
+    @staticmethod
+    def month_bounds(month: date) -> tuple[datetime, datetime]:
+        return (
+            datetime(month.year, month.month, 1, tzinfo=UTC),
+            datetime(month.year + month.month // 12, month.month % 12 + 1, 1, tzinfo=UTC)
+        )
+
+    @staticmethod
+    def partition_name(month: date) -> str:
+        return f"messages_y{month.year:04d}m{month.month:02d}"
@@ -1,9 +1,10 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, or_, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
 from core.posts.entities import (
     ImageDTO,
@@ -12,6 +13,7 @@ from core.posts.entities import (
     PostReadDTO,
 )
 from infrastructure.database.models.posts import PostCommentModel, PostImageModel, PostLikeModel, PostModel
+from infrastructure.database.models.profile import FollowModel, ProfileModel
 
 
 class PostRepository:
@@ -52,36 +54,91 @@ class PostRepository:
         if not posts:
             return []
 
-        post_ids = [p.id for p in posts]
-        likes_count_map = await self._fetch_likes_counts(post_ids)
-        user_liked_ids = await self._fetch_user_liked_post_ids(post_ids, current_user_id)
-        comments_count = await self._fetch_comments_count(post_ids)
+        user_liked_ids = await self._fetch_user_liked_post_ids([p.id for p in posts], current_user_id)
+
+        return [self._build_post_read_dto(post, post.id in user_liked_ids) for post in posts]
+
+    async def get_posts_by_ids(self, post_ids: list[UUID], current_user_id: UUID) -> list[PostReadDTO]:
+        if not post_ids:
+            return []
+
+        stmt = (
+            select(PostModel)
+            .where(PostModel.id.in_(post_ids))
+            .options(selectinload(PostModel.images))
+        )
+        result = await self.session.execute(stmt)
+        posts = {post.id: post for post in result.scalars().all()}
+        if not posts:
+            return []
+
+        user_liked_ids = await self._fetch_user_liked_post_ids(list(posts), current_user_id)
 
         return [
-            self._build_post_read_dto(
-                post,
-                likes_count_map.get(post.id, 0),
-                post.id in user_liked_ids,
-                comments_count.get(post.id, 0)
-            )
-            for post in posts
+            self._build_post_read_dto(posts[post_id], post_id in user_liked_ids)
+            for post_id in post_ids
+            if post_id in posts
         ]
 
+    async def get_feed_entries(
+        self,
+        follower_id: UUID,
+        max_followers_count: int,
+        limit: int
+    ) -> list[tuple[UUID, datetime]]:
+        followees = (
+            select(FollowModel.followee_id)
+            .join(ProfileModel, ProfileModel.id == FollowModel.followee_id)
+            .where(
+                FollowModel.follower_id == follower_id,
+                ProfileModel.followers_count < max_followers_count
+            )
+        )
+        own = (
+            select(ProfileModel.id)
+            .where(
+                ProfileModel.id == follower_id,
+                ProfileModel.followers_count < max_followers_count
+            )
+        )
+        stmt = (
+            select(PostModel.id, PostModel.created_at)
+            .where(PostModel.author_id.in_(union_all(followees, own)))
+            .order_by(PostModel.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
+    async def get_posts_by_authors(
+        self,
+        author_ids: list[UUID],
+        cursor: datetime | None = None,
+        limit: int = 25
+    ) -> list[tuple[UUID, datetime]]:
+        if not author_ids:
+            return []
+
+        stmt = (
+            select(PostModel.id, PostModel.created_at)
+            .where(PostModel.author_id.in_(author_ids))
+            .order_by(PostModel.created_at.desc())
+            .limit(limit)
+        )
+        if cursor is not None:
+            stmt = stmt.where(PostModel.created_at < cursor)
+
+        result = await self.session.execute(stmt)
+        return list(result.tuples().all())
+
     async def get_post_by_id(self, post_id: UUID, current_user_id: UUID) -> PostReadDTO | None:
         post = await self._fetch_post_with_images(post_id)
         if post is None:
             return None
 
-        likes_count = await self._fetch_likes_counts([post_id])
         is_liked = await self.is_post_liked(post_id, current_user_id)
-        comments_count = await self._fetch_comments_count([post_id])
 
-        return self._build_post_read_dto(
-            post,
-            likes_count.get(post.id, 0),
-            is_liked,
-            comments_count.get(post.id, 0)
-        )
+        return self._build_post_read_dto(post, is_liked)
 
     async def get_post_images(
         self,
@@ -113,16 +170,76 @@ class PostRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def add_post_like(self, post_id: UUID, user_id: UUID) -> None:
-        self.session.add(PostLikeModel(post_id=post_id, user_id=user_id))
+    async def add_post_like(self, post_id: UUID, user_id: UUID) -> bool:
+        stmt = (
+            insert(PostLikeModel)
+            .values(post_id=post_id, user_id=user_id)
+            .on_conflict_do_nothing()
+            .returning(PostLikeModel.post_id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self._change_counter(post_id, PostModel.likes_count, 1)
+        return True
 
-    async def delete_post_like(self, post_id: UUID, user_id: UUID) -> None:
-        await self.session.execute(
-            delete(PostLikeModel).where(
+    async def delete_post_like(self, post_id: UUID, user_id: UUID) -> bool:
+        stmt = (
+            delete(PostLikeModel)
+            .where(
                 PostLikeModel.post_id == post_id,
                 PostLikeModel.user_id == user_id,
             )
+            .returning(PostLikeModel.post_id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self._change_counter(post_id, PostModel.likes_count, -1)
+        return True
+
+    async def change_comments_count(self, post_id: UUID, delta: int) -> None:
+        await self._change_counter(post_id, PostModel.comments_count, delta)
+
+    async def reconcile_counters(self, after: UUID | None = None, limit: int = 1000) -> tuple[UUID | None, int]:
+        batch = select(PostModel.id).order_by(PostModel.id).limit(limit).with_for_update()
+        if after is not None:
+            batch = batch.where(PostModel.id > after)
+        post_ids = list((await self.session.scalars(batch)).all())
+        if not post_ids:
+            return None, 0
+
+        likes_count = (
+            select(func.count())
+            .where(PostLikeModel.post_id == PostModel.id)
+            .scalar_subquery()
+        )
+        comments_count = (
+            select(func.count())
+            .where(PostCommentModel.post_id == PostModel.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(PostModel)
+            .where(
+                PostModel.id.in_(post_ids),
+                or_(
+                    PostModel.likes_count != likes_count,
+                    PostModel.comments_count != comments_count
+                )
+            )
+            .values(
+                likes_count=likes_count,
+                comments_count=comments_count,
+                updated_at=PostModel.updated_at
+            )
+            .execution_options(synchronize_session=False)
         )
+        result = await self.session.execute(stmt)
+
+        return post_ids[-1], result.rowcount
 
     async def is_post_liked(self, post_id: UUID, user_id: UUID) -> bool:
         stmt = select(PostLikeModel).where(
@@ -175,23 +292,12 @@ class PostRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _fetch_likes_counts(self, post_ids: list[UUID]) -> dict[UUID, int]:
-        stmt = (
-            select(PostLikeModel.post_id, func.count(PostLikeModel.user_id))
-            .where(PostLikeModel.post_id.in_(post_ids))
-            .group_by(PostLikeModel.post_id)
-        )
-        result = await self.session.execute(stmt)
-        return dict(result.all())
-
-    async def _fetch_comments_count(self, post_ids: list[UUID]) -> dict[UUID, int]:
-        stmt = (
-            select(PostCommentModel.post_id, func.count(PostCommentModel.id))
-            .where(PostCommentModel.post_id.in_(post_ids))
-            .group_by(PostCommentModel.post_id)
+    async def _change_counter(self, post_id: UUID, counter: InstrumentedAttribute[int], delta: int) -> None:
+        await self.session.execute(
+            update(PostModel)
+            .where(PostModel.id == post_id)
+            .values({counter: counter + delta, PostModel.updated_at: PostModel.updated_at})
         )
-        result = await self.session.execute(stmt)
-        return dict(result.all())
 
     async def _fetch_user_liked_post_ids(self, post_ids: list[UUID], user_id: UUID) -> set[UUID]:
         stmt = select(PostLikeModel.post_id).where(
@@ -202,14 +308,14 @@ class PostRepository:
         return {row[0] for row in result.all()}
 
     @staticmethod
-    def _build_post_read_dto(post: PostModel, likes_count: int, is_liked: bool, comments_count: int) -> PostReadDTO:
+    def _build_post_read_dto(post: PostModel, is_liked: bool) -> PostReadDTO:
         return PostReadDTO(
             id=post.id,
             author_id=post.author_id,
             content=post.content,
             images=[PostImageDTO(object_key=img.object_key, order=img.order) for img in post.images],
             created_at=post.created_at,
-            likes_count=likes_count,
+            likes_count=post.likes_count,
             is_current_user_likes=is_liked,
-            comments_count=comments_count
+            comments_count=post.comments_count
         )
@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, update
+from sqlalchemy import DateTime as PGDateTime, column, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.profile.entities import ProfileCreationDTO
@@ -35,14 +36,36 @@ class ProfileRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_user_ids(self, user_ids: list[UUID]) -> list[ProfileModel]:
+        stmt = select(ProfileModel).where(ProfileModel.id.in_(user_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_username(self, username: str) -> ProfileModel:
         stmt = select(ProfileModel).where(ProfileModel.username == username)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def update_last_seen(self, user_id: UUID, new_last_seen: datetime) -> None:
-        stmt = update(ProfileModel).where(ProfileModel.id == user_id).values(last_seen=new_last_seen)
-        await self.session.execute(stmt)
+    async def update_last_seen_many(self, last_seen: dict[UUID, datetime]) -> int:
+        pending = (
+            values(
+                column("user_id", PGUUID),
+                column("last_seen", PGDateTime(timezone=True)),
+                name="pending"
+            )
+            .data(list(last_seen.items()))
+        )
+
+        stmt = (
+            update(ProfileModel)
+            .where(
+                ProfileModel.id == pending.c.user_id,
+                ProfileModel.last_seen < pending.c.last_seen
+            )
+            .values(last_seen=pending.c.last_seen)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
 
     async def search(
         self,
@@ -0,0 +1,113 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from infrastructure.redis_pool.pools import redis_pools, run_pipelined
+
+
+TIMELINE_KEY = "feed:home:{user_id}"
+TIMELINE_SENTINEL = "-"
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+PUSH_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call("EXISTS", key) == 1 then
+        redis.call("ZADD", key, ARGV[2], ARGV[1])
+        redis.call("ZREMRANGEBYRANK", key, 1, -(tonumber(ARGV[3]) + 1))
+    end
+end
+return #KEYS
+"""
+
+
+def to_score(created_at: datetime) -> int:
+    return (created_at - EPOCH) // timedelta(microseconds=1)
+
+
+def from_score(score: float) -> datetime:
+    return EPOCH + timedelta(microseconds=int(score))
+
+
+class HomeTimelines:
+    def __init__(self, max_length: int, ttl: int) -> None:
+        self.redis_client = redis_pools.client("cache")
+        self._push_script = self.redis_client.register_script(PUSH_SCRIPT)
+        self._max_length = max_length
+        self._ttl = ttl
+
+    async def read(self, user_id: UUID, before: datetime | None, limit: int) -> list[tuple[UUID, datetime]] | None:
+        key = self._timeline_key(user_id)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            exists, entries = await (
+                pipe.expire(key, self._ttl)
+                .zrange(
+                    key,
+                    f"({to_score(before)}" if before is not None else "+inf",
+                    "(0",
+                    desc=True,
+                    byscore=True,
+                    offset=0,
+                    num=limit,
+                    withscores=True
+                )
+                .execute()
+            )
+        if not exists:
+            return None
+
+        return [(UUID(post_id.decode("utf-8")), from_score(score)) for post_id, score in entries]
+
+    async def reserve(self, user_id: UUID) -> set[UUID]:
+        key = self._timeline_key(user_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            _, members, _ = await (
+                pipe.zadd(key, {TIMELINE_SENTINEL: 0}, nx=True)
+                .zrangebyscore(key, "(0", "+inf")
+                .expire(key, self._ttl)
+                .execute()
+            )
+        return {UUID(post_id.decode("utf-8")) for post_id in members}
+
+    async def merge(self, user_id: UUID, entries: list[tuple[UUID, datetime]], previous: set[UUID]) -> None:
+        key = self._timeline_key(user_id)
+        stale = previous.difference(post_id for post_id, _ in entries)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.zrem(key, *(str(post_id) for post_id in stale))
+            if entries:
+                pipe.zadd(key, {str(post_id): to_score(created_at) for post_id, created_at in entries})
+            await (
+                pipe.zadd(key, {TIMELINE_SENTINEL: 0}, nx=True)
+                .zremrangebyrank(key, 1, -(self._max_length + 1))
+                .expire(key, self._ttl)
+                .execute()
+            )
+
+    async def push(self, post_id: UUID, created_at: datetime, user_ids: list[UUID]) -> None:
+        if not user_ids:
+            return
+
+        await self._push_script(
+            keys=[self._timeline_key(user_id) for user_id in user_ids],
+            args=[str(post_id), to_score(created_at), self._max_length]
+        )
+
+    async def remove(self, post_ids: list[UUID], user_ids: list[UUID]) -> None:
+        if not post_ids:
+            return
+
+        members = [str(post_id) for post_id in post_ids]
+        await run_pipelined(
+            self.redis_client,
+            user_ids,
+            lambda pipe, user_id: pipe.zrem(self._timeline_key(user_id), *members)
+        )
+
+    async def iter_user_ids(self) -> AsyncIterator[UUID]:
+        prefix = TIMELINE_KEY.format(user_id="")
+        async for key in self.redis_client.scan_iter(match=f"{prefix}*", count=1000):
+            yield UUID(key.decode("utf-8").removeprefix(prefix))
+
+    @staticmethod
+    def _timeline_key(user_id: UUID) -> str:
+        return TIMELINE_KEY.format(user_id=user_id)
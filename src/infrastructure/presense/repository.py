@@ -1,36 +1,170 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
-import redis.asyncio as redis
+from infrastructure.redis_pool.pools import redis_pools, run_pipelined
 
-from settings import settings
+
+ONLINE_KEY = "presense:online"
+LAST_SEEN_KEY = "presense:last_seen"
+PENDING_LAST_SEEN_KEY = "presense:last_seen:pending"
+ACTIVE_USERS_KEY = "presense:active:{day}"
+ACTIVE_USERS_ROLLUP_KEY = "presense:active:{days}d:{day}"
+
+HEARTBEAT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local previous = redis.call("ZSCORE", KEYS[1], ARGV[2])
+if previous and now - tonumber(previous) < tonumber(ARGV[3]) then
+    return 0
+end
+redis.call("ZADD", KEYS[1], now, ARGV[2])
+redis.call("ZADD", KEYS[2], now, ARGV[2])
+redis.call("HSET", KEYS[3], ARGV[2], ARGV[5])
+redis.call("PFADD", KEYS[4], ARGV[2])
+redis.call("EXPIRE", KEYS[4], ARGV[6], "NX")
+if previous and now - tonumber(previous) < tonumber(ARGV[4]) then
+    return 1
+end
+return 2
+"""
+
+POP_EXPIRED_SCRIPT = """
+local expired = redis.call("ZRANGE", KEYS[1], "-inf", ARGV[1], "BYSCORE", "LIMIT", 0, ARGV[3], "WITHSCORES")
+for index = 1, #expired, 2 do
+    redis.call("ZREM", KEYS[1], expired[index])
+end
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", ARGV[2])
+return expired
+"""
+
+POP_LAST_SEEN_SCRIPT = """
+local entries = redis.call("HRANDFIELD", KEYS[1], ARGV[1], "WITHVALUES")
+for index = 1, #entries, 2 do
+    redis.call("HDEL", KEYS[1], entries[index])
+end
+return entries
+"""
 
 
 class PresenseRepository:
-    def __init__(self) -> None:
-        self.redis_client = redis.Redis(
-            host=settings.redis.host,
-            port=settings.redis.port,
-            db=settings.redis.presense_db
+    def __init__(
+        self,
+        online_ttl: float,
+        heartbeat_window: float,
+        last_seen_retention: float,
+        active_users_retention: int
+    ) -> None:
+        self.redis_client = redis_pools.client("presense")
+        self._heartbeat_script = self.redis_client.register_script(HEARTBEAT_SCRIPT)
+        self._pop_expired_script = self.redis_client.register_script(POP_EXPIRED_SCRIPT)
+        self._pop_last_seen_script = self.redis_client.register_script(POP_LAST_SEEN_SCRIPT)
+        self._online_ttl = online_ttl
+        self._heartbeat_window = heartbeat_window
+        self._last_seen_retention = last_seen_retention
+        self._active_users_retention = active_users_retention
+
+    async def set_online(self, user_id: UUID, now: datetime) -> bool:
+        transition = await self._heartbeat_script(
+            keys=[
+                ONLINE_KEY,
+                LAST_SEEN_KEY,
+                PENDING_LAST_SEEN_KEY,
+                ACTIVE_USERS_KEY.format(day=now.date().isoformat())
+            ],
+            args=[
+                now.timestamp(),
+                str(user_id),
+                self._heartbeat_window,
+                self._online_ttl,
+                now.isoformat(),
+                self._active_users_retention
+            ]
         )
+        return transition == 2
+
+    async def set_offline(self, user_id: UUID, now: datetime) -> bool:
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            online_since, removed, _, _ = await (
+                pipe.zscore(ONLINE_KEY, str(user_id))
+                .zrem(ONLINE_KEY, str(user_id))
+                .zadd(LAST_SEEN_KEY, {str(user_id): now.timestamp()})
+                .hset(PENDING_LAST_SEEN_KEY, str(user_id), now.isoformat())
+                .execute()
+            )
+        return bool(removed) and online_since is not None and online_since >= now.timestamp() - self._online_ttl
+
+    async def get_presense(self, user_id: UUID) -> tuple[bool, datetime | None]:
+        return (await self.get_presense_many([user_id]))[user_id]
 
-    async def set_online(self, user_id: UUID) -> None:
-        await self.redis_client.set(f"{user_id}:online", 1, ex=60)
+    async def get_presense_many(self, user_ids: list[UUID]) -> dict[UUID, tuple[bool, datetime | None]]:
+        if not user_ids:
+            return {}
 
-    async def set_offline(self, user_id) -> None:
+        members = [str(user_id) for user_id in user_ids]
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            online, last_seen = await pipe.zmscore(ONLINE_KEY, members).zmscore(LAST_SEEN_KEY, members).execute()
+
+        online_after = datetime.now(UTC).timestamp() - self._online_ttl
+        return {
+            user_id: (
+                online_score is not None and online_score >= online_after,
+                datetime.fromtimestamp(last_seen_score, UTC) if last_seen_score is not None else None
+            )
+            for user_id, online_score, last_seen_score in zip(user_ids, online, last_seen, strict=True)
+        }
+
+    async def count_online(self) -> int:
+        return await self.redis_client.zcount(ONLINE_KEY, datetime.now(UTC).timestamp() - self._online_ttl, "+inf")
+
+    async def get_recently_offline(self, user_ids: list[UUID], since: datetime) -> dict[UUID, datetime]:
+        presense = await self.get_presense_many(user_ids)
+        return {
+            user_id: last_seen
+            for user_id, (is_online, last_seen) in presense.items()
+            if not is_online and last_seen is not None and last_seen >= since
+        }
+
+    async def count_active(self, day: date, days: int) -> int:
+        rollup_key = ACTIVE_USERS_ROLLUP_KEY.format(days=days, day=day.isoformat())
+        if days > 1 and await self.redis_client.exists(rollup_key):
+            return await self.redis_client.pfcount(rollup_key)
+        return await self.redis_client.pfcount(*self._active_users_keys(day, days))
+
+    async def rollup_active(self, day: date, days: int) -> int:
+        rollup_key = ACTIVE_USERS_ROLLUP_KEY.format(days=days, day=day.isoformat())
         async with self.redis_client.pipeline(transaction=True) as pipe:
-            await (
-                pipe.delete([f"{user_id}:online"])
-                .set(f"{user_id}:last_seen", datetime.now(UTC).isoformat(), ex=300)
+            _, _, count = await (
+                pipe.pfmerge(rollup_key, *self._active_users_keys(day, days))
+                .expire(rollup_key, self._active_users_retention)
+                .pfcount(rollup_key)
                 .execute()
             )
+        return count
+
+    async def pop_expired(self, count: int) -> dict[UUID, datetime]:
+        now = datetime.now(UTC).timestamp()
+        expired = await self._pop_expired_script(
+            keys=[ONLINE_KEY, LAST_SEEN_KEY],
+            args=[f"({now - self._online_ttl}", now - self._last_seen_retention, count]
+        )
+        return {
+            UUID(user_id.decode("utf-8")): datetime.fromtimestamp(float(score), UTC)
+            for user_id, score in zip(expired[::2], expired[1::2], strict=True)
+        }
 
-    async def is_online(self, user_id: UUID) -> bool:
-        online_status = await self.redis_client.exists([f"{user_id}:online"])
-        return bool(online_status)
+    @staticmethod
+    def _active_users_keys(day: date, days: int) -> list[str]:
+        return [ACTIVE_USERS_KEY.format(day=(day - timedelta(days=offset)).isoformat()) for offset in range(days)]
 
-    async def get_last_seen(self, user_id: UUID) -> datetime | None:
-        last_seen_raw = await self.redis_client.get(f"{user_id}:last_seen")
-        if not last_seen_raw:
-            return None
-        return datetime.fromisoformat(last_seen_raw.decode("utf-8"))
+    async def pop_pending_last_seen(self, count: int) -> dict[UUID, datetime]:
+        entries = await self._pop_last_seen_script(keys=[PENDING_LAST_SEEN_KEY], args=[count])
+        return {
+            UUID(user_id.decode("utf-8")): datetime.fromisoformat(last_seen.decode("utf-8"))
+            for user_id, last_seen in zip(entries[::2], entries[1::2], strict=True)
+        }
+
+    async def restore_pending_last_seen(self, pending: dict[UUID, datetime]) -> None:
+        await run_pipelined(
+            self.redis_client,
+            pending.items(),
+            lambda pipe, entry: pipe.hsetnx(PENDING_LAST_SEEN_KEY, str(entry[0]), entry[1].isoformat())
+        )
@@ -0,0 +1,183 @@
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+
+import redis.asyncio as redis
+from fastapi import WebSocket, WebSocketDisconnect, status
+from redis.exceptions import RedisError
+
+from settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketConnection:
+    def __init__(self, websocket: WebSocket, queue_size: int, send_timeout: float) -> None:
+        self.websocket = websocket
+        self.channels: set[str] = set()
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._send_timeout = send_timeout
+        self._sender: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        self._sender = asyncio.create_task(self._run_sender())
+
+    def enqueue(self, payload: str) -> bool:
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def close(self, code: int = status.WS_1000_NORMAL_CLOSURE, reason: str | None = None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._sender is not None and self._sender is not asyncio.current_task():
+            self._sender.cancel()
+
+        with contextlib.suppress(RuntimeError, WebSocketDisconnect, TimeoutError):
+            await asyncio.wait_for(self.websocket.close(code, reason), self._send_timeout)
+
+    async def _run_sender(self) -> None:
+        try:
+            while True:
+                payload = await self._queue.get()
+                await asyncio.wait_for(self.websocket.send_text(payload), self._send_timeout)
+        except TimeoutError:
+            await self.close(status.WS_1013_TRY_AGAIN_LATER, "Client is too slow")
+        except (RuntimeError, WebSocketDisconnect):
+            await self.close()
+
+
+class ConnectionManager:
+    def __init__(self, queue_size: int, send_timeout: float) -> None:
+        self._queue_size = queue_size
+        self._send_timeout = send_timeout
+        self._redis_client: redis.Redis | None = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self._subscriptions: dict[str, set[WebSocketConnection]] = defaultdict(set)
+        self._lock = asyncio.Lock()
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def connect(self, websocket: WebSocket, channels: Iterable[str]) -> WebSocketConnection:
+        connection = WebSocketConnection(websocket, self._queue_size, self._send_timeout)
+        connection.start()
+        await self.add_channels(connection, channels)
+        return connection
+
+    async def disconnect(self, connection: WebSocketConnection) -> None:
+        await self.remove_channels(connection, set(connection.channels))
+        await connection.close()
+
+    async def add_channels(self, connection: WebSocketConnection, channels: Iterable[str]) -> None:
+        async with self._lock:
+            new_channels = []
+            for channel in channels:
+                if channel in connection.channels:
+                    continue
+                if not self._subscriptions[channel]:
+                    new_channels.append(channel)
+                self._subscriptions[channel].add(connection)
+                connection.channels.add(channel)
+
+            if new_channels:
+                await self._get_pubsub().subscribe(*new_channels)
+                self._ensure_listener()
+
+    async def remove_channels(self, connection: WebSocketConnection, channels: Iterable[str]) -> None:
+        async with self._lock:
+            stale_channels = []
+            for channel in channels:
+                if channel not in connection.channels:
+                    continue
+                connection.channels.discard(channel)
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(connection)
+                if not subscribers:
+                    del self._subscriptions[channel]
+                    stale_channels.append(channel)
+
+            if stale_channels and self._pubsub is not None:
+                with contextlib.suppress(RedisError):
+                    await self._pubsub.unsubscribe(*stale_channels)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+        connections = {
+            connection
+            for subscribers in self._subscriptions.values()
+            for connection in subscribers
+        }
+        for connection in connections:
+            await connection.close(status.WS_1001_GOING_AWAY)
+        self._subscriptions.clear()
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    def _get_pubsub(self):
+        if self._pubsub is None:
+            self._redis_client = redis.Redis(
+                host=settings.redis.host,
+                port=settings.redis.port,
+                db=settings.redis.presense_db,
+                decode_responses=True
+            )
+            self._pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+        return self._pubsub
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except RedisError:
+                logger.exception("Realtime pub/sub listener lost connection to Redis")
+                await asyncio.sleep(1.0)
+                continue
+
+            if message is not None and message["type"] == "message":
+                self._dispatch(message["channel"], message["data"])
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        for connection in tuple(self._subscriptions.get(channel, ())):
+            if not connection.enqueue(payload) and not connection.is_closed:
+                self._drop_slow_connection(connection)
+
+    def _drop_slow_connection(self, connection: WebSocketConnection) -> None:
+        task = asyncio.create_task(connection.close(status.WS_1013_TRY_AGAIN_LATER, "Send queue overflow"))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+
+connection_manager = ConnectionManager(
+    queue_size=settings.realtime.send_queue_size,
+    send_timeout=settings.realtime.send_timeout
+)
@@ -0,0 +1,38 @@
+import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from pydantic_core import to_json
+from redis.exceptions import RedisError
+
+from infrastructure.redis_pool.pools import redis_pools, run_pipelined
+
+
+logger = logging.getLogger(__name__)
+
+
+def user_channel(user_id: UUID | str) -> str:
+    return f"realtime:user:{user_id}"
+
+
+def presense_channel(user_id: UUID | str) -> str:
+    return f"realtime:presense:{user_id}"
+
+
+class RealtimePublisher:
+    def __init__(self) -> None:
+        self.redis_client = redis_pools.client("presense")
+
+    async def publish(self, channels: Iterable[str], event: object) -> None:
+        channels = list(channels)
+        if not channels:
+            return
+
+        payload = to_json(event)
+        try:
+            await run_pipelined(self.redis_client, channels, lambda pipe, channel: pipe.publish(channel, payload))
+        except RedisError:
+            logger.exception("Failed to publish realtime event")
+
+    async def publish_to_users(self, user_ids: Iterable[UUID], event: object) -> None:
+        await self.publish((user_channel(user_id) for user_id in user_ids), event)
@@ -0,0 +1,97 @@
+from collections.abc import Callable, Iterable
+from itertools import batched
+from typing import Any
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from settings import settings
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.created = 0
+        self.waiting = 0
+
+    def make_connection(self):
+        self.created += 1
+        return super().make_connection()
+
+    async def get_connection(self, *args, **kwargs):
+        if self.can_get_connection():
+            return await super().get_connection(*args, **kwargs)
+
+        self.waiting += 1
+        try:
+            return await super().get_connection(*args, **kwargs)
+        finally:
+            self.waiting -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_use": len(self._in_use_connections),
+            "idle": len(self._available_connections),
+            "waiting": self.waiting,
+            "created": self.created,
+            "max_connections": self.max_connections
+        }
+
+
+class RedisPools:
+    def __init__(self, host: str, port: int, databases: dict[str, int], max_connections: int, timeout: float) -> None:
+        self._databases = databases
+        self._pool_options = {
+            "host": host,
+            "port": port,
+            "max_connections": max_connections,
+            "timeout": timeout
+        }
+        self._pools = {name: self._create_pool(db) for name, db in databases.items()}
+        self._clients = {name: redis.Redis(connection_pool=pool) for name, pool in self._pools.items()}
+
+    def client(self, name: str) -> redis.Redis:
+        return self._clients[name]
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {"name": name, "db": self._databases[name], **pool.stats()}
+            for name, pool in self._pools.items()
+        ]
+
+    async def close(self) -> None:
+        for name, pool in list(self._pools.items()):
+            await pool.disconnect()
+            self._pools[name] = self._create_pool(self._databases[name])
+            self._clients[name].connection_pool = self._pools[name]
+
+    def _create_pool(self, db: int) -> InstrumentedConnectionPool:
+        return InstrumentedConnectionPool(db=db, **self._pool_options)
+
+
+async def run_pipelined[T](
+    client: redis.Redis,
+    items: Iterable[T],
+    command: Callable[[Pipeline, T], object],
+    chunk_size: int = 500,
+    transaction: bool = False
+) -> list[Any]:
+    results = []
+    for chunk in batched(items, chunk_size, strict=False):
+        async with client.pipeline(transaction=transaction) as pipe:
+            for item in chunk:
+                command(pipe, item)
+            results.extend(await pipe.execute())
+    return results
+
+
+redis_pools = RedisPools(
+    host=settings.redis.host,
+    port=settings.redis.port,
+    databases={
+        "presense": settings.redis.presense_db,
+        "cache": settings.redis.cache_db
+    },
+    max_connections=settings.redis.max_connections,
+    timeout=settings.redis.pool_timeout
+)
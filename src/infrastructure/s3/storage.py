@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import BinaryIO
 
@@ -49,6 +50,33 @@ class S3Storage:
                 ContentType=content_type
             )
 
+    async def download(self, object_key: str) -> bytes:
+        async with self.get_internal_client() as client:
+            response = await client.get_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            async with response["Body"] as stream:
+                return await stream.read()
+
+    async def get_size(self, object_key: str) -> int:
+        async with self.get_internal_client() as client:
+            response = await client.head_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            return response["ContentLength"]
+
+    async def iter_chunks(self, object_key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        async with self.get_internal_client() as client:
+            response = await client.get_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            async with response["Body"] as stream:
+                async for chunk in stream.iter_chunks(chunk_size):
+                    yield chunk
+
     async def delete(self, object_key: str) -> None:
         async with self.get_internal_client() as client:
             await client.delete_object(
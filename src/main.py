@@ -1,13 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import APIRouter, FastAPI
 
 from api.auth.router import auth_router
 from api.chat.router import chat_router
+from api.metrics.router import metrics_router
 from api.posts.router import posts_router
 from api.presense.router import presense_router
 from api.profile.router import profile_router
+from infrastructure.realtime.manager import connection_manager
+from infrastructure.redis_pool.pools import redis_pools
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await connection_manager.close()
+    await redis_pools.close()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 api_v1_router = APIRouter(prefix="/api/v1")
 api_v1_router.include_router(auth_router)
@@ -15,5 +27,6 @@ api_v1_router.include_router(profile_router)
 api_v1_router.include_router(posts_router)
 api_v1_router.include_router(presense_router)
 api_v1_router.include_router(chat_router)
+api_v1_router.include_router(metrics_router)
 
 app.include_router(api_v1_router)
@@ -10,7 +10,14 @@ from infrastructure.database.database import Base
 from infrastructure.database.models.users import UserModel
 from infrastructure.database.models.profile import ProfileModel
 from infrastructure.database.models.posts import PostImageModel, PostModel, PostLikeModel
-from infrastructure.database.models.chat import ChatModel, ChatParticipantModel, MessageModel
+from infrastructure.database.models.chat import (
+    ChatModel,
+    ChatParticipantModel,
+    MessageArchiveSegmentModel,
+    MessageModel,
+    MessageReactionModel,
+    MessageTombstoneModel,
+)
 from settings import settings
 
 
@@ -0,0 +1,55 @@
+"""add unread_count field in chat participant model
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 12:10:41.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, Sequence[str], None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'chat_participants',
+        sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.create_index(
+        'ix_messages_chat_id_created_at',
+        'messages',
+        ['chat_id', 'created_at'],
+        unique=False
+    )
+
+    op.execute(
+        """
+        UPDATE chat_participants AS cp
+        SET unread_count = (
+            SELECT count(m.id)
+            FROM messages AS m
+            WHERE m.chat_id = cp.chat_id
+              AND (
+                cp.last_read_message_id IS NULL
+                OR m.created_at > (
+                    SELECT lr.created_at FROM messages AS lr WHERE lr.id = cp.last_read_message_id
+                )
+              )
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_chat_id_created_at', table_name='messages')
+    op.drop_column('chat_participants', 'unread_count')
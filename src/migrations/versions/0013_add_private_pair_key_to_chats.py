@@ -0,0 +1,65 @@
+"""add private pair key to chats
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 14:02:17.384915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, Sequence[str], None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chats', sa.Column('pair_min_user_id', postgresql.UUID(), nullable=True))
+    op.add_column('chats', sa.Column('pair_max_user_id', postgresql.UUID(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE chats AS c
+        SET pair_min_user_id = p.min_user_id,
+            pair_max_user_id = p.max_user_id
+        FROM (
+            SELECT DISTINCT ON (pairs.min_user_id, pairs.max_user_id)
+                pairs.chat_id, pairs.min_user_id, pairs.max_user_id
+            FROM (
+                SELECT
+                    cp.chat_id,
+                    ch.created_at,
+                    (array_agg(cp.user_id ORDER BY cp.user_id))[1] AS min_user_id,
+                    (array_agg(cp.user_id ORDER BY cp.user_id))[2] AS max_user_id
+                FROM chat_participants AS cp
+                JOIN chats AS ch ON ch.id = cp.chat_id
+                WHERE NOT ch.is_group
+                GROUP BY cp.chat_id, ch.created_at
+                HAVING count(cp.user_id) = 2
+            ) AS pairs
+            ORDER BY pairs.min_user_id, pairs.max_user_id, pairs.created_at
+        ) AS p
+        WHERE c.id = p.chat_id
+        """
+    )
+
+    op.create_index(
+        'uq_chats_private_pair',
+        'chats',
+        ['pair_min_user_id', 'pair_max_user_id'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_chats_private_pair', table_name='chats')
+    op.drop_column('chats', 'pair_max_user_id')
+    op.drop_column('chats', 'pair_min_user_id')
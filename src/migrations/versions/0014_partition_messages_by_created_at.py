@@ -0,0 +1,116 @@
+"""partition messages by created_at month
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18 15:21:08.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, Sequence[str], None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MESSAGE_COLUMNS = "id, chat_id, sender_id, type, content, is_edited, is_deleted, created_at, edited_at"
+
+
+def _message_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('chat_id', sa.UUID(), nullable=False),
+        sa.Column('sender_id', sa.UUID(), nullable=True),
+        sa.Column(
+            'type',
+            postgresql.ENUM('SYSTEM', 'USER', name='message_type_enum', create_type=False),
+            nullable=False
+        ),
+        sa.Column('content', sa.String(), nullable=False),
+        sa.Column('is_edited', sa.Boolean(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('edited_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['chat_id'], ['chats.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['sender_id'], ['profiles.id'], ondelete='SET NULL'),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table('messages', 'messages_unpartitioned')
+    op.execute('ALTER TABLE messages_unpartitioned RENAME CONSTRAINT messages_pkey TO messages_unpartitioned_pkey')
+    op.drop_index('ix_messages_chat_id_created_at', table_name='messages_unpartitioned')
+
+    op.create_table(
+        'messages',
+        *_message_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_index(
+        'ix_messages_chat_id_created_at',
+        'messages',
+        ['chat_id', 'created_at'],
+        unique=False
+    )
+
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start timestamptz;
+            last_month timestamptz := date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                + interval '3 months';
+        BEGIN
+            SELECT coalesce(
+                date_trunc('month', min(created_at) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+            )
+            INTO month_start
+            FROM messages_unpartitioned;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF messages FOR VALUES FROM (%L) TO (%L)',
+                    'messages_' || to_char(month_start AT TIME ZONE 'UTC', '"y"YYYY"m"MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+    op.execute(f"INSERT INTO messages ({MESSAGE_COLUMNS}) SELECT {MESSAGE_COLUMNS} FROM messages_unpartitioned")
+    op.drop_table('messages_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table('messages', 'messages_partitioned')
+    op.drop_index('ix_messages_chat_id_created_at', table_name='messages_partitioned')
+    op.execute('ALTER TABLE messages_partitioned RENAME CONSTRAINT messages_pkey TO messages_partitioned_pkey')
+
+    op.create_table(
+        'messages',
+        *_message_columns(),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_messages_chat_id_created_at',
+        'messages',
+        ['chat_id', 'created_at'],
+        unique=False
+    )
+
+    op.execute(f"INSERT INTO messages ({MESSAGE_COLUMNS}) SELECT {MESSAGE_COLUMNS} FROM messages_partitioned")
+    op.drop_table('messages_partitioned')
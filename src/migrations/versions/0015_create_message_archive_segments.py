@@ -0,0 +1,45 @@
+"""create message archive segments model
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18 16:48:33.117062
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, Sequence[str], None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('message_archive_segments',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('chat_id', sa.UUID(), nullable=False),
+    sa.Column('object_key', sa.String(), nullable=False),
+    sa.Column('first_created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('message_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['chat_id'], ['chats.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_message_archive_segments_chat_id_last_created_at',
+        'message_archive_segments',
+        ['chat_id', 'last_created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_message_archive_segments_chat_id_last_created_at', table_name='message_archive_segments')
+    op.drop_table('message_archive_segments')
@@ -0,0 +1,49 @@
+"""add message reactions model and reactions aggregate in message model
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18 18:05:52.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, Sequence[str], None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'messages',
+        sa.Column('reactions', postgresql.JSONB(), server_default=sa.text("'{}'::jsonb"), nullable=False)
+    )
+    op.create_table('message_reactions',
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('message_created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('emoji', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('message_id', 'user_id', 'emoji', name='pk_message_user_emoji')
+    )
+    op.create_index(
+        'ix_message_reactions_message_created_at',
+        'message_reactions',
+        ['message_created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_message_reactions_message_created_at', table_name='message_reactions')
+    op.drop_table('message_reactions')
+    op.drop_column('messages', 'reactions')
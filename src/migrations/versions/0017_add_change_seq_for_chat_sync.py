@@ -0,0 +1,107 @@
+"""add change_seq to chats, messages and chat participants and message tombstones model
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-18 19:32:14.208571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0017'
+down_revision: Union[str, Sequence[str], None] = '0016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NEXT_CHAT_CHANGE_SEQ_FUNCTION = """
+CREATE FUNCTION next_chat_change_seq() RETURNS bigint AS $$
+BEGIN
+    IF current_setting('chat.change_seq_locked', true) IS DISTINCT FROM 'on' THEN
+        PERFORM pg_advisory_xact_lock_shared(1667785076, last_value::bit(32)::integer)
+        FROM chat_change_seq;
+        PERFORM set_config('chat.change_seq_locked', 'on', true);
+    END IF;
+    RETURN nextval('chat_change_seq');
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE SEQUENCE chat_change_seq')
+    op.execute(NEXT_CHAT_CHANGE_SEQ_FUNCTION)
+
+    for table in ('chats', 'messages', 'chat_participants'):
+        op.add_column(
+            table,
+            sa.Column('change_seq', sa.BigInteger(), server_default=sa.text('next_chat_change_seq()'), nullable=False)
+        )
+
+    op.create_index('ix_messages_chat_id_change_seq', 'messages', ['chat_id', 'change_seq'], unique=False)
+    op.create_index(
+        'ix_chat_participants_chat_id_change_seq',
+        'chat_participants',
+        ['chat_id', 'change_seq'],
+        unique=False
+    )
+
+    op.create_table('message_tombstones',
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('chat_id', sa.UUID(), nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), server_default=sa.text('next_chat_change_seq()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['chat_id'], ['chats.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('message_id')
+    )
+    op.create_index(
+        'ix_message_tombstones_chat_id_change_seq',
+        'message_tombstones',
+        ['chat_id', 'change_seq'],
+        unique=False
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_seq := next_chat_change_seq();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        'CREATE TRIGGER chats_bump_change_seq BEFORE UPDATE ON chats '
+        'FOR EACH ROW EXECUTE FUNCTION bump_change_seq()'
+    )
+    op.execute(
+        'CREATE TRIGGER messages_bump_change_seq BEFORE UPDATE ON messages '
+        'FOR EACH ROW EXECUTE FUNCTION bump_change_seq()'
+    )
+    op.execute(
+        'CREATE TRIGGER chat_participants_bump_change_seq BEFORE UPDATE ON chat_participants '
+        'FOR EACH ROW EXECUTE FUNCTION bump_change_seq()'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER chat_participants_bump_change_seq ON chat_participants')
+    op.execute('DROP TRIGGER messages_bump_change_seq ON messages')
+    op.execute('DROP TRIGGER chats_bump_change_seq ON chats')
+    op.execute('DROP FUNCTION bump_change_seq()')
+    op.drop_index('ix_message_tombstones_chat_id_change_seq', table_name='message_tombstones')
+    op.drop_table('message_tombstones')
+    op.drop_index('ix_chat_participants_chat_id_change_seq', table_name='chat_participants')
+    op.drop_index('ix_messages_chat_id_change_seq', table_name='messages')
+    op.drop_column('chat_participants', 'change_seq')
+    op.drop_column('messages', 'change_seq')
+    op.drop_column('chats', 'change_seq')
+    op.execute('DROP FUNCTION next_chat_change_seq()')
+    op.execute('DROP SEQUENCE chat_change_seq')
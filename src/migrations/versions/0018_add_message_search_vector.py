@@ -0,0 +1,51 @@
+"""add generated search vector and per-chat gin index for message search
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-18 21:12:40.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0018'
+down_revision: Union[str, Sequence[str], None] = '0017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'messages',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('russian', coalesce(content, '')) || to_tsvector('english', coalesce(content, ''))",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.create_index(
+        index_name='ix_messages_chat_id_search_vector',
+        table_name='messages',
+        columns=['chat_id', 'search_vector'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        index_name='ix_messages_chat_id_search_vector',
+        table_name='messages'
+    )
+    op.drop_column('messages', 'search_vector')
@@ -0,0 +1,68 @@
+"""create follows model and followers count for home feed
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-18 23:05:17.402913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0019'
+down_revision: Union[str, Sequence[str], None] = '0018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('follows',
+    sa.Column('follower_id', sa.UUID(), nullable=False),
+    sa.Column('followee_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['follower_id'], ['profiles.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['followee_id'], ['profiles.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('follower_id', 'followee_id', name='pk_follower_followee')
+    )
+    op.create_index(
+        'ix_follows_followee_id_follower_id',
+        'follows',
+        ['followee_id', 'follower_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_follows_followee_id_created_at_follower_id',
+        'follows',
+        ['followee_id', 'created_at', 'follower_id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_follows_follower_id_created_at_followee_id',
+        'follows',
+        ['follower_id', 'created_at', 'followee_id'],
+        unique=False
+    )
+    op.add_column(
+        'profiles',
+        sa.Column('followers_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.create_index(
+        'ix_posts_author_id_created_at',
+        'posts',
+        ['author_id', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_author_id_created_at', table_name='posts')
+    op.drop_column('profiles', 'followers_count')
+    op.drop_index('ix_follows_follower_id_created_at_followee_id', table_name='follows')
+    op.drop_index('ix_follows_followee_id_created_at_follower_id', table_name='follows')
+    op.drop_index('ix_follows_followee_id_follower_id', table_name='follows')
+    op.drop_table('follows')
@@ -0,0 +1,46 @@
+"""add denormalized likes and comments counters to posts
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-18 23:48:09.561327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0020'
+down_revision: Union[str, Sequence[str], None] = '0019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('likes_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE posts
+        SET likes_count = likes.count
+        FROM (SELECT post_id, count(*) AS count FROM post_likes GROUP BY post_id) AS likes
+        WHERE posts.id = likes.post_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE posts
+        SET comments_count = comments.count
+        FROM (SELECT post_id, count(*) AS count FROM post_comments GROUP BY post_id) AS comments
+        WHERE posts.id = comments.post_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'comments_count')
+    op.drop_column('posts', 'likes_count')
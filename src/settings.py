@@ -50,6 +50,10 @@ class RedisSettings(BaseSettings):
 
     celery_db: int
     presense_db: int
+    cache_db: int = 2
+
+    max_connections: int = 64
+    pool_timeout: float = 5.0
 
     @property
     def celery_url(self) -> str:
@@ -58,6 +62,84 @@ class RedisSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
 
+class RealtimeSettings(BaseSettings):
+    send_queue_size: int = 256
+    send_timeout: float = 5.0
+    max_presense_subscriptions: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="REALTIME_")
+
+
+class TypingSettings(BaseSettings):
+    ttl: float = 5.0
+    broadcast_interval: float = 1.0
+
+    model_config = SettingsConfigDict(env_prefix="TYPING_")
+
+
+class MembershipCacheSettings(BaseSettings):
+    local_size: int = 10_000
+    local_ttl: float = 30.0
+    redis_ttl: int = 3600
+
+    model_config = SettingsConfigDict(env_prefix="MEMBERSHIP_CACHE_")
+
+
+class ReadReceiptSettings(BaseSettings):
+    flush_interval: float = 2.0
+    flush_batch_size: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="READ_RECEIPTS_")
+
+
+class PresenseSettings(BaseSettings):
+    online_ttl: float = 60.0
+    heartbeat_window: float = 15.0
+    last_seen_retention: float = 7 * 24 * 60 * 60
+    trim_interval: float = 15.0
+    trim_batch_size: int = 1000
+    active_users_retention: int = 90 * 24 * 60 * 60
+
+    model_config = SettingsConfigDict(env_prefix="PRESENSE_")
+
+
+class LastSeenSettings(BaseSettings):
+    flush_interval: float = 30.0
+    flush_batch_size: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="LAST_SEEN_")
+
+
+class ChatArchiveSettings(BaseSettings):
+    hot_days: int = 180
+    segment_size: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="CHAT_ARCHIVE_")
+
+
+class ChatImportSettings(BaseSettings):
+    batch_size: int = 5000
+    chunk_size: int = 1024 * 1024
+    owner_ttl: int = 60 * 60 * 24
+
+    model_config = SettingsConfigDict(env_prefix="CHAT_IMPORT_")
+
+
+class FeedSettings(BaseSettings):
+    timeline_length: int = 800
+    timeline_ttl: int = 7 * 24 * 60 * 60
+    celebrity_threshold: int = 10_000
+    fan_out_batch_size: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="FEED_")
+
+
+class PostCountersSettings(BaseSettings):
+    reconcile_batch_size: int = 1000
+
+    model_config = SettingsConfigDict(env_prefix="POST_COUNTERS_")
+
+
 class EmailSettings(BaseSettings):
     host: str
     port: int
@@ -75,6 +157,16 @@ class Settings(BaseSettings):
     s3: S3Settings = Field(default_factory=S3Settings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
     email: EmailSettings = Field(default_factory=EmailSettings)
+    realtime: RealtimeSettings = Field(default_factory=RealtimeSettings)
+    typing: TypingSettings = Field(default_factory=TypingSettings)
+    membership_cache: MembershipCacheSettings = Field(default_factory=MembershipCacheSettings)
+    read_receipts: ReadReceiptSettings = Field(default_factory=ReadReceiptSettings)
+    presense: PresenseSettings = Field(default_factory=PresenseSettings)
+    last_seen: LastSeenSettings = Field(default_factory=LastSeenSettings)
+    chat_archive: ChatArchiveSettings = Field(default_factory=ChatArchiveSettings)
+    chat_import: ChatImportSettings = Field(default_factory=ChatImportSettings)
+    feed: FeedSettings = Field(default_factory=FeedSettings)
+    post_counters: PostCountersSettings = Field(default_factory=PostCountersSettings)
 
 
 settings = Settings()
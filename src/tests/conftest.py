@@ -1,8 +1,10 @@
 import asyncio
 import io
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Generator
 from contextlib import asynccontextmanager
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from unittest.mock import MagicMock, patch
 from uuid import UUID
 
 import bcrypt
@@ -12,17 +14,59 @@ from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.auth.services import AuthService, get_auth_service
-from core.posts.services import PostService, get_post_service
+from core.chat.services import ChatImportService, ChatService, MessagePartitionService
+from core.feed.services import FeedService, get_feed_service
+from core.posts.services.comment import CommentService, get_comment_service
+from core.posts.services.post import PostService, get_post_service
 from core.profile.services import ProfileService, get_profile_service
+from infrastructure.chat.archive import MessageArchive
+from infrastructure.chat.imports import ImportOwnerRepository
+from infrastructure.chat.inbox import InboxRepository
+from infrastructure.chat.membership import membership_cache
+from infrastructure.chat.read_receipts import ReadReceiptBuffer
+from infrastructure.chat.typing import TypingIndicators
 from infrastructure.database.models.posts import PostModel
 from infrastructure.database.models.profile import ProfileModel
 from infrastructure.database.models.users import UserModel
 from infrastructure.media.images.processor import ImageProcessor
+from infrastructure.realtime.publisher import RealtimePublisher
+from infrastructure.redis_pool.pools import redis_pools
 from infrastructure.s3.storage import S3Storage
 from main import app
 from settings import settings
 
 
+class FakeHomeTimelines:
+    def __init__(self) -> None:
+        self.timelines: dict[UUID, dict[UUID, datetime]] = {}
+
+    async def read(self, user_id: UUID, before: datetime | None, limit: int) -> list[tuple[UUID, datetime]] | None:
+        timeline = self.timelines.get(user_id)
+        if timeline is None:
+            return None
+        entries = sorted(timeline.items(), key=itemgetter(1), reverse=True)
+        return [entry for entry in entries if before is None or entry[1] < before][:limit]
+
+    async def reserve(self, user_id: UUID) -> set[UUID]:
+        return set(self.timelines.setdefault(user_id, {}))
+
+    async def merge(self, user_id: UUID, entries: list[tuple[UUID, datetime]], previous: set[UUID]) -> None:
+        timeline = self.timelines.setdefault(user_id, {})
+        for post_id in previous.difference(post_id for post_id, _ in entries):
+            timeline.pop(post_id, None)
+        timeline.update(entries)
+
+    async def push(self, post_id: UUID, created_at: datetime, user_ids: list[UUID]) -> None:
+        for user_id in user_ids:
+            if user_id in self.timelines:
+                self.timelines[user_id][post_id] = created_at
+
+    async def remove(self, post_ids: list[UUID], user_ids: list[UUID]) -> None:
+        for user_id in user_ids:
+            for post_id in post_ids:
+                self.timelines.get(user_id, {}).pop(post_id, None)
+
+
 class TestUnitOfWork:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -82,9 +126,24 @@ def s3_avatars() -> S3Storage:
     )
 
 
+@pytest.fixture(scope="session")
+def s3_chat_imports() -> S3Storage:
+    return S3Storage(
+        access_key=settings.s3.access_key,
+        secret_key=settings.s3.secret_key.get_secret_value(),
+        bucket_name="testchatimports",
+        internal_endpoint_url=settings.s3.internal_endpoint,
+        public_endpoint_url=settings.s3.public_endpoint
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
-async def create_test_buckets(s3_posts: S3Storage, s3_avatars: S3Storage) -> AsyncGenerator[None]:
-    for s3 in (s3_posts, s3_avatars):
+async def create_test_buckets(
+    s3_posts: S3Storage,
+    s3_avatars: S3Storage,
+    s3_chat_imports: S3Storage
+) -> AsyncGenerator[None]:
+    for s3 in (s3_posts, s3_avatars, s3_chat_imports):
         async with s3.get_internal_client() as client:
             try:
                 await client.create_bucket(Bucket=s3.bucket_name)
@@ -93,7 +152,7 @@ async def create_test_buckets(s3_posts: S3Storage, s3_avatars: S3Storage) -> Asy
 
     yield
 
-    for s3 in (s3_posts, s3_avatars):
+    for s3 in (s3_posts, s3_avatars, s3_chat_imports):
         async with s3.get_internal_client() as client:
             response = await client.list_objects_v2(Bucket=s3.bucket_name)
             delete_tasks = [
@@ -104,6 +163,29 @@ async def create_test_buckets(s3_posts: S3Storage, s3_avatars: S3Storage) -> Asy
             await client.delete_bucket(Bucket=s3.bucket_name)
 
 
+@pytest.fixture(autouse=True)
+def feed_tasks() -> Generator[dict[str, MagicMock]]:
+    with (
+        patch("core.feed.tasks.fan_out_post.delay") as fan_out_post,
+        patch("core.feed.tasks.remove_post_from_feeds.delay") as remove_post_from_feeds,
+        patch("core.feed.tasks.rebuild_feed_timeline.delay") as rebuild_feed_timeline
+    ):
+        yield {
+            "fan_out_post": fan_out_post,
+            "remove_post_from_feeds": remove_post_from_feeds,
+            "rebuild_feed_timeline": rebuild_feed_timeline
+        }
+
+
+@pytest.fixture
+async def redis_cleanup() -> AsyncGenerator[None]:
+    yield
+
+    for name in ("presense", "cache"):
+        await redis_pools.client(name).flushdb()
+    await redis_pools.close()
+
+
 @pytest.fixture
 def test_auth_service(db_session: AsyncSession) -> AuthService:
     uow = TestUnitOfWork(db_session)
@@ -122,15 +204,71 @@ def test_post_service(db_session: AsyncSession, s3_posts: S3Storage) -> PostServ
     return PostService(uow=uow, s3_storage=s3_posts, image_processor=ImageProcessor())
 
 
+@pytest.fixture
+def test_comment_service(db_session: AsyncSession) -> CommentService:
+    uow = TestUnitOfWork(db_session)
+    return CommentService(uow=uow)
+
+
+@pytest.fixture
+def test_chat_service(db_session: AsyncSession, s3_chat_imports: S3Storage, redis_cleanup: None) -> ChatService:
+    uow = TestUnitOfWork(db_session)
+    return ChatService(
+        uow=uow,
+        publisher=RealtimePublisher(),
+        inbox=InboxRepository(),
+        membership=membership_cache,
+        read_receipts=ReadReceiptBuffer(),
+        archive=MessageArchive(s3_chat_imports),
+        typing=TypingIndicators(settings.typing.ttl, settings.typing.broadcast_interval)
+    )
+
+
+@pytest.fixture
+def test_chat_import_service(
+    db_session: AsyncSession,
+    s3_chat_imports: S3Storage,
+    redis_cleanup: None
+) -> ChatImportService:
+    uow = TestUnitOfWork(db_session)
+    return ChatImportService(
+        uow=uow,
+        storage=s3_chat_imports,
+        inbox=InboxRepository(),
+        membership=membership_cache,
+        partitions=MessagePartitionService(uow=uow),
+        owners=ImportOwnerRepository(settings.chat_import.owner_ttl),
+        batch_size=2,
+        chunk_size=64
+    )
+
+
+@pytest.fixture
+def test_feed_service(db_session: AsyncSession, s3_posts: S3Storage) -> FeedService:
+    uow = TestUnitOfWork(db_session)
+    return FeedService(
+        uow=uow,
+        timelines=FakeHomeTimelines(),
+        s3_storage=s3_posts,
+        celebrity_threshold=2,
+        timeline_length=100,
+        fan_out_batch_size=100
+    )
+
+
 @pytest.fixture
 async def client(
     test_auth_service: AuthService,
     test_profile_service: ProfileService,
     test_post_service: PostService,
+    test_comment_service: CommentService,
+    test_feed_service: FeedService,
 ) -> AsyncGenerator[AsyncClient]:
     app.dependency_overrides[get_auth_service] = lambda: test_auth_service
     app.dependency_overrides[get_profile_service] = lambda: test_profile_service
     app.dependency_overrides[get_post_service] = lambda: test_post_service
+    app.dependency_overrides[get_comment_service] = lambda: test_comment_service
+    app.dependency_overrides[get_feed_service] = lambda: test_feed_service
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -269,6 +407,16 @@ async def test_profile(test_user: UserModel, profile_factory: Callable[..., Prof
     return await profile_factory(test_user.id)
 
 
+@pytest.fixture
+async def other_user(user_factory: Callable[..., UserModel]) -> UserModel:
+    return await user_factory(email="other@example.com")
+
+
+@pytest.fixture
+async def other_profile(other_user: UserModel, profile_factory: Callable[..., ProfileModel]) -> ProfileModel:
+    return await profile_factory(user_id=other_user.id, username="other")
+
+
 @pytest.fixture
 def auth_header(test_user: UserModel, auth_header_factory: Callable[[UserModel], dict[str, str]]) -> dict[str, str]:
     return auth_header_factory(test_user)
@@ -0,0 +1,389 @@
+import io
+import json
+from collections.abc import Callable
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient, Response
+
+from core.chat.services import ChatImportService, ChatService, get_chat_import_service, get_chat_service
+from infrastructure.database.models.profile import ProfileModel
+from infrastructure.database.models.users import UserModel
+from infrastructure.s3.storage import S3Storage
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def chat_services(test_chat_service: ChatService, test_chat_import_service: ChatImportService) -> None:
+    app.dependency_overrides[get_chat_service] = lambda: test_chat_service
+    app.dependency_overrides[get_chat_import_service] = lambda: test_chat_import_service
+
+
+@pytest.fixture
+async def chat_id(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str]
+) -> str:
+    response: Response = await client.post(
+        "/api/v1/chat/",
+        json={"is_group": False, "name": None, "users_ids": [str(other_profile.id)]},
+        headers=auth_header
+    )
+    return response.json()["id"]
+
+
+@pytest.fixture
+def other_auth_header(other_user: UserModel, auth_header_factory: Callable) -> dict[str, str]:
+    return auth_header_factory(other_user)
+
+
+async def send(client: AsyncClient, chat_id: str, content: str, headers: dict[str, str]) -> dict:
+    response: Response = await client.post(
+        "/api/v1/chat/message",
+        json={"chat_id": chat_id, "content": content},
+        headers=headers
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    return response.json()
+
+
+async def get_chat(client: AsyncClient, chat_id: str, headers: dict[str, str]) -> dict:
+    response: Response = await client.get("/api/v1/chat/", headers=headers)
+    return next(chat for chat in response.json()["chats"] if chat["id"] == chat_id)
+
+
+async def get_history(client: AsyncClient, chat_id: str, headers: dict[str, str], **params) -> dict:
+    response: Response = await client.get(f"/api/v1/chat/{chat_id}", params=params, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_send_message_increments_unread_count(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    await send(client, chat_id, "first", auth_header)
+    last = await send(client, chat_id, "second", auth_header)
+
+    chat = await get_chat(client, chat_id, other_auth_header)
+    assert chat["unread_count"] == 2
+    assert chat["last_message"]["id"] == last["id"]
+
+    chat = await get_chat(client, chat_id, auth_header)
+    assert chat["unread_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_send_messages_batch_is_ordered_after_single_send(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    single = await send(client, chat_id, "single", auth_header)
+    response: Response = await client.post(
+        "/api/v1/chat/message/batch",
+        json={"messages": [{"chat_id": chat_id, "content": "batch 1"}, {"chat_id": chat_id, "content": "batch 2"}]},
+        headers=auth_header
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    batch = response.json()
+    created_at = [datetime.fromisoformat(message["created_at"]) for message in (single, *batch)]
+    assert created_at == sorted(created_at)
+
+    history = await get_history(client, chat_id, auth_header, around_last_read=False)
+    assert [message["content"] for message in history["messages"]] == ["batch 2", "batch 1", "single"]
+
+    chat = await get_chat(client, chat_id, other_auth_header)
+    assert chat["unread_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_read_receipts_keep_latest_message(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str],
+    test_chat_service: ChatService
+):
+    messages = [await send(client, chat_id, f"message {index}", auth_header) for index in range(3)]
+
+    await client.patch(f"/api/v1/chat/{chat_id}/{messages[2]['id']}/read", headers=other_auth_header)
+    await client.patch(f"/api/v1/chat/{chat_id}/{messages[0]['id']}/read", headers=other_auth_header)
+    assert await test_chat_service.flush_read_receipts() == 1
+
+    chat = await get_chat(client, chat_id, other_auth_header)
+    assert chat["unread_count"] == 0
+    history = await get_history(client, chat_id, other_auth_header)
+    assert history["last_read_message_id"] == messages[2]["id"]
+
+    await client.patch(f"/api/v1/chat/{chat_id}/{messages[1]['id']}/read", headers=other_auth_header)
+    await test_chat_service.flush_read_receipts()
+
+    history = await get_history(client, chat_id, other_auth_header)
+    assert history["last_read_message_id"] == messages[2]["id"]
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_changes_after_watermark(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str],
+    test_chat_service: ChatService
+):
+    first = await send(client, chat_id, "first", auth_header)
+
+    response: Response = await client.get("/api/v1/chat/sync", params={"since": 0}, headers=other_auth_header)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [chat["id"] for chat in data["chats"]] == [chat_id]
+    assert [change["message"]["id"] for change in data["messages"]] == [first["id"]]
+    assert data["has_more"] is False
+    watermark = data["watermark"]
+
+    second = await send(client, chat_id, "second", auth_header)
+    response = await client.get("/api/v1/chat/sync", params={"since": watermark}, headers=other_auth_header)
+
+    data = response.json()
+    assert [change["message"]["id"] for change in data["messages"]] == [second["id"]]
+    assert data["watermark"] > watermark
+    watermark = data["watermark"]
+
+    await client.patch(f"/api/v1/chat/{chat_id}/{second['id']}/read", headers=other_auth_header)
+    await test_chat_service.flush_read_receipts()
+    response = await client.get("/api/v1/chat/sync", params={"since": watermark}, headers=other_auth_header)
+
+    data = response.json()
+    assert data["messages"] == []
+    assert [
+        (read_state["chat_id"], read_state["last_read_message_id"], read_state["unread_count"])
+        for read_state in data["read_states"]
+    ] == [(chat_id, second["id"], 0)]
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_with_limit(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    messages = [await send(client, chat_id, f"message {index}", auth_header) for index in range(3)]
+
+    response: Response = await client.get(
+        "/api/v1/chat/sync",
+        params={"since": 0, "limit": 2},
+        headers=other_auth_header
+    )
+
+    data = response.json()
+    assert data["has_more"] is True
+    synced = [change["message"]["id"] for change in data["messages"]]
+
+    response = await client.get(
+        "/api/v1/chat/sync",
+        params={"since": data["watermark"], "limit": 2},
+        headers=other_auth_header
+    )
+
+    data = response.json()
+    synced += [change["message"]["id"] for change in data["messages"]]
+    assert synced == [message["id"] for message in messages]
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_reaction(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    message = await send(client, chat_id, "react to me", auth_header)
+    reaction_url = f"/api/v1/chat/message/{message['id']}/reactions/👍"
+
+    response: Response = await client.put(reaction_url, headers=other_auth_header)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    await client.put(reaction_url, headers=other_auth_header)
+
+    history = await get_history(client, chat_id, auth_header, around_last_read=False)
+    assert history["messages"][0]["reactions"] == [{"emoji": "👍", "count": 1, "is_mine": False}]
+    history = await get_history(client, chat_id, other_auth_header, around_last_read=False)
+    assert history["messages"][0]["reactions"] == [{"emoji": "👍", "count": 1, "is_mine": True}]
+
+    response = await client.delete(reaction_url, headers=other_auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    history = await get_history(client, chat_id, auth_header, around_last_read=False)
+    assert history["messages"][0]["reactions"] == []
+
+
+@pytest.mark.asyncio
+async def test_delete_message_with_reactions(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    message = await send(client, chat_id, "short-lived", auth_header)
+    await client.put(f"/api/v1/chat/message/{message['id']}/reactions/👍", headers=other_auth_header)
+
+    response: Response = await client.delete(f"/api/v1/chat/message/{message['id']}/all", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    history = await get_history(client, chat_id, auth_header, around_last_read=False)
+    assert history["messages"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_messages_escapes_snippet(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str]
+):
+    message = await send(client, chat_id, "<b>hello</b> world", auth_header)
+    await send(client, chat_id, "unrelated", auth_header)
+
+    response: Response = await client.get(f"/api/v1/chat/{chat_id}/search", params={"q": "hello"}, headers=auth_header)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [result["message"]["id"] for result in data["results"]] == [message["id"]]
+    snippet = data["results"][0]["snippet"]
+    assert "<mark>hello</mark>" in snippet
+    assert "<b>" not in snippet
+    assert "&lt;b&gt;" in snippet
+
+
+@pytest.mark.asyncio
+async def test_get_chat_history_opens_around_last_read(
+    client: AsyncClient,
+    chat_id: str,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str],
+    test_chat_service: ChatService
+):
+    messages = [await send(client, chat_id, f"message {index}", auth_header) for index in range(5)]
+    await client.patch(f"/api/v1/chat/{chat_id}/{messages[1]['id']}/read", headers=other_auth_header)
+    await test_chat_service.flush_read_receipts()
+
+    history = await get_history(client, chat_id, other_auth_header, limit=2)
+
+    assert history["last_read_message_id"] == messages[1]["id"]
+    assert [message["id"] for message in history["messages"]] == [messages[2]["id"], messages[1]["id"]]
+    assert history["has_prev"] is True
+    assert history["has_next"] is True
+
+    history = await get_history(client, chat_id, other_auth_header, limit=2, around_last_read=False)
+
+    assert [message["id"] for message in history["messages"]] == [messages[4]["id"], messages[3]["id"]]
+
+
+TELEGRAM_EXPORT = {
+    "name": "Alice",
+    "type": "personal_chat",
+    "id": 1,
+    "messages": [
+        {
+            "id": 1,
+            "type": "message",
+            "date": "2020-01-05T10:00:00",
+            "from": "Me",
+            "from_id": "user1",
+            "text": "hello"
+        },
+        {
+            "id": 2,
+            "type": "service",
+            "date": "2020-01-05T10:01:00",
+            "action": "phone_call",
+            "text": ""
+        },
+        {
+            "id": 3,
+            "type": "message",
+            "date": "2020-01-05T10:02:00",
+            "from": "Alice",
+            "from_id": "user2",
+            "text": [{"type": "bold", "text": "hi"}, " there"]
+        },
+        {
+            "id": 4,
+            "type": "message",
+            "date": "2020-02-01T09:00:00",
+            "edited": "2020-02-01T09:05:00",
+            "from": "Me",
+            "from_id": "user1",
+            "text": "bye"
+        }
+    ]
+}
+
+
+@pytest.mark.asyncio
+async def test_import_chat_history(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    auth_header: dict[str, str],
+    test_chat_import_service: ChatImportService,
+    s3_chat_imports: S3Storage
+):
+    object_key = f"{test_profile.id}/export.json"
+    await s3_chat_imports.upload(object_key, io.BytesIO(json.dumps(TELEGRAM_EXPORT).encode()), "application/json")
+    on_progress = MagicMock()
+
+    progress = await test_chat_import_service.import_chat_history(test_profile.id, object_key, "user1", on_progress)
+
+    assert progress.imported_messages == 3
+    assert progress.skipped_messages == 1
+    assert progress.chat_id is not None
+    on_progress.assert_called_once()
+
+    history = await get_history(client, str(progress.chat_id), auth_header)
+    assert [(message["type"], message["content"]) for message in history["messages"]] == [
+        ("User", "bye"),
+        ("System", "Alice: hi there"),
+        ("User", "hello")
+    ]
+    assert history["messages"][0]["is_edited"] is True
+    assert history["last_read_message_id"] == history["messages"][0]["id"]
+
+
+@pytest.mark.asyncio
+async def test_import_status_is_visible_only_to_owner(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    other_auth_header: dict[str, str]
+):
+    with patch("core.chat.services.celery.send_task") as send_task:
+        response: Response = await client.post(
+            "/api/v1/chat/import",
+            data={"own_sender_id": "user1"},
+            files={"file": ("export.json", json.dumps(TELEGRAM_EXPORT).encode(), "application/json")},
+            headers=auth_header
+        )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    task_id = response.json()["task_id"]
+    assert send_task.call_args.kwargs["task_id"] == task_id
+    user_id, _, own_sender_id = send_task.call_args.kwargs["args"]
+    assert (UUID(user_id), own_sender_id) == (test_profile.id, "user1")
+
+    response = await client.get(f"/api/v1/chat/import/{task_id}", headers=other_auth_header)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+    response = await client.get(f"/api/v1/chat/import/{task_id}", headers=auth_header)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["state"] == "PENDING"
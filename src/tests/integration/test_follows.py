@@ -0,0 +1,254 @@
+from collections.abc import Callable
+from http import HTTPStatus
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient, Response
+
+from infrastructure.database.models.posts import PostModel
+from infrastructure.database.models.profile import ProfileModel
+from infrastructure.database.models.users import UserModel
+
+
+@pytest.mark.asyncio
+async def test_follow_profile(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    feed_tasks: dict[str, MagicMock]
+):
+    response: Response = await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    feed_tasks["rebuild_feed_timeline"].assert_called_once_with(str(test_profile.id))
+
+    response = await client.get(f"/api/v1/user/profile/{other_profile.username}", headers=auth_header)
+    assert response.json()["followers_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_follow_profile_idempotent(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    feed_tasks: dict[str, MagicMock]
+):
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+    response: Response = await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    feed_tasks["rebuild_feed_timeline"].assert_called_once()
+
+    response = await client.get(f"/api/v1/user/profile/{other_profile.username}", headers=auth_header)
+    assert response.json()["followers_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_follow_self(client: AsyncClient, test_profile: ProfileModel, auth_header: dict[str, str]):
+    response: Response = await client.post(f"/api/v1/user/profile/{test_profile.id}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_follow_profile_not_found(client: AsyncClient, test_profile: ProfileModel, auth_header: dict[str, str]):
+    response: Response = await client.post(f"/api/v1/user/profile/{uuid4()}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_follow_profile_unauthorized(client: AsyncClient, other_profile: ProfileModel):
+    response: Response = await client.post(f"/api/v1/user/profile/{other_profile.id}/follow")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_unfollow_profile(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    feed_tasks: dict[str, MagicMock]
+):
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+    response: Response = await client.delete(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert feed_tasks["rebuild_feed_timeline"].call_count == 2
+
+    response = await client.get(f"/api/v1/user/profile/{other_profile.username}", headers=auth_header)
+    assert response.json()["followers_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unfollow_not_followed_profile(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    feed_tasks: dict[str, MagicMock]
+):
+    response: Response = await client.delete(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    feed_tasks["rebuild_feed_timeline"].assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_followers(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str]
+):
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    response: Response = await client.get(f"/api/v1/user/profile/{other_profile.id}/followers", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [profile["id"] for profile in data["profiles"]] == [str(test_profile.id)]
+    assert data["has_next"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_following(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str]
+):
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+
+    response: Response = await client.get(f"/api/v1/user/profile/{test_profile.id}/following", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.OK
+    assert [profile["id"] for profile in response.json()["profiles"]] == [str(other_profile.id)]
+
+
+@pytest.mark.asyncio
+async def test_get_followers_pagination(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    auth_header_factory: Callable,
+    user_factory: Callable,
+    profile_factory: Callable
+):
+    for index in range(3):
+        user: UserModel = await user_factory(email=f"follower{index}@example.com")
+        await profile_factory(user_id=user.id, username=f"follower{index}")
+        await client.post(f"/api/v1/user/profile/{test_profile.id}/follow", headers=auth_header_factory(user))
+
+    response: Response = await client.get(
+        f"/api/v1/user/profile/{test_profile.id}/followers",
+        params={"limit": 2},
+        headers=auth_header_factory(user)
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert len(data["profiles"]) == 2
+    assert data["has_next"] is True
+    assert data["next_cursor"] is not None
+    assert data["next_cursor_id"] == data["profiles"][-1]["id"]
+
+    response = await client.get(
+        f"/api/v1/user/profile/{test_profile.id}/followers",
+        params={"limit": 2, "cursor": data["next_cursor"], "cursor_id": data["next_cursor_id"]},
+        headers=auth_header_factory(user)
+    )
+
+    next_page = response.json()
+    assert len(next_page["profiles"]) == 1
+    assert next_page["has_next"] is False
+    assert next_page["profiles"][0]["id"] not in [profile["id"] for profile in data["profiles"]]
+
+
+@pytest.mark.asyncio
+async def test_get_followers_not_found(client: AsyncClient, test_profile: ProfileModel, auth_header: dict[str, str]):
+    response: Response = await client.get(f"/api/v1/user/profile/{uuid4()}/followers", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_create_post_schedules_fan_out(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    auth_header: dict[str, str],
+    feed_tasks: dict[str, MagicMock]
+):
+    response: Response = await client.post("/api/v1/posts/", data={"content": "Hello"}, headers=auth_header)
+
+    assert response.status_code == HTTPStatus.CREATED
+    feed_tasks["fan_out_post"].assert_called_once_with(response.json()["id"])
+
+
+@pytest.mark.asyncio
+async def test_get_feed_merges_timeline_and_celebrity_posts(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    auth_header_factory: Callable,
+    user_factory: Callable,
+    profile_factory: Callable,
+    post_factory: Callable
+):
+    celebrity_user: UserModel = await user_factory(email="celebrity@example.com")
+    celebrity: ProfileModel = await profile_factory(user_id=celebrity_user.id, username="celebrity")
+    fan_user: UserModel = await user_factory(email="fan@example.com")
+    await profile_factory(user_id=fan_user.id, username="fan")
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+    await client.post(f"/api/v1/user/profile/{celebrity.id}/follow", headers=auth_header)
+    await client.post(f"/api/v1/user/profile/{celebrity.id}/follow", headers=auth_header_factory(fan_user))
+
+    oldest: PostModel = await post_factory(author_id=other_profile.id, content="oldest")
+    pulled: PostModel = await post_factory(author_id=celebrity.id, content="pulled")
+    newest: PostModel = await post_factory(author_id=other_profile.id, content="newest")
+
+    response: Response = await client.get("/api/v1/posts/feed", headers=auth_header)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [post["id"] for post in data["posts"]] == [str(newest.id), str(pulled.id), str(oldest.id)]
+    assert [post["content"] for post in data["posts"]] == ["newest", "pulled", "oldest"]
+    assert [post["author_id"] for post in data["posts"]] == [
+        str(other_profile.id),
+        str(celebrity.id),
+        str(other_profile.id)
+    ]
+    assert data["has_next"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_feed_pagination(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    other_profile: ProfileModel,
+    auth_header: dict[str, str],
+    post_factory: Callable
+):
+    await client.post(f"/api/v1/user/profile/{other_profile.id}/follow", headers=auth_header)
+    posts: list[PostModel] = [await post_factory(author_id=other_profile.id) for _ in range(3)]
+
+    response: Response = await client.get("/api/v1/posts/feed", params={"limit": 2}, headers=auth_header)
+
+    data = response.json()
+    assert [post["id"] for post in data["posts"]] == [str(posts[2].id), str(posts[1].id)]
+    assert data["has_next"] is True
+
+    response = await client.get(
+        "/api/v1/posts/feed",
+        params={"limit": 2, "cursor": data["next_cursor"]},
+        headers=auth_header
+    )
+
+    data = response.json()
+    assert [post["id"] for post in data["posts"]] == [str(posts[0].id)]
+    assert data["has_next"] is False
@@ -5,7 +5,10 @@ from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.posts.services.post import PostService
 from infrastructure.database.models.posts import PostModel
 from infrastructure.database.models.profile import ProfileModel
 from infrastructure.database.models.users import UserModel
@@ -758,3 +761,118 @@ async def test_get_user_images_nonexistent_profile(
 
     assert response.status_code == HTTPStatus.OK
     assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_likes_count_after_like(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    auth_header: dict[str, str]
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    await client.post(f"/api/v1/posts/{post.id}/like", headers=auth_header)
+
+    response: Response = await client.get(f"/api/v1/posts/{post.id}", headers=auth_header)
+
+    assert response.json()["likes_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_likes_count_after_repeated_like(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    auth_header: dict[str, str]
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    await client.post(f"/api/v1/posts/{post.id}/like", headers=auth_header)
+    await client.post(f"/api/v1/posts/{post.id}/like", headers=auth_header)
+
+    response: Response = await client.get(f"/api/v1/posts/{post.id}", headers=auth_header)
+
+    assert response.json()["likes_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_likes_count_after_remove_without_like(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    auth_header: dict[str, str]
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    await client.delete(f"/api/v1/posts/{post.id}/like", headers=auth_header)
+
+    response: Response = await client.get(f"/api/v1/posts/{post.id}", headers=auth_header)
+
+    assert response.json()["likes_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_comments_count_after_comment(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    auth_header: dict[str, str]
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    await client.post(
+        f"/api/v1/posts/{post.id}/comments",
+        json={"parent_id": None, "text": "First"},
+        headers=auth_header
+    )
+
+    response: Response = await client.get("/api/v1/posts/me", headers=auth_header)
+
+    assert response.json()["posts"][0]["comments_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_comments_count_after_thread_delete(
+    client: AsyncClient,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    auth_header: dict[str, str]
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    root = await client.post(
+        f"/api/v1/posts/{post.id}/comments",
+        json={"parent_id": None, "text": "Root"},
+        headers=auth_header
+    )
+    await client.post(
+        f"/api/v1/posts/{post.id}/comments",
+        json={"parent_id": root.json()["id"], "text": "Reply"},
+        headers=auth_header
+    )
+
+    response: Response = await client.delete(f"/api/v1/posts/comments/{root.json()['id']}", headers=auth_header)
+    assert response.status_code == http.HTTPStatus.NO_CONTENT
+
+    response = await client.get(f"/api/v1/posts/{post.id}", headers=auth_header)
+    assert response.json()["comments_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_post_counters(
+    db_session: AsyncSession,
+    test_profile: ProfileModel,
+    post_factory: Callable,
+    test_post_service: PostService
+):
+    post: PostModel = await post_factory(author_id=test_profile.id)
+    await db_session.execute(
+        update(PostModel)
+        .where(PostModel.id == post.id)
+        .values(likes_count=5, comments_count=3)
+        .execution_options(synchronize_session=False)
+    )
+    await db_session.commit()
+
+    reconciled = await test_post_service.reconcile_counters(batch_size=1)
+    await db_session.refresh(post)
+
+    assert reconciled == 1
+    assert post.likes_count == 0
+    assert post.comments_count == 0